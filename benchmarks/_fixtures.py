@@ -0,0 +1,49 @@
+"""Battles that never end on their own, so benchmarks can play as many turns as they need"""
+from typing import Callable
+
+from domain import EventDispatcher
+from domain.battle import Battle, IBattle
+from domain.battle.value_objects import BattleAllies, IMoveBuilder, PassTurnAlgorithmEnum, Team
+from domain.character import Character, ICharacter
+from domain.skill.combat_technique import CombatTechnique
+from domain.value_objects import EntityID
+
+ENDLESS_LIFE_POINTS = 10**12
+
+
+def endless_character(name: str) -> ICharacter:
+    combat_technique = CombatTechnique.create_new(entity_id=EntityID(), name=f"{name} punch")
+    return (
+        Character.create_new(entity_id=EntityID(), name=name)
+        .specify_skill_properties(life_points=ENDLESS_LIFE_POINTS, stamina_points=100, mana_points=100)
+        .add_skills(combat_technique.specify_combat_technique_properties(stamina_cost=0, damage=1, cooldown=0))
+    )
+
+
+def endless_duel(event_dispatcher: EventDispatcher) -> tuple[IBattle, ICharacter, ICharacter]:
+    first_character = endless_character("First")
+    second_character = endless_character("Second")
+    battle = (
+        Battle.create_new(event_dispatcher=event_dispatcher, entity_id=EntityID(), is_battle_ongoing=False)
+        .add_battle_allies(
+            BattleAllies.create_new().add_team(Team.create_new().add_character(first_character).build()).build()
+        )
+        .add_battle_allies(
+            BattleAllies.create_new().add_team(Team.create_new().add_character(second_character).build()).build()
+        )
+        .specify_pass_turn_algorithm(PassTurnAlgorithmEnum.REGULAR_PASS_TURN)
+    )
+    return battle, first_character, second_character
+
+
+def punch(attacker: ICharacter, target: ICharacter) -> Callable[[IMoveBuilder], None]:
+    combat_technique = next(attacker.available_combat_techniques)
+
+    def move(move_builder: IMoveBuilder) -> None:
+        move_builder.attack(target.entity_id, combat_technique)
+
+    return move
+
+
+def report(title: str, operations: int, seconds: float, unit: str) -> None:
+    print(f"{title:<40} {operations / seconds:>14,.0f} {unit}/sec  ({operations} in {seconds:.3f}s)")
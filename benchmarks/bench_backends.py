@@ -0,0 +1,51 @@
+"""Measures the latency of Battle.play under every available anyio backend
+
+    python -m benchmarks.bench_backends
+"""
+import statistics
+import time
+from typing import Any
+
+import anyio
+
+from domain.battle_event_dispatcher import BattleEventDispatcher
+
+from ._fixtures import endless_duel, punch
+
+TURNS = 5_000
+
+
+async def play_latencies(turns: int) -> list[float]:
+    battle, first_character, second_character = endless_duel(BattleEventDispatcher())
+    moves = (punch(first_character, second_character), punch(second_character, first_character))
+    latencies = []
+    for turn in range(turns):
+        start = time.perf_counter()
+        await battle.play(moves[turn % 2])
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def available_backends() -> dict[str, dict[str, Any]]:
+    backends: dict[str, dict[str, Any]] = {"trio": {}, "asyncio": {}}
+    try:
+        import uvloop  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return backends
+    backends["asyncio+uvloop"] = {"loop_factory": uvloop.new_event_loop}
+    return backends
+
+
+def main() -> None:
+    for backend_name, backend_options in available_backends().items():
+        backend = backend_name.split("+", maxsplit=1)[0]
+        latencies = anyio.run(play_latencies, TURNS, backend=backend, backend_options=backend_options)
+        quantiles = statistics.quantiles(latencies, n=100)
+        print(
+            f"Battle.play on {backend_name:<16} p50={quantiles[49] * 1e6:>8.1f}us "
+            f"p99={quantiles[98] * 1e6:>8.1f}us  mean={statistics.fmean(latencies) * 1e6:>8.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
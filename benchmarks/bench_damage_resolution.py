@@ -0,0 +1,48 @@
+"""Measures how many attacks per second are resolved with and without the compiled damage modifier table
+
+    python -m benchmarks.bench_damage_resolution
+"""
+import time
+
+from domain.character import ICharacter
+from domain.damage_modifiers import DamageModifiers, DamageTable
+from domain.skill import ElementEnum
+
+from ._fixtures import endless_character, report
+
+ATTACKS = 200_000
+
+
+def attacks(attacker: ICharacter, defender: ICharacter, damage_table: DamageTable | None) -> float:
+    combat_technique = next(attacker.available_combat_techniques)
+    start = time.perf_counter()
+    for _ in range(ATTACKS):
+        attacker.attack(combat_technique.entity_id, defender, damage_table)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    attacker, defender = endless_character("Attacker"), endless_character("Defender")
+    damage_table = (
+        DamageModifiers()
+        .affinity_bonus(1.5)
+        .resistance(ElementEnum.FIRE, ElementEnum.WATER, 0.5)
+        .resistance(ElementEnum.WATER, ElementEnum.FIRE, 2)
+        .critical(chance=0.1, multiplier=2)
+        .compile(seed=0)
+    )
+    damage_table_without_critical = (
+        DamageModifiers()
+        .affinity_bonus(1.5)
+        .resistance(ElementEnum.FIRE, ElementEnum.WATER, 0.5)
+        .resistance(ElementEnum.WATER, ElementEnum.FIRE, 2)
+        .compile(seed=0)
+    )
+    report("Attacks with the raw skill damage", ATTACKS, attacks(attacker, defender, None), "attacks")
+    report("Attacks resolved through the table", ATTACKS, attacks(attacker, defender, damage_table), "attacks")
+    without_critical_seconds = attacks(attacker, defender, damage_table_without_critical)
+    report("Attacks through the table, no critical", ATTACKS, without_critical_seconds, "attacks")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compares one shared Battle Event Dispatcher with the partitioned Event Bus serving many Battles
+
+    python -m benchmarks.bench_event_bus
+"""
+import time
+
+import anyio
+
+from domain import EventDispatcher, EventHandler
+from domain.battle.events import CharacterLostBattleEvent, CharacterWonBattleEvent
+from domain.battle_event_dispatcher import BattleEventDispatcher
+from domain.event_handler_registry import EventHandlerRegistry
+from domain.partitioned_event_bus import PartitionedEventBus
+from domain.value_objects import EntityID
+
+from ._fixtures import report
+
+BATTLES = 2_000
+BURST = 20
+
+
+class _NoopEventHandler(EventHandler):
+    async def handle(self) -> None:
+        ...
+
+
+DISPATCH_TABLE = (
+    EventHandlerRegistry()
+    .register(CharacterWonBattleEvent, _NoopEventHandler)
+    .register(CharacterLostBattleEvent, _NoopEventHandler)
+    .compile()
+)
+
+
+async def deliver(event_dispatcher: EventDispatcher) -> float:
+    """Every Battle publishes one event, and the first Battle a burst of them, checking the queue each time"""
+    battle_ids = [str(EntityID()) for _ in range(BATTLES)]
+    start = time.perf_counter()
+    for index in range(BURST):
+        event_dispatcher.publish(CharacterLostBattleEvent(f"Burst {index}", battle_ids[0]))
+    for battle_id in battle_ids:
+        event_dispatcher.publish(CharacterWonBattleEvent("Winner", battle_id))
+        event_dispatcher.has(CharacterWonBattleEvent)
+    await event_dispatcher.notify_all()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    events = BATTLES + BURST
+    shared_seconds = anyio.run(deliver, BattleEventDispatcher(dispatch_table=DISPATCH_TABLE))
+    report("Shared dispatcher", events, shared_seconds, "events")
+    partitioned_seconds = anyio.run(deliver, PartitionedEventBus(dispatch_table=DISPATCH_TABLE))
+    report("Partitioned event bus", events, partitioned_seconds, "events")
+
+
+if __name__ == "__main__":
+    main()
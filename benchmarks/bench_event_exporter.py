@@ -0,0 +1,35 @@
+"""Measures the throughput of the event exporter with both framings
+
+    python -m benchmarks.bench_event_exporter
+"""
+import tempfile
+import time
+from pathlib import Path
+
+from domain.battle.events import CharacterWonBattleEvent
+from domain.event_exporter import EventExporter, EventFramingEnum, FileEventSink
+from domain.value_objects import EntityID
+
+from ._fixtures import report
+
+EVENTS = 200_000
+
+
+def export_events(path: Path, framing: EventFramingEnum, events: list[CharacterWonBattleEvent]) -> float:
+    start = time.perf_counter()
+    with EventExporter(FileEventSink(path), framing) as exporter:
+        exporter.export_many(events)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    battle_id = str(EntityID())
+    events = [CharacterWonBattleEvent(f"Character {index % 100}", battle_id) for index in range(EVENTS)]
+    with tempfile.TemporaryDirectory() as directory:
+        for framing in EventFramingEnum:
+            seconds = export_events(Path(directory) / framing.value, framing, events)
+            report(f"EventExporter ({framing.value})", EVENTS, seconds, "events")
+
+
+if __name__ == "__main__":
+    main()
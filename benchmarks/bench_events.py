@@ -0,0 +1,63 @@
+"""Compares the construction of slotted typed events with the previous and the baseline open payload events
+
+    python -m benchmarks.bench_events
+"""
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+from domain import DomainEvent
+from domain.battle.events import CharacterWonBattleEvent
+
+from ._fixtures import report
+
+EVENTS = 200_000
+
+
+class _OpenPayloadEvent:
+    """Replica of the DomainEvent construction before payloads declared their fields"""
+
+    @dataclass
+    class Payload:
+        """Payload of the event"""
+
+    def __init__(self, **payload: str) -> None:
+        self.payload = self.Payload()
+        for key, value in payload.items():
+            setattr(self.payload, key, value)
+        self.timestamp = datetime.now().timestamp()
+
+
+class _BaselineDomainEvent(DomainEvent):
+    """DomainEvent that declares no payload, built through the keyword arguments of DomainEvent"""
+
+
+def build_baseline_domain_events(events: int) -> float:
+    start = time.perf_counter()
+    for _ in range(events):
+        _BaselineDomainEvent(character_name="Itadori", battle_id="battle")
+    return time.perf_counter() - start
+
+
+def build_open_payload_events(events: int) -> float:
+    start = time.perf_counter()
+    for _ in range(events):
+        _OpenPayloadEvent(character_name="Itadori", battle_id="battle")
+    return time.perf_counter() - start
+
+
+def build_typed_payload_events(events: int) -> float:
+    start = time.perf_counter()
+    for _ in range(events):
+        CharacterWonBattleEvent("Itadori", "battle")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    report("Open payload + datetime.now()", EVENTS, build_open_payload_events(EVENTS), "events")
+    report("Baseline DomainEvent", EVENTS, build_baseline_domain_events(EVENTS), "events")
+    report("Slotted payload + monotonic clock", EVENTS, build_typed_payload_events(EVENTS), "events")
+
+
+if __name__ == "__main__":
+    main()
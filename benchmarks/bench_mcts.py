@@ -0,0 +1,42 @@
+"""Measures the nodes per second of the lookahead search and the clone of its compact battle state
+
+    python -m benchmarks.bench_mcts
+"""
+import copy
+import time
+
+from domain.battle.value_objects import BattleAllies, CompactBattleRules, CompactBattleState, MCTSPolicy, Team
+
+from ._fixtures import endless_character, report
+
+CHARACTERS_PER_TEAM = 4
+CLONES = 20_000
+TIME_BUDGET = 2.0
+
+
+def main() -> None:
+    team_builders = (Team.create_new(), Team.create_new())
+    for index in range(CHARACTERS_PER_TEAM):
+        team_builders[0].add_character(endless_character(f"Hero {index}"))
+        team_builders[1].add_character(endless_character(f"Monster {index}"))
+    participants = tuple(BattleAllies.create_new().add_team(builder.build()).build() for builder in team_builders)
+    rules = CompactBattleRules(participants)
+    state = CompactBattleState.snapshot(rules, rules.characters[0])
+
+    start = time.perf_counter()
+    for _ in range(CLONES // 100):
+        copy.deepcopy(rules.characters)
+    report("Deep copies of the characters", CLONES // 100, time.perf_counter() - start, "clones")
+    start = time.perf_counter()
+    for _ in range(CLONES):
+        state.copy()
+    report("Copies of the compact state", CLONES, time.perf_counter() - start, "clones")
+
+    policy = MCTSPolicy(participants, time_budget=TIME_BUDGET, seed=0)
+    start = time.perf_counter()
+    policy.search(state)
+    report(f"MCTS nodes, {2 * CHARACTERS_PER_TEAM} characters", policy.nodes, time.perf_counter() - start, "nodes")
+
+
+if __name__ == "__main__":
+    main()
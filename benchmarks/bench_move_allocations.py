@@ -0,0 +1,69 @@
+"""Measures the memory allocated by each turn, building a new Move per turn or reusing the MoveContext
+
+    python -m benchmarks.bench_move_allocations
+"""
+import time
+import tracemalloc
+from typing import Callable
+
+from domain.battle.value_objects import IMoveBuilder, Move, MoveContext, MoveLog
+from domain.battle_event_dispatcher import BattleEventDispatcher
+
+from ._fixtures import endless_character, endless_duel, punch, report
+
+TURNS = 20_000
+
+
+def transient_bytes_per_turn(play_turn: Callable[[int], None], turns: int) -> float:
+    """Mean of the peak memory allocated while a turn is played, above the memory in use before it"""
+    tracemalloc.start()
+    try:
+        transient_bytes = 0
+        for turn in range(turns):
+            current_bytes, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            play_turn(turn)
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            transient_bytes += peak_bytes - current_bytes
+    finally:
+        tracemalloc.stop()
+    return transient_bytes / turns
+
+
+def move_builders() -> tuple[Callable[[int], IMoveBuilder], Callable[[int], IMoveBuilder]]:
+    first_character, second_character = endless_character("First"), endless_character("Second")
+    enemies = (second_character,)
+    move_context = MoveContext(MoveLog())
+
+    def new_move(turn: int) -> IMoveBuilder:
+        return Move.create_new(first_character, enemies, turn=turn)
+
+    def reused_move(turn: int) -> IMoveBuilder:
+        return move_context.next_move(first_character, enemies, turn)
+
+    return new_move, reused_move
+
+
+def play_sync_turn() -> Callable[[int], None]:
+    battle, first_character, second_character = endless_duel(BattleEventDispatcher())
+    moves = (punch(first_character, second_character), punch(second_character, first_character))
+
+    def play_turn(turn: int) -> None:
+        battle.play_sync(moves[turn % 2])
+
+    return play_turn
+
+
+def main() -> None:
+    new_move, reused_move = move_builders()
+    for title, build_move in (("Move.create_new", new_move), ("MoveContext.next_move", reused_move)):
+        print(f"{title:<40} {transient_bytes_per_turn(build_move, TURNS):>14,.0f} bytes/turn")
+        start = time.perf_counter()
+        for turn in range(TURNS):
+            build_move(turn)
+        report(title, TURNS, time.perf_counter() - start, "moves")
+    print(f"{'Battle.play_sync':<40} {transient_bytes_per_turn(play_sync_turn(), TURNS):>14,.0f} bytes/turn")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Compares the turns per second of the async Battle.play with the synchronous Battle.play_sync
+
+    python -m benchmarks.bench_play_turns
+"""
+import time
+
+import trio
+
+from domain.battle_event_dispatcher import BattleEventDispatcher
+
+from ._fixtures import endless_duel, punch, report
+
+TURNS = 20_000
+
+
+async def play_async(turns: int) -> float:
+    battle, first_character, second_character = endless_duel(BattleEventDispatcher())
+    moves = (punch(first_character, second_character), punch(second_character, first_character))
+    start = time.perf_counter()
+    for turn in range(turns):
+        await battle.play(moves[turn % 2])
+    return time.perf_counter() - start
+
+
+def play_sync(turns: int) -> float:
+    battle, first_character, second_character = endless_duel(BattleEventDispatcher())
+    moves = (punch(first_character, second_character), punch(second_character, first_character))
+    start = time.perf_counter()
+    for turn in range(turns):
+        battle.play_sync(moves[turn % 2])
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    report("Battle.play (trio)", TURNS, trio.run(play_async, TURNS), "turns")
+    report("Battle.play_sync", TURNS, play_sync(TURNS), "turns")
+
+
+if __name__ == "__main__":
+    main()
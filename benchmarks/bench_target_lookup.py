@@ -0,0 +1,39 @@
+"""Compares the linear scan of the enemies with the ID-keyed enemy index in a raid
+
+    python -m benchmarks.bench_target_lookup
+"""
+import time
+
+from domain.character import ICharacter
+
+from ._fixtures import endless_character, report
+
+ENEMIES = 500
+LOOKUPS = 20_000
+
+
+def linear_lookup(enemies: tuple[ICharacter, ...], targets: list[ICharacter]) -> float:
+    start = time.perf_counter()
+    for target in targets:
+        target_id = target.entity_id
+        next(filter(lambda enemy: enemy.entity_id == target_id, enemies))
+    return time.perf_counter() - start
+
+
+def indexed_lookup(enemies: tuple[ICharacter, ...], targets: list[ICharacter]) -> float:
+    enemy_index = {enemy.entity_id: enemy for enemy in enemies}
+    start = time.perf_counter()
+    for target in targets:
+        enemy_index[target.entity_id]
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    enemies = tuple(endless_character(f"Raider {index}") for index in range(ENEMIES))
+    targets = [enemies[index * 7919 % ENEMIES] for index in range(LOOKUPS)]
+    report(f"Linear scan of {ENEMIES} enemies", LOOKUPS, linear_lookup(enemies, targets), "lookups")
+    report(f"Enemy index of {ENEMIES} enemies", LOOKUPS, indexed_lookup(enemies, targets), "lookups")
+
+
+if __name__ == "__main__":
+    main()
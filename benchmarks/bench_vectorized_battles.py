@@ -0,0 +1,108 @@
+"""Compares playing many battles one by one in the object model with playing them in lockstep with NumPy
+
+    python -m benchmarks.bench_vectorized_battles
+
+Both play the same deterministic greedy policy. NumPy comes with the ``simulation`` extra.
+"""
+import time
+
+from domain.battle import Battle, IBattle
+from domain.battle.value_objects import (
+    BattleAllies,
+    CompactBattleRules,
+    CompactBattleState,
+    IBattleAllies,
+    IMoveBuilder,
+    PassTurnAlgorithmEnum,
+    Team,
+    greedy_action,
+)
+from domain.battle.value_objects.vectorized_battles import VectorizedBattles
+from domain.battle_event_dispatcher import BattleEventDispatcher
+from domain.character import Character, ICharacter
+from domain.skill.combat_technique import CombatTechnique
+from domain.skill.spell import Spell
+from domain.value_objects import EntityID
+
+from ._fixtures import report
+
+BATTLES = 2_000
+MAX_TURNS = 500
+
+
+def fighter(name: str, life_points: int, damage: int) -> ICharacter:
+    combat_technique = CombatTechnique.create_new(entity_id=EntityID(), name=f"{name} slash")
+    spell = Spell.create_new(entity_id=EntityID(), name=f"{name} blast")
+    return (
+        Character.create_new(entity_id=EntityID(), name=name)
+        .specify_skill_properties(life_points=life_points, stamina_points=100, mana_points=100)
+        .add_skills(
+            combat_technique.specify_combat_technique_properties(stamina_cost=10, damage=damage, cooldown=1),
+            spell.specify_spell_properties(mana_cost=40, damage=damage + 5, cooldown=2, max_targets=None),
+        )
+    )
+
+
+def participants(seed: int) -> tuple[IBattleAllies, ...]:
+    return tuple(
+        BattleAllies.create_new()
+        .add_team(
+            Team.create_new()
+            .add_character(fighter(f"{side} tank", 60 + (seed * 7 + side) % 50, 10))
+            .add_character(fighter(f"{side} caster", 40 + (seed * 3 + side) % 30, 8))
+            .build()
+        )
+        .build()
+        for side in range(2)
+    )
+
+
+def object_model(battles: list[tuple[IBattle, CompactBattleRules]]) -> float:
+    start = time.perf_counter()
+    for battle, rules in battles:
+
+        def move(move_builder: IMoveBuilder) -> None:
+            action = greedy_action(CompactBattleState.snapshot(rules, move_builder.playing_character))
+            if action.skill < 0:
+                move_builder.rest()
+            elif action.target < 0:
+                move_builder.attack_all(rules.skills[action.skill])
+            else:
+                move_builder.attack(rules.characters[action.target].entity_id, rules.skills[action.skill])
+
+        for _ in range(MAX_TURNS):
+            if not battle.is_ongoing:
+                break
+            battle.play_sync(move)
+    return time.perf_counter() - start
+
+
+def vectorized(states: list[CompactBattleState]) -> float:
+    start = time.perf_counter()
+    VectorizedBattles.from_states(states).run(MAX_TURNS)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    battles = []
+    states = []
+    for seed in range(BATTLES):
+        battle_participants = participants(seed)
+        rules = CompactBattleRules(battle_participants)
+        states.append(CompactBattleState.snapshot(rules, rules.characters[0]))
+        battle = Battle.create_new(
+            event_dispatcher=BattleEventDispatcher(), entity_id=EntityID(), is_battle_ongoing=False
+        )
+        for battle_allies in battle_participants:
+            battle = battle.add_battle_allies(battle_allies)
+        battles.append((battle.specify_pass_turn_algorithm(PassTurnAlgorithmEnum.REGULAR_PASS_TURN), rules))
+
+    vectorized_seconds = vectorized(states)
+    object_model_seconds = object_model(battles)
+    report("Battles one by one, object model", BATTLES, object_model_seconds, "battles")
+    report("Battles in lockstep, NumPy", BATTLES, vectorized_seconds, "battles")
+    print(f"{'Speedup':<40} {object_model_seconds / vectorized_seconds:>14.1f}x")
+
+
+if __name__ == "__main__":
+    main()
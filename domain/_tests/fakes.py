@@ -1,8 +1,8 @@
-from typing import Generator
+from typing import Callable, Generator
 
 from domain import EventDispatcher
 from domain.battle import Battle, IBattle
-from domain.battle.value_objects import BattleAllies, IBattleAllies, ITeam, PassTurnAlgorithmEnum, Team
+from domain.battle.value_objects import BattleAllies, IBattleAllies, IMoveBuilder, ITeam, PassTurnAlgorithmEnum, Team
 from domain.character import Character, ICharacter
 from domain.skill.combat_technique import CombatTechnique, ICombatTechnique
 from domain.skill.spell import ISpell, Spell
@@ -92,9 +92,45 @@ def fake_battle_allies_gen(
 def fake_battle(
     event_dispatcher: EventDispatcher,
     pass_turn_algorithm_enum: PassTurnAlgorithmEnum,
-    *battle_allies_tuple: IBattleAllies
+    *battle_allies_tuple: IBattleAllies,
 ) -> IBattle:
     battle_builder = Battle.create_new(event_dispatcher=event_dispatcher, entity_id=EntityID(), is_battle_ongoing=False)
     for battle_allies in battle_allies_tuple:
         battle_builder = battle_builder.add_battle_allies(battle_allies)
     return battle_builder.specify_pass_turn_algorithm(pass_turn_algorithm_enum)
+
+
+def fake_duel(event_dispatcher: EventDispatcher, seed: int) -> tuple[IBattle, ICharacter, ICharacter]:
+    first_character = fake_character("First", seed, combat_technique_quantity=2, spell_quantity=0)
+    second_character = fake_character("Second", seed, combat_technique_quantity=2, spell_quantity=0)
+    battle = fake_battle(
+        event_dispatcher,
+        PassTurnAlgorithmEnum.REGULAR_PASS_TURN,
+        fake_battle_allies(fake_team(first_character)),
+        fake_battle_allies(fake_team(second_character)),
+    )
+    return battle, first_character, second_character
+
+
+def fake_attack_move(attacker: ICharacter, target: ICharacter) -> Callable[[IMoveBuilder], None]:
+    def move(move_builder: IMoveBuilder) -> None:
+        combat_technique = next(attacker.available_combat_techniques, None)
+        if combat_technique is None:
+            move_builder.rest()
+            return
+        move_builder.attack(target.entity_id, combat_technique)
+
+    return move
+
+
+def fake_multi_target_character(name: str, damage: int, max_targets: int | None) -> ICharacter:
+    combat_technique = CombatTechnique.create_new(entity_id=EntityID(), name=f"{name} sweep")
+    return (
+        Character.create_new(entity_id=EntityID(), name=name)
+        .specify_skill_properties(life_points=MAXIMUS_POINTS, stamina_points=MAXIMUS_POINTS, mana_points=MAXIMUS_POINTS)
+        .add_skills(
+            combat_technique.specify_combat_technique_properties(
+                stamina_cost=1, damage=damage, cooldown=0, max_targets=max_targets
+            )
+        )
+    )
@@ -0,0 +1,151 @@
+from pathlib import Path
+
+import pytest
+import trio.testing
+
+from domain._tests.fakes import MAXIMUS_POINTS, fake_attack_move, fake_battle, fake_battle_allies, fake_duel, fake_team
+from domain.battle.exceptions import BattleIsAlreadyHappeningException
+from domain.battle.value_objects import MoveActionEnum, PassTurnAlgorithmEnum
+from domain.battle_event_dispatcher import BattleEventDispatcher
+from domain.battle_log_segment import BattleLogSegmentReader, BattleLogSegmentWriter
+from domain.character import Character, ICharacter
+from domain.skill import PassiveEffectEnum, PassiveTriggerEnum
+from domain.skill.combat_technique import CombatTechnique
+from domain.skill.passive import Passive
+from domain.value_objects import EntityID
+
+
+async def test_battle_log_segment_round_trip(tmp_path: Path, autojump_clock: trio.testing.MockClock) -> None:
+    segment_path = tmp_path / "battles.segment"
+    battles = [fake_duel(BattleEventDispatcher(), seed=50) for _ in range(3)]
+
+    with BattleLogSegmentWriter(segment_path) as writer:
+        with pytest.raises(BattleIsAlreadyHappeningException):
+            writer.append(battles[0][0])
+        for battle, first_character, second_character in battles:
+            while battle.is_ongoing:
+                await battle.play(fake_attack_move(first_character, second_character))
+                if battle.is_ongoing:
+                    await battle.play(fake_attack_move(second_character, first_character))
+            writer.append(battle)
+
+    with BattleLogSegmentReader(segment_path) as reader:
+        assert len(reader) == 3
+        assert EntityID() not in reader
+        for battle, _, _ in battles:
+            assert battle.entity_id in reader
+            records = tuple(reader.records(battle.entity_id))
+            assert records == battle.move_log.records
+            assert all(record.action is MoveActionEnum.ATTACK for record in records)
+            assert sum(record.damage for record in records) == 150
+        assert len(list(reader)) == sum(len(battle.move_log) for battle, _, _ in battles)
+        with pytest.raises(KeyError):
+            next(reader.records(EntityID()))
+
+
+def test_battle_log_segment_keeps_negative_damage_and_rejects_duplicated_battles(tmp_path: Path) -> None:
+    segment_path = tmp_path / "battles.segment"
+    battle, first_character, second_character = fake_duel(BattleEventDispatcher(), seed=50)
+    while battle.is_ongoing:
+        battle.play_sync(fake_attack_move(first_character, second_character))
+        if battle.is_ongoing:
+            battle.play_sync(fake_attack_move(second_character, first_character))
+    skill_id = battle.move_log.records[-1].skill_id
+    assert skill_id is not None
+    battle.move_log.record_attack(
+        len(battle.move_log) + 1, first_character.entity_id, first_character.entity_id, skill_id, -5
+    )
+
+    with BattleLogSegmentWriter(segment_path) as writer:
+        writer.append(battle)
+        with pytest.raises(ValueError):
+            writer.append(battle)
+
+    with BattleLogSegmentReader(segment_path) as reader:
+        assert len(reader) == 1
+        assert tuple(reader.records(battle.entity_id)) == battle.move_log.records
+        assert battle.move_log.records[-1].damage == -5
+
+
+def test_battle_log_segment_rejects_unknown_files(tmp_path: Path) -> None:
+    not_a_segment = tmp_path / "not_a.segment"
+    not_a_segment.write_bytes(bytes(64))
+    with pytest.raises(ValueError):
+        BattleLogSegmentReader(not_a_segment)
+
+
+def test_battle_log_segment_rejects_empty_and_truncated_files(tmp_path: Path) -> None:
+    empty_segment = tmp_path / "empty.segment"
+    empty_segment.write_bytes(b"")
+    with pytest.raises(ValueError):
+        BattleLogSegmentReader(empty_segment)
+
+    truncated_segment = tmp_path / "truncated.segment"
+    truncated_segment.write_bytes(b"DBLG\x01\x00\x00\x00\x05\x00\x00\x00")
+    with pytest.raises(ValueError):
+        BattleLogSegmentReader(truncated_segment)
+
+
+async def test_battle_log_segment_closes_with_partly_consumed_records(
+    tmp_path: Path, autojump_clock: trio.testing.MockClock
+) -> None:
+    segment_path = tmp_path / "battles.segment"
+    battle, first_character, second_character = fake_duel(BattleEventDispatcher(), seed=50)
+    while battle.is_ongoing:
+        await battle.play(fake_attack_move(first_character, second_character))
+        if battle.is_ongoing:
+            await battle.play(fake_attack_move(second_character, first_character))
+
+    with pytest.raises(RuntimeError):
+        with BattleLogSegmentWriter(segment_path) as writer:
+            writer.append(battle)
+            raise RuntimeError
+    assert not segment_path.exists()
+
+    with BattleLogSegmentWriter(segment_path) as writer:
+        writer.append(battle)
+    with BattleLogSegmentReader(segment_path) as reader:
+        records = reader.records(battle.entity_id)
+        assert next(records) == battle.move_log.records[0]
+
+
+def fake_healing_character(name: str, damage: int) -> ICharacter:
+    combat_technique = CombatTechnique.create_new(entity_id=EntityID(), name=f"{name} punch")
+    healing = Passive.create_new(entity_id=EntityID(), name=f"{name} second wind").specify_passive_properties(
+        trigger=PassiveTriggerEnum.ON_DAMAGE_TAKEN, effect=PassiveEffectEnum.HEAL, magnitude=40, cooldown=2
+    )
+    return (
+        Character.create_new(entity_id=EntityID(), name=name)
+        .specify_skill_properties(life_points=MAXIMUS_POINTS, stamina_points=MAXIMUS_POINTS, mana_points=MAXIMUS_POINTS)
+        .add_skills(
+            combat_technique.specify_combat_technique_properties(stamina_cost=1, damage=damage, cooldown=0),
+            healing,
+        )
+    )
+
+
+async def test_battle_log_segment_keeps_the_damage_healed_by_passives(
+    tmp_path: Path, autojump_clock: trio.testing.MockClock
+) -> None:
+    segment_path = tmp_path / "battles.segment"
+    first_character, second_character = fake_healing_character("First", 30), fake_healing_character("Second", 1)
+    battle = fake_battle(
+        BattleEventDispatcher(),
+        PassTurnAlgorithmEnum.REGULAR_PASS_TURN,
+        fake_battle_allies(fake_team(first_character)),
+        fake_battle_allies(fake_team(second_character)),
+    )
+    while battle.is_ongoing:
+        await battle.play(fake_attack_move(first_character, second_character))
+        if battle.is_ongoing:
+            await battle.play(fake_attack_move(second_character, first_character))
+
+    with BattleLogSegmentWriter(segment_path) as writer:
+        writer.append(battle)
+
+    with BattleLogSegmentReader(segment_path) as reader:
+        records = tuple(reader.records(battle.entity_id))
+    assert records == battle.move_log.records
+    first_character_damages = [record.damage for record in records if record.actor_id == first_character.entity_id]
+    assert set(first_character_damages) == {30}
+    assert sum(first_character_damages) > MAXIMUS_POINTS
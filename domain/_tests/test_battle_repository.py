@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+import trio.testing
+
+from domain._tests.fakes import fake_attack_move, fake_duel
+from domain.battle.exceptions import BattleNotFoundException
+from domain.battle_event_dispatcher import BattleEventDispatcher
+from domain.battle_repository import CacheStatistics, SQLiteBattleRepository
+from domain.value_objects import EntityID
+
+
+async def test_battle_repository_cache_and_snapshots(tmp_path: Path, autojump_clock: trio.testing.MockClock) -> None:
+    database_path = tmp_path / "battles.sqlite3"
+    event_dispatcher = BattleEventDispatcher()
+    repository = SQLiteBattleRepository(event_dispatcher, database_path, cache_size=2)
+    duels = [fake_duel(event_dispatcher, seed=50) for _ in range(3)]
+    for battle, first_character, second_character in duels:
+        await battle.play(fake_attack_move(first_character, second_character))
+        repository.add(battle)
+
+    assert repository.statistics == CacheStatistics(hits=0, misses=0, evictions=1, size=2)
+    assert repository.get(duels[2][0].entity_id) is duels[2][0]
+    assert repository.get(duels[0][0].entity_id) is duels[0][0]
+    assert repository.statistics == CacheStatistics(hits=1, misses=1, evictions=2, size=2)
+
+    repository.flush()
+    restored_battle = repository.get(duels[1][0].entity_id)
+    assert restored_battle is not duels[1][0]
+    assert restored_battle.entity_id == duels[1][0].entity_id
+    assert restored_battle.move_log.records == duels[1][0].move_log.records
+    assert repository.statistics.misses == 2
+
+    with pytest.raises(BattleNotFoundException):
+        repository.get(EntityID())
+    repository.close()
+
+    reopened_repository = SQLiteBattleRepository(BattleEventDispatcher(), database_path, cache_size=3)
+    battle_ids = [battle.entity_id for battle, _, _ in reversed(duels)]
+    assert [battle.entity_id for battle in reopened_repository.get_many(battle_ids)] == battle_ids
+    assert reopened_repository.statistics == CacheStatistics(hits=0, misses=3, evictions=0, size=3)
+
+    restored_battle, first_character, second_character = reopened_repository.get(duels[0][0].entity_id), *duels[0][1:]
+    assert restored_battle.is_ongoing
+    await restored_battle.play(fake_attack_move(second_character, first_character))
+    assert [record.actor_id for record in restored_battle.move_log] == [
+        first_character.entity_id,
+        second_character.entity_id,
+    ]
+    reopened_repository.close()
+
+
+async def test_battle_repository_get_many_keeps_pending_battles(autojump_clock: trio.testing.MockClock) -> None:
+    event_dispatcher = BattleEventDispatcher()
+    repository = SQLiteBattleRepository(event_dispatcher, cache_size=1)
+    (pending_battle, _, _), (hot_battle, _, _) = fake_duel(event_dispatcher, seed=50), fake_duel(
+        event_dispatcher, seed=50
+    )
+    repository.add(pending_battle)
+    repository.flush()
+    repository.add(hot_battle)
+    repository.add(pending_battle)
+    repository.add(hot_battle)
+
+    with pytest.raises(BattleNotFoundException):
+        repository.get_many((pending_battle.entity_id, EntityID()))
+    battles = repository.get_many((pending_battle.entity_id, pending_battle.entity_id))
+    assert all(battle is pending_battle for battle in battles)
+    assert repository.get(pending_battle.entity_id) is pending_battle
+    repository.close()
@@ -0,0 +1,72 @@
+import time
+
+import anyio
+
+from domain._tests.fakes import fake_attack_move, fake_duel
+from domain.battle.events import CharacterWonBattleEvent
+from domain.battle_event_dispatcher import BattleEventDispatcher
+from domain.clock import WALL_CLOCK, VirtualClock, current_clock, use_clock
+
+
+def test_virtual_clock_jumps_to_the_deadline_of_concurrent_sleeps() -> None:
+    clock = VirtualClock()
+
+    async def sleep_concurrently() -> None:
+        async with anyio.create_task_group() as task_group:
+            task_group.start_soon(clock.sleep, 1)
+            task_group.start_soon(clock.sleep, 1)
+        await clock.sleep(0.5)
+
+    anyio.run(sleep_concurrently, backend="asyncio")
+
+    assert clock.now() == 1.5
+
+
+def test_use_clock_binds_the_current_clock() -> None:
+    clock = VirtualClock()
+
+    with use_clock(clock):
+        assert current_clock() is clock
+
+    assert current_clock() is WALL_CLOCK
+
+
+def test_battle_ends_in_virtual_time() -> None:
+    for backend in ("asyncio", "trio"):
+        clock = VirtualClock()
+        event_dispatcher = BattleEventDispatcher(clock=clock)
+        battle, first_character, second_character = fake_duel(event_dispatcher, seed=50)
+
+        async def play_until_the_end() -> None:
+            await battle.play(fake_attack_move(first_character, second_character))
+            await battle.play(fake_attack_move(second_character, first_character))
+            start = time.perf_counter()
+            await battle.play(fake_attack_move(first_character, second_character))
+            assert time.perf_counter() - start < 0.01
+
+        anyio.run(play_until_the_end, backend=backend)
+
+        assert not battle.is_ongoing
+        assert event_dispatcher.was_dispatched(CharacterWonBattleEvent)
+        assert clock.now() == 1
+
+
+def test_virtual_clock_wakes_sleepers_in_the_order_of_their_deadlines() -> None:
+    for backend in ("asyncio", "trio"):
+        clock = VirtualClock()
+        woken_at: dict[str, float] = {}
+
+        async def sleep_and_record(name: str, seconds: float) -> None:
+            await clock.sleep(seconds)
+            woken_at[name] = clock.now()
+
+        async def sleep_concurrently() -> None:
+            async with anyio.create_task_group() as task_group:
+                task_group.start_soon(sleep_and_record, "late", 5)
+                task_group.start_soon(sleep_and_record, "early", 1)
+                task_group.start_soon(sleep_and_record, "middle", 3)
+
+        anyio.run(sleep_concurrently, backend=backend)
+
+        assert woken_at == {"early": 1, "middle": 3, "late": 5}
+        assert list(woken_at) == ["early", "middle", "late"]
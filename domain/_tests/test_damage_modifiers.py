@@ -0,0 +1,117 @@
+import pytest
+
+from domain._tests.fakes import MAXIMUS_POINTS, fake_attack_move, fake_battle_allies, fake_character, fake_team
+from domain.battle import Battle
+from domain.battle.value_objects import PassTurnAlgorithmEnum
+from domain.battle_event_dispatcher import BattleEventDispatcher
+from domain.character import Character, ICharacter
+from domain.damage_modifiers import DamageModifiers, DamageTable
+from domain.skill import ElementEnum
+from domain.skill.spell import Spell
+from domain.value_objects import EntityID
+
+
+def fake_elemental_character(name: str, element: ElementEnum, skill_element: ElementEnum) -> ICharacter:
+    spell = Spell.create_new(entity_id=EntityID(), name=f"{name} bolt").specify_spell_properties(
+        mana_cost=0, damage=20, cooldown=0, max_targets=None, element=skill_element
+    )
+    return (
+        Character.create_new(entity_id=EntityID(), name=name)
+        .specify_skill_properties(
+            life_points=MAXIMUS_POINTS, stamina_points=MAXIMUS_POINTS, mana_points=MAXIMUS_POINTS, element=element
+        )
+        .add_skills(spell)
+    )
+
+
+def test_modifiers_are_compiled_into_the_table() -> None:
+    table = (
+        DamageModifiers()
+        .affinity_bonus(1.5)
+        .resistance(ElementEnum.FIRE, ElementEnum.WATER, 0.5)
+        .resistance(ElementEnum.WATER, ElementEnum.FIRE, 2)
+        .compile()
+    )
+
+    assert table.multiplier(ElementEnum.FIRE, ElementEnum.FIRE, ElementEnum.WATER) == 0.75
+    assert table.multiplier(ElementEnum.EARTH, ElementEnum.WATER, ElementEnum.FIRE) == 2
+    assert table.multiplier(ElementEnum.NEUTRAL, ElementEnum.AIR, ElementEnum.EARTH) == 1
+    assert table.resolve(20, ElementEnum.FIRE, ElementEnum.FIRE, ElementEnum.NEUTRAL) == 30
+    assert table.multiplier(ElementEnum.NEUTRAL, ElementEnum.NEUTRAL, ElementEnum.NEUTRAL) == 1
+
+
+def test_critical_hits() -> None:
+    always_critical = DamageModifiers().critical(chance=1, multiplier=2).compile()
+    never_critical = DamageModifiers().critical(chance=0, multiplier=2).compile()
+
+    assert always_critical.resolve(20, ElementEnum.NEUTRAL, ElementEnum.NEUTRAL, ElementEnum.NEUTRAL) == 40
+    assert never_critical.resolve(20, ElementEnum.NEUTRAL, ElementEnum.NEUTRAL, ElementEnum.NEUTRAL) == 20
+    assert type(never_critical) is DamageTable
+
+
+def test_critical_hits_are_reproducible_with_a_seed() -> None:
+    modifiers = DamageModifiers().critical(chance=0.5, multiplier=2)
+    first_table, second_table = modifiers.compile(seed=7), modifiers.compile(seed=7)
+    neutral = ElementEnum.NEUTRAL
+
+    rolls = [
+        (first_table.resolve(10, neutral, neutral, neutral), second_table.resolve(10, neutral, neutral, neutral))
+        for _ in range(50)
+    ]
+
+    assert all(first == second for first, second in rolls)
+    assert {first for first, _ in rolls} == {10, 20}
+
+
+@pytest.mark.parametrize("multiplier", [-1, -0.5])
+def test_invalid_multiplier(multiplier: float) -> None:
+    with pytest.raises(ValueError):
+        DamageModifiers().affinity_bonus(multiplier)
+
+
+def test_invalid_critical_chance() -> None:
+    with pytest.raises(ValueError):
+        DamageModifiers().critical(chance=1.5, multiplier=2)
+
+
+def test_attacks_resolve_damage_against_each_defender() -> None:
+    table = DamageModifiers().resistance(ElementEnum.FIRE, ElementEnum.WATER, 0.5).compile()
+    attacker = fake_elemental_character("Pyromancer", ElementEnum.FIRE, ElementEnum.FIRE)
+    water_defender = fake_elemental_character("Naiad", ElementEnum.WATER, ElementEnum.WATER)
+    earth_defender = fake_elemental_character("Golem", ElementEnum.EARTH, ElementEnum.EARTH)
+    spell = next(attacker.available_spells)
+
+    attacker.attack_many(spell.entity_id, (water_defender, earth_defender), table)
+    attacker.attack(spell.entity_id, earth_defender)
+
+    assert water_defender.current_life_points == MAXIMUS_POINTS - 10
+    assert earth_defender.current_life_points == MAXIMUS_POINTS - 40
+
+
+def play_seeded_duel(damage_seed: int) -> list[int]:
+    first_character = fake_character("First", 50, combat_technique_quantity=2, spell_quantity=0)
+    second_character = fake_character("Second", 50, combat_technique_quantity=2, spell_quantity=0)
+    battle = (
+        Battle.create_new(
+            event_dispatcher=BattleEventDispatcher(),
+            entity_id=EntityID(),
+            is_battle_ongoing=False,
+            damage_modifiers=DamageModifiers().critical(chance=0.5, multiplier=2),
+            damage_seed=damage_seed,
+        )
+        .add_battle_allies(fake_battle_allies(fake_team(first_character)))
+        .add_battle_allies(fake_battle_allies(fake_team(second_character)))
+        .specify_pass_turn_algorithm(PassTurnAlgorithmEnum.REGULAR_PASS_TURN)
+    )
+    life_points = []
+    for attacker, target in ((first_character, second_character), (second_character, first_character)) * 2:
+        if not battle.is_ongoing:
+            break
+        battle.play_sync(fake_attack_move(attacker, target))
+        life_points.append(target.current_life_points)
+    return life_points
+
+
+def test_battle_critical_hits_are_reproducible_with_a_damage_seed() -> None:
+    assert play_seeded_duel(damage_seed=7) == play_seeded_duel(damage_seed=7)
+    assert len({tuple(play_seeded_duel(damage_seed)) for damage_seed in range(10)}) > 1
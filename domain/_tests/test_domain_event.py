@@ -0,0 +1,37 @@
+import time
+
+import pytest
+
+from domain.battle.events import CharacterWonBattleEvent
+from domain.interfaces import DomainEvent
+
+
+def test_domain_event_with_typed_payload() -> None:
+    event = CharacterWonBattleEvent("Itadori", battle_id="battle")
+
+    assert event.event_name == "CharacterWonBattleEvent"
+    assert event.payload == CharacterWonBattleEvent.Payload(character_name="Itadori", battle_id="battle")
+    assert not hasattr(event.payload, "__dict__")
+    assert not hasattr(event, "__dict__")
+    assert abs(event.timestamp - time.time()) < 1
+    with pytest.raises(TypeError):
+        CharacterWonBattleEvent.Payload(character_name="Itadori", unknown_field=1)  # type: ignore[call-arg]
+
+    event.include_payload(character_name="Gojo")
+    assert event.payload == CharacterWonBattleEvent.Payload(character_name="Gojo", battle_id="battle")
+    event.include_payload(turn=3)
+    assert vars(event.payload) == {"character_name": "Gojo", "battle_id": "battle", "character_id": "", "turn": 3}
+
+
+def test_domain_event_with_open_payload() -> None:
+    class ExampleEvent(DomainEvent):
+        """Example of DomainEvent that does not declare its payload"""
+
+    event = ExampleEvent(a=1, b="b")
+    event.include_payload(c=True)
+
+    assert vars(event.payload) == {"a": 1, "b": "b", "c": True}
+    assert event.event_name == "ExampleEvent"
+    first_timestamp = event.timestamp
+    event.set_timestamp()
+    assert event.timestamp >= first_timestamp
@@ -0,0 +1,94 @@
+import pytest
+import trio.testing
+
+from domain import EventHandler
+from domain.battle.events import CharacterLostBattleEvent, CharacterWonBattleEvent, EventFactory
+from domain.battle_event_dispatcher import BattleEventDispatcher
+from domain.event_dedup_index import EventDedupIndex
+from domain.event_handler_registry import EventHandlerRegistry
+from domain.value_objects import EntityID
+
+
+def test_idempotency_key_is_deterministic() -> None:
+    battle_id = str(EntityID())
+
+    assert CharacterWonBattleEvent("Makima", battle_id).idempotency_key == (
+        CharacterWonBattleEvent("Makima", battle_id).idempotency_key
+    )
+    assert CharacterWonBattleEvent("Makima", battle_id).idempotency_key != (
+        CharacterLostBattleEvent("Makima", battle_id).idempotency_key
+    )
+    assert CharacterWonBattleEvent("Makima").idempotency_key is None
+    assert CharacterWonBattleEvent("Goblin", battle_id, str(EntityID())).idempotency_key != (
+        CharacterWonBattleEvent("Goblin", battle_id, str(EntityID())).idempotency_key
+    )
+
+
+def test_dedup_index_forgets_keys_out_of_the_window() -> None:
+    now = [0.0]
+    dedup_index = EventDedupIndex(window=10, clock=lambda: now[0])
+
+    assert not dedup_index.seen_before("Makima")
+    assert dedup_index.seen_before("Makima")
+    now[0] = 10.0
+    assert "Makima" not in dedup_index
+    assert not dedup_index.seen_before("Makima")
+
+
+def test_dedup_index_is_bounded() -> None:
+    dedup_index = EventDedupIndex(capacity=2)
+
+    for key in ("Makima", "Power", "Aizen"):
+        dedup_index.seen_before(key)
+
+    assert len(dedup_index) == 2
+    assert "Makima" not in dedup_index
+    assert "Aizen" in dedup_index
+
+
+async def test_replayed_events_are_dropped_before_the_handlers(autojump_clock: trio.testing.MockClock) -> None:
+    event_dispatcher = BattleEventDispatcher()
+    battle_id = EntityID()
+
+    for _ in range(2):
+        async with EventFactory(event_dispatcher, battle_id) as event_factory:
+            event_factory.character_won_battle("Makima")
+            event_factory.character_lost_battle("Aizen")
+
+    assert len(event_dispatcher.dispatched_domain_events()) == 2
+    assert event_dispatcher.duplicated_events == 2
+
+
+class FailingOnceEventHandler(EventHandler):
+    """Event Handler whose first delivery of each failing Character fails"""
+
+    failing_character_ids: set[str] = set()
+    delivered: list[str] = []
+
+    async def handle(self) -> None:
+        character_id = self.event.payload.character_id  # type: ignore[attr-defined]
+        if character_id in self.failing_character_ids:
+            self.failing_character_ids.discard(character_id)
+            raise RuntimeError("Delivery failed")
+        self.delivered.append(character_id)
+
+
+async def test_failed_deliveries_can_be_retried(autojump_clock: trio.testing.MockClock) -> None:
+    dispatch_table = EventHandlerRegistry().register(CharacterWonBattleEvent, FailingOnceEventHandler).compile()
+    event_dispatcher = BattleEventDispatcher(dispatch_table=dispatch_table)
+    battle_id, failing_id, other_id = str(EntityID()), str(EntityID()), str(EntityID())
+    FailingOnceEventHandler.failing_character_ids = {failing_id}
+    FailingOnceEventHandler.delivered = []
+
+    event_dispatcher.publish(CharacterWonBattleEvent("Goblin", battle_id, failing_id))
+    event_dispatcher.publish(CharacterWonBattleEvent("Goblin", battle_id, failing_id))
+    assert event_dispatcher.duplicated_events == 1
+    with pytest.raises(ExceptionGroup):
+        await event_dispatcher.notify(CharacterWonBattleEvent("Goblin", battle_id, failing_id))
+    event_dispatcher.publish(CharacterWonBattleEvent("Goblin", battle_id, other_id))
+    event_dispatcher.publish(CharacterWonBattleEvent("Goblin", battle_id, failing_id))
+    await event_dispatcher.notify_all()
+    event_dispatcher.publish(CharacterWonBattleEvent("Goblin", battle_id, failing_id))
+
+    assert sorted(FailingOnceEventHandler.delivered) == sorted([failing_id, other_id])
+    assert event_dispatcher.duplicated_events == 2
@@ -0,0 +1,196 @@
+import json
+import socket
+import threading
+from pathlib import Path
+
+import anyio
+import pytest
+import trio.testing
+
+from domain import DomainEvent, EventHandler
+from domain._tests.fakes import fake_attack_move, fake_duel
+from domain.battle.events import CharacterLostBattleEvent, CharacterWonBattleEvent
+from domain.battle_event_dispatcher import BattleEventDispatcher
+from domain.event_exporter import (
+    EventExporter,
+    EventFramingEnum,
+    EventSink,
+    FileEventSink,
+    SocketEventSink,
+    decode_binary_frames,
+)
+from domain.event_handler_registry import EventHandlerRegistry
+from domain.value_objects import EntityID
+
+
+def test_json_lines_exporter_flushes_by_size(tmp_path: Path) -> None:
+    events_path = tmp_path / "events.jsonl"
+    battle_id = str(EntityID())
+    exporter = EventExporter(FileEventSink(events_path), max_buffer_bytes=800, max_interval=3600)
+
+    exporter.export_many(CharacterWonBattleEvent(f"Character {index}", battle_id) for index in range(3))
+    assert events_path.read_bytes() == b""
+    exporter.export_many(CharacterWonBattleEvent(f"Character {index}", battle_id) for index in range(3, 6))
+    assert events_path.read_bytes() != b""
+    exporter.close()
+
+    lines = [json.loads(line) for line in events_path.read_text().splitlines()]
+    assert exporter.exported_events == len(lines) == 6
+    assert lines[0]["event_name"] == "CharacterWonBattleEvent"
+    assert lines[0]["battle_id"] == battle_id
+    assert [line["payload"]["character_name"] for line in lines] == [f"Character {index}" for index in range(6)]
+
+
+def test_binary_exporter_flushes_by_time() -> None:
+    now = [0.0]
+    battle_id = str(EntityID())
+    reader, writer = socket.socketpair()
+    with EventExporter(
+        SocketEventSink(writer), EventFramingEnum.BINARY, max_interval=1, clock=lambda: now[0]
+    ) as exporter:
+        exporter.export(CharacterLostBattleEvent("Aizen", battle_id))
+        now[0] = 1.0
+        exporter.export(CharacterWonBattleEvent("Makima"))
+        frames = list(decode_binary_frames(reader.recv(4096)))
+    reader.close()
+
+    assert [frame["event_name"] for frame in frames] == ["CharacterLostBattleEvent", "CharacterWonBattleEvent"]
+    assert [frame["battle_id"] for frame in frames] == [battle_id, ""]
+    assert frames[1]["payload"] == {"character_name": "Makima", "battle_id": "", "character_id": ""}
+
+
+async def test_dispatcher_exports_the_dispatched_events(tmp_path: Path, autojump_clock: trio.testing.MockClock) -> None:
+    events_path = tmp_path / "events.jsonl"
+    exporter = EventExporter(FileEventSink(events_path))
+    battle, first_character, second_character = fake_duel(BattleEventDispatcher(exporter=exporter), seed=50)
+    battle.play_sync(fake_attack_move(first_character, second_character))
+    battle.play_sync(fake_attack_move(second_character, first_character))
+    battle.play_sync(fake_attack_move(first_character, second_character))
+
+    await battle.flush_events()
+    exporter.close()
+
+    (line,) = events_path.read_text().splitlines()
+    assert json.loads(line)["payload"] == {
+        "character_name": "First",
+        "battle_id": str(battle.entity_id),
+        "character_id": str(first_character.entity_id),
+    }
+
+
+def test_binary_exporter_frames_any_battle_id_and_long_event_names() -> None:
+    class LongNamedEvent(DomainEvent):
+        """Event whose name does not fit in a byte"""
+
+    LongNamedEvent.event_name = "Long" * 100
+    reader, writer = socket.socketpair()
+    with EventExporter(SocketEventSink(writer), EventFramingEnum.BINARY) as exporter:
+        exporter.export(CharacterWonBattleEvent("Makima", "arena-7"))
+        exporter.export(LongNamedEvent(battle_id="ABCDEF00-0000-0000-0000-000000000000"))
+    frames = list(decode_binary_frames(reader.recv(4096)))
+    reader.close()
+
+    assert [frame["battle_id"] for frame in frames] == ["arena-7", "ABCDEF00-0000-0000-0000-000000000000"]
+    assert frames[1]["event_name"] == "Long" * 100
+
+
+async def test_flush_timer_writes_the_last_events(tmp_path: Path, autojump_clock: trio.testing.MockClock) -> None:
+    events_path = tmp_path / "events.jsonl"
+    exporter = EventExporter(FileEventSink(events_path), max_interval=1, clock=anyio.current_time)
+
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(exporter.run_flush_timer)
+        await exporter.export_async(CharacterWonBattleEvent("Makima"))
+        await anyio.sleep(0.5)
+        assert events_path.read_bytes() == b""
+        with anyio.fail_after(10):
+            while not events_path.read_bytes():
+                await anyio.sleep(0.1)
+        assert anyio.current_time() >= 1
+        assert len(events_path.read_text().splitlines()) == 1
+        task_group.cancel_scope.cancel()
+    exporter.close()
+
+
+class BlockingEventSink(EventSink):
+    """Sink whose writes wait until they are released, recording the buffer behind every write"""
+
+    def __init__(self) -> None:
+        self.writing = threading.Event()
+        self.released = threading.Event()
+        self.buffer_ids: list[int] = []
+        self.data = bytearray()
+
+    def write(self, data: memoryview) -> None:
+        self.writing.set()
+        self.released.wait()
+        self.buffer_ids.append(id(data.obj))
+        self.data += data
+
+    def close(self) -> None:
+        ...
+
+
+async def test_sync_flush_is_refused_during_a_thread_write(autojump_clock: trio.testing.MockClock) -> None:
+    sink = BlockingEventSink()
+    exporter = EventExporter(sink, max_buffer_bytes=4096)
+    await exporter.export_async(CharacterWonBattleEvent("Makima"))
+
+    async with anyio.create_task_group() as task_group:
+        task_group.start_soon(exporter.flush_async)
+        await anyio.to_thread.run_sync(sink.writing.wait)
+        with pytest.raises(RuntimeError):
+            exporter.flush()
+        sink.released.set()
+    await exporter.aclose()
+
+    assert len(sink.data.splitlines()) == 1
+
+
+async def test_flush_async_takes_turns_between_two_buffers(autojump_clock: trio.testing.MockClock) -> None:
+    sink = BlockingEventSink()
+    sink.released.set()
+    exporter = EventExporter(sink, max_buffer_bytes=4096)
+
+    for index in range(6):
+        await exporter.export_async(CharacterWonBattleEvent(f"Character {index}"))
+        await exporter.flush_async()
+    await exporter.aclose()
+
+    assert len(set(sink.buffer_ids)) == 2
+    assert [json.loads(line)["payload"]["character_name"] for line in sink.data.splitlines()] == [
+        f"Character {index}" for index in range(6)
+    ]
+
+
+class FailingOnceEventHandler(EventHandler):
+    """Event Handler whose first delivery fails"""
+
+    failed = False
+
+    async def handle(self) -> None:
+        if not FailingOnceEventHandler.failed:
+            FailingOnceEventHandler.failed = True
+            raise RuntimeError("Delivery failed")
+
+
+async def test_an_event_delivered_again_is_exported_once(
+    tmp_path: Path, autojump_clock: trio.testing.MockClock
+) -> None:
+    exporter = EventExporter(FileEventSink(tmp_path / "events.jsonl"))
+    dispatch_table = EventHandlerRegistry().register(CharacterWonBattleEvent, FailingOnceEventHandler).compile()
+    event_dispatcher = BattleEventDispatcher(exporter=exporter, dispatch_table=dispatch_table)
+    battle_id, character_id = str(EntityID()), str(EntityID())
+    FailingOnceEventHandler.failed = False
+
+    event_dispatcher.publish(CharacterWonBattleEvent("Makima", battle_id, character_id))
+    with pytest.raises(ExceptionGroup):
+        await event_dispatcher.notify_all()
+    assert exporter.exported_events == 0
+
+    event_dispatcher.publish(CharacterWonBattleEvent("Makima", battle_id, character_id))
+    await event_dispatcher.notify_all()
+    exporter.close()
+
+    assert exporter.exported_events == 1
+    assert len((tmp_path / "events.jsonl").read_text().splitlines()) == 1
@@ -0,0 +1,91 @@
+import pytest
+import trio.testing
+
+from domain import EventHandler
+from domain.battle.events import BATTLE_EVENT_HANDLERS, CharacterLostBattleEvent, CharacterWonBattleEvent, EventFactory
+from domain.battle.events.event_handlers import NotifyEvolutionEventHandler, NotifyQuestEventHandler
+from domain.battle.events.mediator import CharacterWonBattleMediator
+from domain.battle_event_dispatcher import BattleEventDispatcher
+from domain.event_handler_registry import EventHandlerRegistry
+from domain.value_objects import EntityID
+
+
+class RecordingEventHandler(EventHandler):
+    handled: list[str] = []
+
+    async def handle(self) -> None:
+        self.handled.append(self.event.payload.character_name)  # type: ignore[attr-defined]
+
+
+def test_registry_compiles_an_immutable_dispatch_table() -> None:
+    registry = EventHandlerRegistry().register(
+        CharacterWonBattleEvent, NotifyQuestEventHandler, NotifyQuestEventHandler
+    )
+    dispatch_table = registry.compile()
+    registry.register(CharacterWonBattleEvent, NotifyEvolutionEventHandler)
+
+    assert dispatch_table.handlers_for(CharacterWonBattleEvent) == (NotifyQuestEventHandler,)
+    assert dispatch_table.handlers_for(CharacterLostBattleEvent) == ()
+    assert dispatch_table[CharacterWonBattleEvent] == (NotifyQuestEventHandler,)
+    with pytest.raises(TypeError):
+        dispatch_table._DispatchTable__entries[CharacterLostBattleEvent] = ()  # type: ignore[attr-defined]
+
+
+def test_battle_dispatch_table() -> None:
+    assert dict(BATTLE_EVENT_HANDLERS) == {
+        CharacterWonBattleEvent: (NotifyEvolutionEventHandler, NotifyQuestEventHandler),
+        CharacterLostBattleEvent: (NotifyQuestEventHandler,),
+    }
+
+
+async def test_published_events_are_delivered_through_the_dispatch_table(
+    autojump_clock: trio.testing.MockClock,
+) -> None:
+    RecordingEventHandler.handled = []
+    dispatch_table = EventHandlerRegistry().register(CharacterWonBattleEvent, RecordingEventHandler).compile()
+    event_dispatcher = BattleEventDispatcher(dispatch_table=dispatch_table)
+
+    async with EventFactory(event_dispatcher, EntityID()) as event_factory:
+        event_factory.character_won_battle("Makima")
+        event_factory.character_won_battle("Power")
+        event_factory.character_lost_battle("Aizen")
+        assert event_dispatcher.has(CharacterWonBattleEvent)
+
+    assert sorted(RecordingEventHandler.handled) == ["Makima", "Power"]
+    assert event_dispatcher.was_dispatched(CharacterLostBattleEvent)
+    assert len(event_dispatcher.dispatched_domain_events()) == 3
+    assert not event_dispatcher.has(CharacterWonBattleEvent)
+
+
+async def test_unregistered_handlers_are_not_notified(autojump_clock: trio.testing.MockClock) -> None:
+    RecordingEventHandler.handled = []
+    dispatch_table = EventHandlerRegistry().register(CharacterWonBattleEvent, RecordingEventHandler).compile()
+    event_dispatcher = BattleEventDispatcher(dispatch_table=dispatch_table)
+    event = CharacterWonBattleEvent("Makima")
+
+    event_dispatcher.publish(event)
+    event_dispatcher.unregister(event, RecordingEventHandler)
+    await event_dispatcher.notify(event)
+
+    assert RecordingEventHandler.handled == []
+    assert dispatch_table.handlers_for(CharacterWonBattleEvent) == (RecordingEventHandler,)
+    assert event_dispatcher.was_dispatched(CharacterWonBattleEvent)
+
+    event_dispatcher.publish(CharacterWonBattleEvent("Power"))
+    await event_dispatcher.notify_all()
+    assert RecordingEventHandler.handled == ["Power"]
+
+
+async def test_dispatched_events_are_the_registered_mediators(autojump_clock: trio.testing.MockClock) -> None:
+    event_dispatcher = BattleEventDispatcher()
+    event_mediator = CharacterWonBattleMediator(CharacterWonBattleEvent("Makima"))
+    event_dispatcher.register(event_mediator)
+    event_dispatcher.publish(CharacterLostBattleEvent("Aizen"))
+
+    await event_dispatcher.notify_all()
+
+    assert event_dispatcher.dispatched_events() == [event_mediator]
+    assert {event.event_name for event in event_dispatcher.dispatched_domain_events()} == {
+        CharacterWonBattleEvent.event_name,
+        CharacterLostBattleEvent.event_name,
+    }
@@ -0,0 +1,89 @@
+import gc
+import tracemalloc
+
+import anyio
+import pytest
+import trio.testing
+
+from domain._tests.fakes import fake_attack_move, fake_duel
+from domain.battle.events import CharacterLostBattleEvent, CharacterWonBattleEvent
+from domain.battle_event_dispatcher import STRONGLY_RETAINED_EVENTS, BattleEventDispatcher, EventRetentionEnum
+from domain.clock import VirtualClock
+from domain.event_dedup_index import EventDedupIndex
+from domain.partitioned_event_bus import PartitionedEventBus
+from domain.value_objects import EntityID
+
+WARM_UP_BATTLES = 200
+BATTLES = 500
+MAXIMUM_GROWTH_BYTES = 32 * 1024
+DEDUP_KEY_BYTES = 320
+
+
+async def play_battle(event_dispatcher: BattleEventDispatcher) -> None:
+    battle, first_character, second_character = fake_duel(event_dispatcher, seed=50)
+    for attacker, target in ((first_character, second_character), (second_character, first_character)) * 2:
+        if battle.is_ongoing:
+            battle.play_sync(fake_attack_move(attacker, target))
+    await battle.flush_events()
+    battle.teardown()
+
+
+async def test_weak_retention_releases_the_dispatched_events(autojump_clock: trio.testing.MockClock) -> None:
+    event_dispatcher = BattleEventDispatcher(retention=EventRetentionEnum.WEAK)
+    event_dispatcher.publish(CharacterWonBattleEvent("Makima", str(EntityID())))
+
+    await event_dispatcher.notify_all()
+    gc.collect()
+
+    assert event_dispatcher.dispatched_domain_events() == []
+    assert event_dispatcher.was_dispatched(CharacterWonBattleEvent)
+
+
+def test_teardown_forgets_the_events_of_a_battle() -> None:
+    finished_battle_id, ongoing_battle_id = EntityID(), EntityID()
+    for event_dispatcher in (BattleEventDispatcher(), PartitionedEventBus()):
+        event_dispatcher.publish(CharacterWonBattleEvent("Makima", str(finished_battle_id)))
+        event_dispatcher.publish(CharacterLostBattleEvent("Aizen", str(ongoing_battle_id)))
+
+        event_dispatcher.teardown(finished_battle_id)
+
+        assert not event_dispatcher.has(CharacterWonBattleEvent)
+        assert event_dispatcher.has(CharacterLostBattleEvent)
+
+
+def test_strong_retention_keeps_the_latest_events_only() -> None:
+    event_dispatcher = BattleEventDispatcher()
+    events = [CharacterWonBattleEvent(f"Character {index}") for index in range(STRONGLY_RETAINED_EVENTS + 10)]
+    for event in events:
+        event_dispatcher.publish(event)
+
+    anyio.run(event_dispatcher.notify_all, backend="asyncio")
+
+    assert len(event_dispatcher.dispatched_domain_events()) == STRONGLY_RETAINED_EVENTS
+    assert all(event in event_dispatcher.dispatched_domain_events() for event in events[-10:])
+
+
+@pytest.mark.parametrize("retention", [EventRetentionEnum.STRONG, EventRetentionEnum.WEAK])
+async def test_finished_battles_do_not_retain_memory(
+    retention: EventRetentionEnum, autojump_clock: trio.testing.MockClock
+) -> None:
+    dedup_index = EventDedupIndex()
+    event_dispatcher = BattleEventDispatcher(clock=VirtualClock(), dedup_index=dedup_index, retention=retention)
+    for _ in range(WARM_UP_BATTLES):
+        await play_battle(event_dispatcher)
+    gc.collect()
+    recorded_keys = len(dedup_index)
+    tracemalloc.start()
+    try:
+        baseline_bytes, _ = tracemalloc.get_traced_memory()
+        for _ in range(BATTLES):
+            await play_battle(event_dispatcher)
+        gc.collect()
+        current_bytes, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert event_dispatcher.was_dispatched(CharacterWonBattleEvent)
+    new_keys = len(dedup_index) - recorded_keys
+    assert new_keys == BATTLES
+    assert current_bytes - baseline_bytes < MAXIMUM_GROWTH_BYTES + new_keys * DEDUP_KEY_BYTES
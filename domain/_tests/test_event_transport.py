@@ -0,0 +1,83 @@
+import multiprocessing
+from queue import Full
+
+import anyio
+import pytest
+
+from domain import EventHandler
+from domain.battle.events import CharacterLostBattleEvent, CharacterWonBattleEvent, EventFactory
+from domain.battle_event_dispatcher import BattleEventDispatcher
+from domain.event_handler_registry import EventHandlerRegistry
+from domain.event_transport import EventAggregator, EventTransport, ForwardingEventDispatcher
+from domain.value_objects import EntityID
+
+WORKERS = 3
+BATTLES_PER_WORKER = 5
+
+
+class RecordingEventHandler(EventHandler):
+    handled: list[str] = []
+
+    async def handle(self) -> None:
+        self.handled.append(self.event.payload.character_name)  # type: ignore[attr-defined]
+
+
+def play_worker_battles(transport: EventTransport, worker: int) -> None:
+    async def play() -> None:
+        event_dispatcher = ForwardingEventDispatcher(transport, batch_size=2)
+        for battle in range(BATTLES_PER_WORKER):
+            async with EventFactory(event_dispatcher, EntityID()) as event_factory:
+                event_factory.character_won_battle(f"Winner {worker}.{battle}")
+                event_factory.character_lost_battle(f"Loser {worker}.{battle}")
+        await event_dispatcher.close()
+
+    anyio.run(play)
+
+
+def test_aggregator_runs_the_handlers_of_every_worker() -> None:
+    RecordingEventHandler.handled = []
+    context = multiprocessing.get_context("spawn")
+    transport = EventTransport(max_batches=2, context=context)
+    dispatch_table = (
+        EventHandlerRegistry()
+        .register(CharacterWonBattleEvent, RecordingEventHandler)
+        .register(CharacterLostBattleEvent, RecordingEventHandler)
+        .compile()
+    )
+    aggregator = EventAggregator(transport, BattleEventDispatcher(dispatch_table=dispatch_table), workers=WORKERS)
+    processes = [context.Process(target=play_worker_battles, args=(transport, worker)) for worker in range(WORKERS)]
+    for process in processes:
+        process.start()
+
+    anyio.run(aggregator.run, 30)
+    for process in processes:
+        process.join()
+
+    assert aggregator.received_events == WORKERS * BATTLES_PER_WORKER * 2
+    assert sorted(RecordingEventHandler.handled) == sorted(
+        f"{role} {worker}.{battle}"
+        for role in ("Winner", "Loser")
+        for worker in range(WORKERS)
+        for battle in range(BATTLES_PER_WORKER)
+    )
+
+
+def test_full_transport_applies_backpressure() -> None:
+    transport = EventTransport(max_batches=1)
+    event_dispatcher = ForwardingEventDispatcher(transport, batch_size=1, send_timeout=0.01)
+
+    async def publish_two_events() -> None:
+        event_dispatcher.publish(CharacterWonBattleEvent("Makima"))
+        event_dispatcher.publish(CharacterLostBattleEvent("Aizen"))
+        await event_dispatcher.notify_all()
+
+    with pytest.raises(Full):
+        anyio.run(publish_two_events)
+    assert event_dispatcher.forwarded_events == 1
+    assert event_dispatcher.outgoing_events == 1
+    assert [event.event_name for event in transport.receive(timeout=1) or []] == ["CharacterWonBattleEvent"]
+
+    anyio.run(event_dispatcher.flush)
+    assert event_dispatcher.forwarded_events == 2
+    assert event_dispatcher.outgoing_events == 0
+    assert [event.event_name for event in transport.receive(timeout=1) or []] == ["CharacterLostBattleEvent"]
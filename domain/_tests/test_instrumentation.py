@@ -0,0 +1,89 @@
+import trio.testing
+
+from domain._tests.fakes import fake_attack_move, fake_character, fake_team
+from domain.battle import Battle
+from domain.battle.value_objects import BattleAllies, PassTurnAlgorithmEnum
+from domain.battle_event_dispatcher import BattleEventDispatcher
+from domain.instrumentation import DEFAULT_EXPORT_BUCKETS, DISABLED_INSTRUMENTATION, Instrumentation, LatencyHistogram
+from domain.value_objects import EntityID
+
+
+def test_latency_histogram_keeps_the_relative_error_bounded() -> None:
+    histogram = LatencyHistogram(precision_bits=5)
+    for value in range(1, 100_001):
+        histogram.record(value)
+
+    assert histogram.count == 100_000
+    assert histogram.total == sum(range(1, 100_001))
+    for percentile in (50, 90, 99):
+        exact_value = percentile * 1_000
+        assert abs(histogram.percentile(percentile) - exact_value) / exact_value <= 1 / 16
+    assert histogram.percentile(100) == 100_000
+    assert histogram.as_dict()["min_ns"] == 1
+    assert histogram.cumulative_buckets()[-1] == (histogram.cumulative_buckets()[-1][0], 100_000)
+
+
+def test_count_at_most_is_a_lower_bound() -> None:
+    histogram = LatencyHistogram(precision_bits=5)
+    for value in (64, 65, 66, 67):
+        histogram.record(value)
+
+    assert histogram.count_at_most(65) == 0
+    assert histogram.count_at_most(67) == 4
+
+    histogram = LatencyHistogram(precision_bits=5)
+    for value in range(1, 100_001):
+        histogram.record(value)
+
+    for upper_bound in (31, 100, 1_000, 12_345, 99_999):
+        exact_count = upper_bound
+        assert exact_count * (1 - 1 / 16) <= histogram.count_at_most(upper_bound) <= exact_count
+
+
+def test_instrumentation_exports_prometheus_text() -> None:
+    instrumentation = Instrumentation(namespace="test")
+    for value in (10, 20, 30):
+        instrumentation.histogram("move").record(value)
+    with instrumentation.measure("rest"):
+        ...
+    with DISABLED_INSTRUMENTATION.measure("rest"):
+        ...
+
+    exported = instrumentation.to_prometheus()
+    assert "# TYPE test_phase_duration_seconds histogram" in exported
+    assert 'test_phase_duration_seconds_bucket{phase="move",le="1e-06"} 3' in exported
+    assert exported.count('phase="rest",le=') == len(DEFAULT_EXPORT_BUCKETS) + 1
+    assert exported.count('phase="move",le=') == len(DEFAULT_EXPORT_BUCKETS) + 1
+    assert 'test_phase_duration_seconds_bucket{phase="move",le="+Inf"} 3' in exported
+    assert 'test_phase_duration_seconds_count{phase="rest"} 1' in exported
+    assert DISABLED_INSTRUMENTATION.as_dict() == {}
+
+
+async def test_battle_phases_are_instrumented(autojump_clock: trio.testing.MockClock) -> None:
+    instrumentation = Instrumentation()
+    first_character = fake_character("First", 50, combat_technique_quantity=2, spell_quantity=0)
+    second_character = fake_character("Second", 50, combat_technique_quantity=2, spell_quantity=0)
+    battle = (
+        Battle.create_new(
+            event_dispatcher=BattleEventDispatcher(instrumentation),
+            entity_id=EntityID(),
+            is_battle_ongoing=False,
+            instrumentation=instrumentation,
+        )
+        .add_battle_allies(BattleAllies.create_new().add_team(fake_team(first_character)).build())
+        .add_battle_allies(BattleAllies.create_new().add_team(fake_team(second_character)).build())
+        .specify_pass_turn_algorithm(PassTurnAlgorithmEnum.REGULAR_PASS_TURN)
+    )
+
+    await battle.play(fake_attack_move(first_character, second_character))
+    await battle.play(fake_attack_move(second_character, first_character))
+    await battle.play(fake_attack_move(first_character, second_character))
+
+    phases = instrumentation.as_dict()
+    assert {phase: phases[phase]["count"] for phase in ("next_turn", "move", "rest", "notify")} == {
+        "next_turn": 3,
+        "move": 3,
+        "rest": 3,
+        "notify": 3,
+    }
+    assert phases["dispatcher.notify_all"]["count"] == 2
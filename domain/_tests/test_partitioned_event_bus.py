@@ -0,0 +1,199 @@
+import pytest
+import trio
+import trio.testing
+
+from domain import EventHandler
+from domain.battle.events import CharacterLostBattleEvent, CharacterWonBattleEvent
+from domain.event_handler_registry import EventHandlerRegistry
+from domain.partitioned_event_bus import PartitionedEventBus
+from domain.value_objects import EntityID
+
+
+class RecordingEventHandler(EventHandler):
+    handled: list[str] = []
+
+    async def handle(self) -> None:
+        self.handled.append(self.event.payload.character_name)  # type: ignore[attr-defined]
+
+
+def recording_event_bus(quantum: int = 1, workers: int = 1) -> PartitionedEventBus:
+    RecordingEventHandler.handled = []
+    dispatch_table = (
+        EventHandlerRegistry()
+        .register(CharacterWonBattleEvent, RecordingEventHandler)
+        .register(CharacterLostBattleEvent, RecordingEventHandler)
+        .compile()
+    )
+    return PartitionedEventBus(dispatch_table=dispatch_table, quantum=quantum, workers=workers)
+
+
+async def test_partitions_are_drained_round_robin(autojump_clock: trio.testing.MockClock) -> None:
+    event_bus = recording_event_bus()
+    burst_battle_id, quiet_battle_id = str(EntityID()), str(EntityID())
+    for index in range(3):
+        event_bus.publish(CharacterWonBattleEvent(f"Burst {index}", burst_battle_id))
+    event_bus.publish(CharacterLostBattleEvent("Quiet", quiet_battle_id))
+
+    assert event_bus.partitions == 2
+    assert event_bus.pending(burst_battle_id) == 3
+    assert event_bus.has(CharacterLostBattleEvent)
+
+    await event_bus.notify_all()
+
+    assert RecordingEventHandler.handled == ["Burst 0", "Quiet", "Burst 1", "Burst 2"]
+    assert event_bus.partitions == 0
+    assert not event_bus.has(CharacterWonBattleEvent)
+    assert event_bus.was_dispatched(CharacterLostBattleEvent)
+
+
+async def test_quantum_events_of_each_partition_per_round(autojump_clock: trio.testing.MockClock) -> None:
+    event_bus = recording_event_bus(quantum=2)
+    burst_battle_id, quiet_battle_id = str(EntityID()), str(EntityID())
+    for index in range(3):
+        event_bus.publish(CharacterWonBattleEvent(f"Burst {index}", burst_battle_id))
+    event_bus.publish(CharacterWonBattleEvent("Quiet", quiet_battle_id))
+
+    await event_bus.notify_all()
+
+    assert RecordingEventHandler.handled == ["Burst 0", "Burst 1", "Quiet", "Burst 2"]
+
+
+async def test_notify_delivers_an_event_of_its_partition(autojump_clock: trio.testing.MockClock) -> None:
+    event_bus = recording_event_bus()
+    first_battle_id, second_battle_id = str(EntityID()), str(EntityID())
+    event_bus.publish(CharacterWonBattleEvent("First", first_battle_id))
+    event_bus.publish(CharacterWonBattleEvent("Second", second_battle_id))
+
+    await event_bus.notify(CharacterWonBattleEvent("Second", second_battle_id))
+
+    assert RecordingEventHandler.handled == ["Second"]
+    assert event_bus.pending(second_battle_id) == 0
+    assert event_bus.partitions == 1
+
+    await event_bus.notify_all()
+
+    assert RecordingEventHandler.handled == ["Second", "First"]
+
+
+class SlowEventHandler(EventHandler):
+    handled_at: dict[str, float] = {}
+
+    async def handle(self) -> None:
+        character_name = self.event.payload.character_name  # type: ignore[attr-defined]
+        await trio.sleep(10 if character_name == "Slow" else 1)
+        self.handled_at[character_name] = trio.current_time()
+
+
+async def test_a_slow_partition_does_not_block_the_others(autojump_clock: trio.testing.MockClock) -> None:
+    SlowEventHandler.handled_at = {}
+    event_bus = PartitionedEventBus(
+        dispatch_table=EventHandlerRegistry().register(CharacterWonBattleEvent, SlowEventHandler).compile()
+    )
+    slow_battle_id, fast_battle_id = str(EntityID()), str(EntityID())
+    event_bus.publish(CharacterWonBattleEvent("Slow", slow_battle_id))
+    for index in range(5):
+        event_bus.publish(CharacterWonBattleEvent(f"Fast {index}", fast_battle_id))
+    start = trio.current_time()
+
+    await event_bus.notify_all()
+
+    assert SlowEventHandler.handled_at["Fast 4"] - start == 5
+    assert SlowEventHandler.handled_at["Slow"] - start == 10
+    assert event_bus.partitions == 0
+
+
+async def test_a_battle_keeps_the_order_of_its_events(autojump_clock: trio.testing.MockClock) -> None:
+    SlowEventHandler.handled_at = {}
+    event_bus = PartitionedEventBus(
+        dispatch_table=EventHandlerRegistry().register(CharacterWonBattleEvent, SlowEventHandler).compile(),
+        quantum=3,
+    )
+    battle_id = str(EntityID())
+    event_bus.publish(CharacterWonBattleEvent("Slow", battle_id))
+    event_bus.publish(CharacterWonBattleEvent("Fast", battle_id))
+
+    await event_bus.notify_all()
+
+    assert SlowEventHandler.handled_at["Slow"] < SlowEventHandler.handled_at["Fast"]
+
+
+class ConcurrencyEventHandler(EventHandler):
+    running = 0
+    max_running = 0
+
+    async def handle(self) -> None:
+        ConcurrencyEventHandler.running += 1
+        ConcurrencyEventHandler.max_running = max(ConcurrencyEventHandler.max_running, self.running)
+        await trio.sleep(1)
+        ConcurrencyEventHandler.running -= 1
+
+
+async def test_the_workers_are_bounded(autojump_clock: trio.testing.MockClock) -> None:
+    ConcurrencyEventHandler.max_running = 0
+    event_bus = PartitionedEventBus(
+        dispatch_table=EventHandlerRegistry().register(CharacterWonBattleEvent, ConcurrencyEventHandler).compile(),
+        workers=4,
+    )
+    for index in range(100):
+        event_bus.publish(CharacterWonBattleEvent(f"Character {index}", str(EntityID())))
+
+    await event_bus.notify_all()
+
+    assert ConcurrencyEventHandler.max_running == 4
+    assert event_bus.partitions == 0
+
+
+class BrokenEventHandler(EventHandler):
+    handled: list[str] = []
+
+    async def handle(self) -> None:
+        character_name = self.event.payload.character_name  # type: ignore[attr-defined]
+        if character_name == "Broken":
+            raise RuntimeError(character_name)
+        self.handled.append(character_name)
+
+
+async def test_a_failing_handler_only_holds_its_own_battle(autojump_clock: trio.testing.MockClock) -> None:
+    BrokenEventHandler.handled = []
+    event_bus = PartitionedEventBus(
+        dispatch_table=EventHandlerRegistry().register(CharacterWonBattleEvent, BrokenEventHandler).compile(),
+        quantum=2,
+    )
+    broken_battle_id, healthy_battle_id = str(EntityID()), str(EntityID())
+    event_bus.publish(CharacterWonBattleEvent("First", broken_battle_id))
+    event_bus.publish(CharacterWonBattleEvent("Broken", broken_battle_id))
+    event_bus.publish(CharacterWonBattleEvent("After", broken_battle_id))
+    for index in range(3):
+        event_bus.publish(CharacterWonBattleEvent(f"Healthy {index}", healthy_battle_id))
+
+    with pytest.raises(ExceptionGroup):
+        await event_bus.notify_all()
+
+    assert set(BrokenEventHandler.handled) == {"First", "Healthy 0", "Healthy 1", "Healthy 2"}
+    assert event_bus.pending(broken_battle_id) == 2
+    assert event_bus.pending(healthy_battle_id) == 0
+
+    BrokenEventHandler.handled = []
+    with pytest.raises(ExceptionGroup):
+        await event_bus.notify_all()
+    assert BrokenEventHandler.handled == []
+    assert event_bus.pending(broken_battle_id) == 2
+
+
+async def test_notify_battle_only_drains_its_partition(autojump_clock: trio.testing.MockClock) -> None:
+    event_bus = recording_event_bus()
+    first_battle_id, second_battle_id = str(EntityID()), str(EntityID())
+    for index in range(3):
+        event_bus.publish(CharacterWonBattleEvent(f"First {index}", first_battle_id))
+    event_bus.publish(CharacterWonBattleEvent("Second", second_battle_id))
+
+    await event_bus.notify_battle(first_battle_id)
+
+    assert RecordingEventHandler.handled == ["First 0", "First 1", "First 2"]
+    assert event_bus.pending(first_battle_id) == 0
+    assert event_bus.pending(second_battle_id) == 1
+
+    await event_bus.notify_all()
+
+    assert RecordingEventHandler.handled == ["First 0", "First 1", "First 2", "Second"]
+    assert event_bus.partitions == 0
@@ -0,0 +1,61 @@
+import trio.testing
+
+from domain._tests.fakes import fake_attack_move, fake_duel
+from domain.battle.events import CharacterWonBattleEvent
+from domain.battle_event_dispatcher import BattleEventDispatcher
+from domain.tracing import DISABLED_TRACER, InMemorySpanExporter, Tracer, current_tracer, use_tracer
+
+
+async def test_dispatcher_traces_the_event_pipeline(autojump_clock: trio.testing.MockClock) -> None:
+    exporter = InMemorySpanExporter()
+    event_dispatcher = BattleEventDispatcher(tracer=Tracer(exporter))
+    battle, first_character, second_character = fake_duel(event_dispatcher, seed=50)
+    for attacker, target in ((first_character, second_character), (second_character, first_character)) * 2:
+        if battle.is_ongoing:
+            battle.play_sync(fake_attack_move(attacker, target))
+
+    await battle.flush_events()
+
+    dispatch_span, *handle_spans = sorted(exporter.spans, key=lambda span: span.start_ns)
+    assert dispatch_span.name == "event.dispatch"
+    assert dispatch_span.parent_id is None
+    assert dispatch_span.attributes == {
+        "event_name": CharacterWonBattleEvent.event_name,
+        "battle_id": str(battle.entity_id),
+    }
+    assert {span.attributes["handler"] for span in handle_spans} == {
+        "NotifyEvolutionEventHandler",
+        "NotifyQuestEventHandler",
+    }
+    assert all(span.parent_id == dispatch_span.span_id for span in handle_spans)
+    assert all(span.attributes["battle_id"] == str(battle.entity_id) for span in handle_spans)
+    assert [handler_latency.calls for handler_latency in exporter.slowest_handlers()] == [1, 1]
+    assert len(exporter.slowest_handlers(limit=1)) == 1
+
+
+async def test_current_tracer_covers_the_battle_notification(autojump_clock: trio.testing.MockClock) -> None:
+    exporter = InMemorySpanExporter()
+    battle, first_character, second_character = fake_duel(BattleEventDispatcher(), seed=50)
+
+    with use_tracer(Tracer(exporter)):
+        await battle.play(fake_attack_move(first_character, second_character))
+        await battle.play(fake_attack_move(second_character, first_character))
+        await battle.play(fake_attack_move(first_character, second_character))
+    assert current_tracer() is DISABLED_TRACER
+
+    root_spans = [span for span in exporter.spans if span.parent_id is None]
+    assert {span.name for span in root_spans} == {"battle.events"}
+    assert {span.name for span in exporter.spans} == {"battle.events", "event.dispatch", "event.handle"}
+
+
+def test_in_memory_exporter_keeps_the_latest_spans_only() -> None:
+    exporter = InMemorySpanExporter(max_spans=3)
+    tracer = Tracer(exporter)
+    for _ in range(5):
+        with tracer.span("event.handle", handler="NotifyQuestEventHandler"):
+            ...
+
+    assert len(exporter.spans) == 3
+    assert [handler_latency.calls for handler_latency in exporter.slowest_handlers()] == [5]
+    exporter.clear()
+    assert exporter.slowest_handlers() == []
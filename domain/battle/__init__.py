@@ -1,7 +1,8 @@
 from .entity import Battle
-from .interfaces import IBattle
+from .interfaces import IBattle, IBattleRepository
 
 __all__ = [
     "Battle",
     "IBattle",
+    "IBattleRepository",
 ]
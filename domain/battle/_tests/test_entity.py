@@ -0,0 +1,210 @@
+from typing import Callable
+
+import anyio
+import pytest
+import trio.testing
+
+from domain._tests.fakes import (
+    fake_attack_move,
+    fake_battle,
+    fake_battle_allies,
+    fake_duel,
+    fake_multi_target_character,
+    fake_team,
+)
+from domain.battle.events import CharacterWonBattleEvent
+from domain.battle.exceptions import BattleIsNotHappeningException
+from domain.battle.value_objects import IMoveBuilder, MoveActionEnum, PassTurnAlgorithmEnum, StatusEffectKindEnum
+from domain.battle_event_dispatcher import BattleEventDispatcher
+from domain.character import ICharacter
+from domain.character.exceptions import TooManyTargetsException
+
+
+async def test_play_many_stops_when_the_battle_ends(autojump_clock: trio.testing.MockClock) -> None:
+    event_dispatcher = BattleEventDispatcher()
+    battle, first_character, second_character = fake_duel(event_dispatcher, seed=50)
+    first_attack = fake_attack_move(first_character, second_character)
+    second_attack = fake_attack_move(second_character, first_character)
+
+    moves_records = await battle.play_many([first_attack, second_attack, first_attack, second_attack])
+
+    assert len(moves_records) == 3
+    assert [records[0].actor_id for records in moves_records] == [
+        first_character.entity_id,
+        second_character.entity_id,
+        first_character.entity_id,
+    ]
+    assert all(records[0].action is MoveActionEnum.ATTACK for records in moves_records)
+    assert not second_character.is_alive
+    assert not battle.is_ongoing
+    assert event_dispatcher.was_dispatched(CharacterWonBattleEvent)
+
+
+async def test_play_many_keeps_the_battle_going(autojump_clock: trio.testing.MockClock) -> None:
+    event_dispatcher = BattleEventDispatcher()
+    battle, first_character, second_character = fake_duel(event_dispatcher, seed=10)
+
+    moves_records = await battle.play_many([fake_attack_move(first_character, second_character)])
+
+    assert len(moves_records) == 1
+    assert battle.is_ongoing
+    assert second_character.current_life_points == 90
+    assert not event_dispatcher.was_dispatched(CharacterWonBattleEvent)
+
+
+async def test_play_sync_defers_the_events_until_flushed(autojump_clock: trio.testing.MockClock) -> None:
+    event_dispatcher = BattleEventDispatcher()
+    battle, first_character, second_character = fake_duel(event_dispatcher, seed=50)
+
+    battle.play_sync(fake_attack_move(first_character, second_character))
+    battle.play_sync(fake_attack_move(second_character, first_character))
+    battle.play_sync(fake_attack_move(first_character, second_character))
+
+    assert not battle.is_ongoing
+    assert event_dispatcher.has(CharacterWonBattleEvent)
+    assert not event_dispatcher.was_dispatched(CharacterWonBattleEvent)
+    with pytest.raises(BattleIsNotHappeningException):
+        battle.play_sync(fake_attack_move(second_character, first_character))
+
+    await battle.flush_events()
+
+    assert not event_dispatcher.has(CharacterWonBattleEvent)
+    assert event_dispatcher.was_dispatched(CharacterWonBattleEvent)
+
+
+async def test_flush_events_only_delivers_the_events_of_the_battle(autojump_clock: trio.testing.MockClock) -> None:
+    event_dispatcher = BattleEventDispatcher()
+    battles = [fake_duel(event_dispatcher, seed=50) for _ in range(2)]
+    for battle, first_character, second_character in battles:
+        battle.play_sync(fake_attack_move(first_character, second_character))
+        battle.play_sync(fake_attack_move(second_character, first_character))
+        battle.play_sync(fake_attack_move(first_character, second_character))
+
+    await battles[0][0].flush_events()
+
+    assert event_dispatcher.was_dispatched(CharacterWonBattleEvent)
+    assert event_dispatcher.has(CharacterWonBattleEvent)
+    assert {str(event.payload.battle_id) for event in event_dispatcher.dispatched_domain_events()} == {  # type: ignore[attr-defined]
+        str(battles[0][0].entity_id)
+    }
+
+    await battles[1][0].flush_events()
+
+    assert not event_dispatcher.has(CharacterWonBattleEvent)
+
+
+def test_battle_plays_natively_on_asyncio() -> None:
+    event_dispatcher = BattleEventDispatcher()
+    battle, first_character, second_character = fake_duel(event_dispatcher, seed=10)
+
+    async def play_two_turns() -> None:
+        await battle.play(fake_attack_move(first_character, second_character))
+        await battle.play(fake_attack_move(second_character, first_character))
+
+    anyio.run(play_two_turns, backend="asyncio")
+
+    assert battle.is_ongoing
+    assert len(battle.move_log) == 2
+    assert first_character.current_life_points == second_character.current_life_points == 90
+
+
+async def test_area_of_effect_attacks_end_the_battle(autojump_clock: trio.testing.MockClock) -> None:
+    event_dispatcher = BattleEventDispatcher()
+    attackers = tuple(
+        fake_multi_target_character(f"Attacker {index}", damage=50, max_targets=None) for index in range(3)
+    )
+    defenders = tuple(fake_multi_target_character(f"Defender {index}", damage=1, max_targets=1) for index in range(3))
+    battle = fake_battle(
+        event_dispatcher,
+        PassTurnAlgorithmEnum.REGULAR_PASS_TURN,
+        fake_battle_allies(fake_team(*attackers)),
+        fake_battle_allies(fake_team(*defenders)),
+    )
+
+    playing_attackers = iter(attackers)
+
+    def sweep(move_builder: IMoveBuilder) -> None:
+        move_builder.attack_all(next(next(playing_attackers).available_combat_techniques))
+
+    def rest(move_builder: IMoveBuilder) -> None:
+        move_builder.rest()
+
+    moves_records = await battle.play_many([sweep, rest, sweep, rest])
+
+    assert len(moves_records) == 3
+    assert [record.damage for record in moves_records[0]] == [50, 50, 50]
+    assert not any(defender.is_alive for defender in defenders)
+    assert not battle.is_ongoing
+    assert {event.payload.character_name for event in event_dispatcher.dispatched_domain_events()} == {  # type: ignore[attr-defined]
+        attacker.name for attacker in attackers
+    }
+
+
+def test_multi_target_attacks_are_bounded_by_the_skill() -> None:
+    attacker = fake_multi_target_character("Attacker", damage=10, max_targets=2)
+    defenders = tuple(fake_multi_target_character(f"Defender {index}", damage=1, max_targets=1) for index in range(3))
+    battle = fake_battle(
+        BattleEventDispatcher(),
+        PassTurnAlgorithmEnum.REGULAR_PASS_TURN,
+        fake_battle_allies(fake_team(attacker)),
+        fake_battle_allies(fake_team(*defenders)),
+    )
+    combat_technique = next(attacker.available_combat_techniques)
+
+    def hit(*targets: ICharacter) -> Callable[[IMoveBuilder], None]:
+        def move(move_builder: IMoveBuilder) -> None:
+            move_builder.attack_many([target.entity_id for target in targets], combat_technique).rest()
+
+        return move
+
+    def rest(move_builder: IMoveBuilder) -> None:
+        move_builder.rest()
+
+    with pytest.raises(TooManyTargetsException):
+        battle.play_sync(hit(*defenders))
+
+    assert [defender.current_life_points for defender in defenders] == [100, 100, 100]
+    battle.play_sync(rest)
+    battle.play_sync(hit(defenders[0], defenders[2], defenders[0]))
+    assert [defender.current_life_points for defender in defenders] == [90, 100, 90]
+
+
+async def test_poison_ends_the_battle(autojump_clock: trio.testing.MockClock) -> None:
+    event_dispatcher = BattleEventDispatcher()
+    battle, first_character, second_character = fake_duel(event_dispatcher, seed=10)
+    battle.apply_status_effect(second_character, StatusEffectKindEnum.POISON, magnitude=50, duration=5)
+
+    def rest(move_builder: IMoveBuilder) -> None:
+        move_builder.rest()
+
+    moves_records = await battle.play_many([rest] * 5)
+
+    assert len(moves_records) == 1
+    assert not second_character.is_alive
+    assert first_character.current_life_points == 100
+    assert not battle.is_ongoing
+    assert event_dispatcher.was_dispatched(CharacterWonBattleEvent)
+
+
+async def test_poison_finishes_the_battle_before_the_move(autojump_clock: trio.testing.MockClock) -> None:
+    event_dispatcher = BattleEventDispatcher()
+    battle, first_character, second_character = fake_duel(event_dispatcher, seed=10)
+    battle.apply_status_effect(second_character, StatusEffectKindEnum.POISON, magnitude=100, duration=1)
+
+    await battle.play(fake_attack_move(first_character, second_character))
+
+    assert not second_character.is_alive
+    assert not battle.is_ongoing
+    assert len(battle.move_log) == 0
+    assert event_dispatcher.was_dispatched(CharacterWonBattleEvent)
+
+    sync_event_dispatcher = BattleEventDispatcher()
+    sync_battle, first_character, second_character = fake_duel(sync_event_dispatcher, seed=10)
+    sync_battle.apply_status_effect(second_character, StatusEffectKindEnum.POISON, magnitude=100, duration=1)
+
+    sync_battle.play_sync(fake_attack_move(first_character, second_character))
+    await sync_battle.flush_events()
+
+    assert not sync_battle.is_ongoing
+    assert len(sync_battle.move_log) == 0
+    assert sync_event_dispatcher.was_dispatched(CharacterWonBattleEvent)
@@ -1,11 +1,22 @@
 """Module describes the Battle root entity and its direct dependencies"""
-from typing import Callable
+from contextlib import suppress
+from typing import Callable, Sequence
 
-from trio import open_nursery
-from trio.to_thread import run_sync
+from anyio import create_task_group
+from anyio.to_thread import run_sync
 
-from domain.battle.value_objects import IMoveBuilder, Move
+from domain.battle.value_objects import (
+    IMoveBuilder,
+    MoveContext,
+    MoveLog,
+    MoveRecord,
+    StatusEffect,
+    StatusEffectEngine,
+    StatusEffectKindEnum,
+)
 from domain.character import ICharacter
+from domain.damage_modifiers import DamageModifiers
+from domain.instrumentation import DISABLED_INSTRUMENTATION, Instrumentation
 from domain.interfaces import AggregateRoot, EventDispatcher, IEntityID
 from domain.skill.combat_technique.exceptions import CombatTechniqueIsAlreadyReady
 from domain.skill.spell.exceptions import SpellIsAlreadyReady
@@ -28,10 +39,34 @@ class Battle(AggregateRoot, IBattleFactory, IBattle):
     def __init__(self) -> None:
         raise NotImplementedError("Cannot instantiate directly")
 
-    def _init(self, event_dispatcher: EventDispatcher, entity_id: IEntityID, is_battle_ongoing: bool) -> None:
+    def _init(
+        self,
+        event_dispatcher: EventDispatcher,
+        entity_id: IEntityID,
+        is_battle_ongoing: bool,
+        instrumentation: Instrumentation,
+        damage_modifiers: DamageModifiers | None,
+        damage_seed: int | None,
+    ) -> None:
         super().__init__(event_dispatcher, entity_id)
         self.__is_battle_ongoing = is_battle_ongoing
         self.__reason_for_ending = ""
+        self.__move_log = MoveLog()
+        self.__move_context = MoveContext(
+            self.__move_log, damage_modifiers.compile(damage_seed) if damage_modifiers is not None else None
+        )
+        self.__status_effects = StatusEffectEngine()
+        self.__turn = 0
+        self.__instrumentation = instrumentation
+
+    def __getstate__(self) -> dict[str, object]:
+        state = super().__getstate__()
+        state.pop("_Battle__instrumentation", None)
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__dict__.update(state)
+        self.__instrumentation = DISABLED_INSTRUMENTATION
 
     def _init_battle(self) -> None:
         """Changes attribute if it has not yet been started, indicating the start of the Battle"""
@@ -55,57 +90,162 @@ class Battle(AggregateRoot, IBattleFactory, IBattle):
 
     @classmethod
     def create_new(
-        cls, *, event_dispatcher: EventDispatcher, entity_id: IEntityID, is_battle_ongoing: bool
+        cls,
+        *,
+        event_dispatcher: EventDispatcher,
+        entity_id: IEntityID,
+        is_battle_ongoing: bool,
+        instrumentation: Instrumentation = DISABLED_INSTRUMENTATION,
+        damage_modifiers: DamageModifiers | None = None,
+        damage_seed: int | None = None,
     ) -> IBattleBuilder:
+        """Create a Battle, whose critical hits are reproducible when a damage seed is given"""
         new_battle = cls.__new__(cls)
-        new_battle._init(event_dispatcher, entity_id, is_battle_ongoing)
+        new_battle._init(event_dispatcher, entity_id, is_battle_ongoing, instrumentation, damage_modifiers, damage_seed)
         if not is_battle_ongoing:
             new_battle._init_battle()
         return _BattleSpecificationsBuilder(new_battle)
 
+    @property
+    def is_ongoing(self) -> bool:
+        return self.__is_battle_ongoing
+
+    @property
+    def move_log(self) -> MoveLog:
+        return self.__move_log
+
     async def play(self, build_playing_move: Callable[[IMoveBuilder], None]) -> None:
         """Pass the turn to the other player"""
         if not self.__is_battle_ongoing:
             raise BattleIsNotHappeningException()
-        current_character, enemies = self.__pass_turn_algorithm.next_turn()
-        move_builder = Move.create_new(current_character, enemies)
-        build_playing_move(move_builder)
-        async with open_nursery() as nursery:
-            nursery.start_soon(self._rest_characters, [current_character, *enemies])
-            nursery.start_soon(self._notify)
+        turn_characters = self.__play_turn(build_playing_move)
+        if turn_characters is None:
+            await self._notify()
+            return
+        current_character, enemies = turn_characters
+        async with create_task_group() as task_group:
+            task_group.start_soon(self._rest_characters, [current_character, *enemies])
+            task_group.start_soon(self._notify)
+
+    async def play_many(
+        self, build_playing_moves: Sequence[Callable[[IMoveBuilder], None]]
+    ) -> tuple[tuple[MoveRecord, ...], ...]:
+        """Play a sequence of turns in order, returning the records of each applied move
+
+        Characters rest inline after every turn and the finalists are only searched when a move
+        knocks out an enemy, so the notification happens once, when the batch ends the Battle.
+        Moves queued after the end of the Battle are not applied and have no records.
+        """
+        if not self.__is_battle_ongoing:
+            raise BattleIsNotHappeningException()
+        moves_records: list[tuple[MoveRecord, ...]] = []
+        for build_playing_move in build_playing_moves:
+            log_position = len(self.__move_log)
+            turn_characters = self.__play_turn(build_playing_move)
+            if turn_characters is None:
+                break
+            current_character, enemies = turn_characters
+            moves_records.append(self.__move_log.records_since(log_position))
+            self.__rest_characters_inline(current_character, enemies)
+            knocked_out = self.__status_effects.knocked_out or any(not enemy.is_alive for enemy in enemies)
+            if knocked_out and self.__pass_turn_algorithm.finalists:
+                break
+        await self._notify()
+        return tuple(moves_records)
+
+    def play_sync(self, build_playing_move: Callable[[IMoveBuilder], None]) -> None:
+        """Play a turn without any scheduler, leaving the delivery of the Battle events to flush_events"""
+        if not self.__is_battle_ongoing:
+            raise BattleIsNotHappeningException()
+        if turn_characters := self.__play_turn(build_playing_move):
+            self.__rest_characters_inline(*turn_characters)
+        with self.__instrumentation.measure("notify"):
+            if finalists := self.__pass_turn_algorithm.finalists:
+                self._finish_battle("Winner is found")
+                with EventFactory(self._event_dispatcher, self.entity_id) as event_factory:
+                    for character in finalists[0]:
+                        event_factory.character_won_battle(character.name, character.entity_id)
+                    for character in finalists[1]:
+                        event_factory.character_lost_battle(character.name, character.entity_id)
+
+    async def flush_events(self) -> None:
+        """Deliver the events registered by the turns played synchronously
+
+        Only the events of this Battle are delivered; the other Battles sharing the Event Dispatcher keep
+        theirs queued.
+        """
+        await self._event_dispatcher.notify_battle(self.entity_id)
+
+    def apply_status_effect(
+        self, target: ICharacter, kind: StatusEffectKindEnum, magnitude: int, duration: int, period: int = 1
+    ) -> StatusEffect:
+        """Apply an effect to the Character, acting from the next turn on for the given number of turns"""
+        return self.__status_effects.apply(kind, target, magnitude, duration, self.__turn, period)
+
+    def teardown(self) -> None:
+        """Release every event of the Battle the Event Dispatcher still references"""
+        self._event_dispatcher.teardown(self.entity_id)
+
+    def __play_turn(
+        self, build_playing_move: Callable[[IMoveBuilder], None]
+    ) -> tuple[ICharacter, tuple[ICharacter, ...]] | None:
+        """Play the turn, returning None without building a move when the status effects end the Battle"""
+        self.__turn += 1
+        with self.__instrumentation.measure("effects"):
+            knocked_out = self.__status_effects.on_turn(self.__turn)
+        if knocked_out and self.__pass_turn_algorithm.finalists:
+            return None
+        with self.__instrumentation.measure("next_turn"):
+            current_character, enemies = self.__pass_turn_algorithm.next_turn()
+        move_builder = self.__move_context.next_move(
+            current_character, enemies, self.__turn, self.__pass_turn_algorithm.enemy_index
+        )
+        with self.__instrumentation.measure("move"):
+            build_playing_move(move_builder)
+        return current_character, enemies
+
+    def __rest_characters_inline(self, current_character: ICharacter, enemies: tuple[ICharacter, ...]) -> None:
+        with self.__instrumentation.measure("rest"):
+            with suppress(CombatTechniqueIsAlreadyReady, SpellIsAlreadyReady):
+                current_character.rest()
+            for character in enemies:
+                with suppress(CombatTechniqueIsAlreadyReady, SpellIsAlreadyReady):
+                    character.rest()
 
     async def _rest_characters(self, characters: list[ICharacter]) -> None:
-        try:
-            async with open_nursery() as nursery:
-                for character in characters:
-                    nursery.start_soon(run_sync, character.rest)
-        except (ExceptionGroup, CombatTechniqueIsAlreadyReady, SpellIsAlreadyReady):
-            ...
+        with self.__instrumentation.measure("rest"):
+            try:
+                async with create_task_group() as task_group:
+                    for character in characters:
+                        task_group.start_soon(run_sync, character.rest)
+            except (ExceptionGroup, CombatTechniqueIsAlreadyReady, SpellIsAlreadyReady):
+                ...
 
     async def _notify(self) -> None:
-        if finalists := self.__pass_turn_algorithm.finalists:
-            self._finish_battle("Winner is found")
-            winners_characters = finalists[0]
-            losers_characters = finalists[1]
-            async with open_nursery() as nursery:
-                nursery.start_soon(self.__notify_winning_characters, winners_characters)
-                nursery.start_soon(self.__notify_losing_characters, losers_characters)
+        with self.__instrumentation.measure("notify"):
+            if finalists := self.__pass_turn_algorithm.finalists:
+                self._finish_battle("Winner is found")
+                winners_characters = finalists[0]
+                losers_characters = finalists[1]
+                async with create_task_group() as task_group:
+                    task_group.start_soon(self.__notify_winning_characters, winners_characters)
+                    task_group.start_soon(self.__notify_losing_characters, losers_characters)
 
     async def __notify_winning_characters(self, winning_characters: tuple[ICharacter, ...]) -> None:
         """Notifies the winning characters of the Battle"""
         if self.__is_battle_ongoing:
             raise BattleIsAlreadyHappeningException("Cannot notify winning characters if the battle is ongoing")
-        async with EventFactory(self._event_dispatcher) as event_factory:
+        async with EventFactory(self._event_dispatcher, self.entity_id) as event_factory:
             for character in winning_characters:
-                event_factory.character_won_battle(character.name)
+                event_factory.character_won_battle(character.name, character.entity_id)
 
     async def __notify_losing_characters(self, losing_characters: tuple[ICharacter, ...]) -> None:
         """Notifies the losing characters of the Battle"""
         if self.__is_battle_ongoing:
             raise BattleIsAlreadyHappeningException("Cannot notify losing characters if the battle is ongoing")
-        async with EventFactory(self._event_dispatcher) as event_factory:
+        async with EventFactory(self._event_dispatcher, self.entity_id) as event_factory:
             for character in losing_characters:
-                event_factory.character_lost_battle(character.name)
+                event_factory.character_lost_battle(character.name, character.entity_id)
 
     def __str__(self) -> str:
         if self.__is_battle_ongoing:
@@ -1,20 +1,22 @@
-from domain import EventDispatcher
+from domain import EventDispatcher, IEntityID
+from domain.tracing import current_tracer
 
 from .events import CharacterLostBattleEvent, CharacterWonBattleEvent
-from .mediator import CharacterLostBattleMediator, CharacterWonBattleMediator
 
 
 class EventFactory:
-    """Factory that creates Event Mediators"""
+    """Factory that creates the Battle Events and publishes them in the Event Dispatcher"""
 
-    def __init__(self, event_dispatcher: EventDispatcher) -> None:
+    def __init__(self, event_dispatcher: EventDispatcher, battle_id: IEntityID | None = None) -> None:
         self.event_dispatcher = event_dispatcher
+        self.battle_id = "" if battle_id is None else str(battle_id)
 
     async def __aenter__(self) -> "EventFactory":
         return self
 
     async def __aexit__(self, *_: Exception) -> None:
-        await self.event_dispatcher.notify_all()
+        with current_tracer().span("battle.events", battle_id=self.battle_id):
+            await self.event_dispatcher.notify_all()
 
     def __enter__(self) -> "EventFactory":
         return self
@@ -22,12 +24,14 @@ class EventFactory:
     def __exit__(self, *_: Exception) -> None:
         ...
 
-    def character_won_battle(self, character_name: str) -> None:
-        """Create an Event Handler"""
-        event = CharacterWonBattleEvent(character_name)
-        self.event_dispatcher.register(CharacterWonBattleMediator(event))
-
-    def character_lost_battle(self, character_name: str) -> None:
-        """Create an Event Handler"""
-        event = CharacterLostBattleEvent(character_name)
-        self.event_dispatcher.register(CharacterLostBattleMediator(event))
+    def character_won_battle(self, character_name: str, character_id: IEntityID | None = None) -> None:
+        """Publish that a Character won the Battle"""
+        self.event_dispatcher.publish(
+            CharacterWonBattleEvent(character_name, self.battle_id, "" if character_id is None else str(character_id))
+        )
+
+    def character_lost_battle(self, character_name: str, character_id: IEntityID | None = None) -> None:
+        """Publish that a Character lost the Battle"""
+        self.event_dispatcher.publish(
+            CharacterLostBattleEvent(character_name, self.battle_id, "" if character_id is None else str(character_id))
+        )
@@ -1,8 +1,10 @@
 from .__factory__ import EventFactory
+from .__registry__ import BATTLE_EVENT_HANDLERS
 from .events import CharacterLostBattleEvent, CharacterWonBattleEvent
 from .mediator import CharacterLostBattleMediator, CharacterWonBattleMediator
 
 __all__ = [
+    "BATTLE_EVENT_HANDLERS",
     "CharacterLostBattleEvent",
     "CharacterLostBattleMediator",
     "CharacterWonBattleEvent",
@@ -0,0 +1,11 @@
+from domain.event_handler_registry import EventHandlerRegistry
+
+from .event_handlers import NotifyEvolutionEventHandler, NotifyQuestEventHandler
+from .events import CharacterLostBattleEvent, CharacterWonBattleEvent
+
+BATTLE_EVENT_HANDLERS = (
+    EventHandlerRegistry()
+    .register(CharacterWonBattleEvent, NotifyEvolutionEventHandler, NotifyQuestEventHandler)
+    .register(CharacterLostBattleEvent, NotifyQuestEventHandler)
+    .compile()
+)
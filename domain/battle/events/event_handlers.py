@@ -1,6 +1,5 @@
-from trio import sleep
-
 from domain import EventHandler
+from domain.clock import current_clock
 
 
 class NotifyEvolutionEventHandler(EventHandler):
@@ -8,7 +7,7 @@ class NotifyEvolutionEventHandler(EventHandler):
 
     async def handle(self) -> None:
         """Handle the event"""
-        await sleep(1)
+        await current_clock().sleep(1)
         print(f"Evolution Context notified: {self.event.event_name}")
 
 
@@ -17,5 +16,5 @@ class NotifyQuestEventHandler(EventHandler):
 
     async def handle(self) -> None:
         """Handle the event"""
-        await sleep(1)
+        await current_clock().sleep(1)
         print(f"Quest Context notified: {self.event.event_name}")
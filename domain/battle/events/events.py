@@ -1,15 +1,47 @@
+from dataclasses import dataclass
+
 from domain import DomainEvent
+from domain.interfaces import epoch_timestamp
 
 
-class CharacterWonBattleEvent(DomainEvent):
-    """Event that notifies that a Character won the Battle"""
+class _CharacterBattleOutcomeEvent(DomainEvent):
+    """Event that notifies how a Battle ended for one of its Characters"""
+
+    __slots__ = ()
+
+    @dataclass(slots=True)
+    class Payload(DomainEvent.Payload):
+        """Payload of the event"""
+
+        character_name: str
+        battle_id: str = ""
+        character_id: str = ""
+
+    payload: Payload
 
-    def __init__(self, character_name: str) -> None:
-        super().__init__(character_name=character_name)
+    def __init__(self, character_name: str, battle_id: str = "", character_id: str = "") -> None:
+        """Build the slotted payload positionally, skipping the keyword arguments of DomainEvent"""
+        self.payload = self.Payload(character_name, battle_id, character_id)
+        self.timestamp = epoch_timestamp()
 
+    @property
+    def idempotency_key(self) -> str | None:
+        """A Character wins or loses a given Battle only once; events outside a Battle have no identity
 
-class CharacterLostBattleEvent(DomainEvent):
+        Characters are told apart by their ID, and only by their name when the event carries no ID.
+        """
+        if not self.payload.battle_id:
+            return None
+        return f"{self.payload.battle_id}:{self.event_name}:{self.payload.character_id or self.payload.character_name}"
+
+
+class CharacterWonBattleEvent(_CharacterBattleOutcomeEvent):
     """Event that notifies that a Character won the Battle"""
 
-    def __init__(self, character_name: str) -> None:
-        super().__init__(character_name=character_name)
+    __slots__ = ()
+
+
+class CharacterLostBattleEvent(_CharacterBattleOutcomeEvent):
+    """Event that notifies that a Character lost the Battle"""
+
+    __slots__ = ()
@@ -1,10 +1,10 @@
 from typing import Type
 
-from trio import open_nursery
+from anyio import create_task_group
 
 from domain.interfaces import EventHandler, EventMediator
 
-from .event_handlers import NotifyEvolutionEventHandler, NotifyQuestEventHandler
+from .__registry__ import BATTLE_EVENT_HANDLERS
 from .events import CharacterLostBattleEvent, CharacterWonBattleEvent
 
 
@@ -14,13 +14,13 @@ class CharacterWonBattleMediator(EventMediator):
     def __init__(self, event: CharacterWonBattleEvent) -> None:
         super().__init__(event)
         self.__event = event
-        self.__event_handlers: list[Type[EventHandler]] = [NotifyEvolutionEventHandler, NotifyQuestEventHandler]
+        self.__event_handlers = list(BATTLE_EVENT_HANDLERS.handlers_for(CharacterWonBattleEvent))
 
     async def handle(self) -> None:
         """Handle the event."""
-        async with open_nursery() as nursery:
+        async with create_task_group() as task_group:
             for handler in self.__event_handlers:
-                nursery.start_soon(handler(self.__event).handle)
+                task_group.start_soon(handler(self.__event)._handle_traced)
         self.unregister_all()
 
     def unregister(self, event_handler: Type[EventHandler]) -> None:
@@ -33,18 +33,18 @@ class CharacterWonBattleMediator(EventMediator):
 
 
 class CharacterLostBattleMediator(EventMediator):
-    """Mediator for character won battle event."""
+    """Mediator for character lost battle event."""
 
     def __init__(self, event: CharacterLostBattleEvent) -> None:
         super().__init__(event)
         self.__event = event
-        self.__event_handlers: list[Type[EventHandler]] = [NotifyQuestEventHandler]
+        self.__event_handlers = list(BATTLE_EVENT_HANDLERS.handlers_for(CharacterLostBattleEvent))
 
     async def handle(self) -> None:
         """Handle the event."""
-        async with open_nursery() as nursery:
+        async with create_task_group() as task_group:
             for handler in self.__event_handlers:
-                nursery.start_soon(handler(self.__event).handle)
+                task_group.start_soon(handler(self.__event)._handle_traced)
         self.unregister_all()
 
     def unregister(self, event_handler: Type[EventHandler]) -> None:
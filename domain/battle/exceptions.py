@@ -4,3 +4,15 @@ class BattleIsAlreadyHappeningException(RuntimeError):
 
 class BattleIsNotHappeningException(RuntimeError):
     """Error indicates that someone tried to end a duel that had not been started yet"""
+
+
+class BattleNotFoundException(LookupError):
+    """Error indicates that a Battle with the given ID is not stored in the repository"""
+
+
+class EnemyNotFoundException(LookupError):
+    """Error indicates that the target of an attack is not an enemy alive in the Battle"""
+
+
+class InvalidStatusEffectException(ValueError):
+    """Error indicates that a status effect has a negative magnitude, or a duration or period below one turn"""
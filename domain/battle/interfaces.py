@@ -1,9 +1,21 @@
 from abc import ABCMeta, abstractmethod
-from typing import Callable
+from typing import Callable, Iterable, Sequence
 
 from domain import EventDispatcher, IEntityID
-
-from .value_objects import IBattleAllies, IBattleAlliesBuilder, IMoveBuilder, PassTurnAlgorithmEnum
+from domain.character import ICharacter
+from domain.damage_modifiers import DamageModifiers
+from domain.instrumentation import DISABLED_INSTRUMENTATION, Instrumentation
+
+from .value_objects import (
+    IBattleAllies,
+    IBattleAlliesBuilder,
+    IMoveBuilder,
+    MoveLog,
+    MoveRecord,
+    PassTurnAlgorithmEnum,
+    StatusEffect,
+    StatusEffectKindEnum,
+)
 
 
 class IBattle(metaclass=ABCMeta):
@@ -11,10 +23,44 @@ class IBattle(metaclass=ABCMeta):
 
     entity_id: IEntityID
 
+    @property
+    @abstractmethod
+    def is_ongoing(self) -> bool:
+        ...
+
+    @property
+    @abstractmethod
+    def move_log(self) -> MoveLog:
+        ...
+
     @abstractmethod
     async def play(self, build_playing_move: Callable[[IMoveBuilder], None]) -> None:
         ...
 
+    @abstractmethod
+    async def play_many(
+        self, build_playing_moves: Sequence[Callable[[IMoveBuilder], None]]
+    ) -> tuple[tuple[MoveRecord, ...], ...]:
+        ...
+
+    @abstractmethod
+    def play_sync(self, build_playing_move: Callable[[IMoveBuilder], None]) -> None:
+        ...
+
+    @abstractmethod
+    async def flush_events(self) -> None:
+        ...
+
+    @abstractmethod
+    def teardown(self) -> None:
+        ...
+
+    @abstractmethod
+    def apply_status_effect(
+        self, target: ICharacter, kind: StatusEffectKindEnum, magnitude: int, duration: int, period: int = 1
+    ) -> StatusEffect:
+        ...
+
 
 class IBattleInitializer(metaclass=ABCMeta):
     """Interface that define the builder method of Battle"""
@@ -43,6 +89,33 @@ class IBattleFactory(metaclass=ABCMeta):
 
     @abstractmethod
     def create_new(
-        self, *, event_dispatcher: EventDispatcher, entity_id: IEntityID, is_battle_ongoing: bool
+        self,
+        *,
+        event_dispatcher: EventDispatcher,
+        entity_id: IEntityID,
+        is_battle_ongoing: bool,
+        instrumentation: Instrumentation = DISABLED_INSTRUMENTATION,
+        damage_modifiers: DamageModifiers | None = None,
+        damage_seed: int | None = None,
     ) -> "IBattleBuilder":
         ...
+
+
+class IBattleRepository(metaclass=ABCMeta):
+    """Interface that defines how Battle aggregates are stored and retrieved"""
+
+    @abstractmethod
+    def add(self, battle: IBattle) -> None:
+        """Store a new or changed Battle"""
+
+    @abstractmethod
+    def get(self, entity_id: IEntityID) -> IBattle:
+        """Retrieve a single Battle by its ID"""
+
+    @abstractmethod
+    def get_many(self, entity_ids: Iterable[IEntityID]) -> tuple[IBattle, ...]:
+        """Retrieve many Battles at once, keeping the order of the given IDs"""
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Persist the pending changes of the repository"""
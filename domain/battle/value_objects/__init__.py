@@ -1,4 +1,5 @@
 from .battle_allies import BattleAllies
+from .compact_state import CompactAction, CompactBattleRules, CompactBattleState, greedy_action
 from .interfaces import (
     IBattleAllies,
     IBattleAlliesBuilder,
@@ -6,10 +7,15 @@ from .interfaces import (
     IMoveBuilder,
     ITeam,
     ITeamBuilder,
+    LegalMove,
     PassTurnAlgorithmEnum,
 )
-from .move import Move
+from .mcts_policy import MCTSPolicy
+from .move import Move, MoveContext
+from .move_log import MoveActionEnum, MoveLog, MoveRecord
+from .move_policies import FocusLowestLifePolicy, HighestDamagePolicy, LowestLifeHeap, ManaConservingPolicy, MovePolicy
 from .pass_turn_algorithm import PassTurnAlgorithmStrategy
+from .status_effects import EffectTimerWheel, StatusEffect, StatusEffectEngine, StatusEffectKindEnum
 from .team import Team
 
 __all__ = [
@@ -22,6 +28,25 @@ __all__ = [
     "PassTurnAlgorithmStrategy",
     "Team",
     "Move",
+    "MoveContext",
     "IMove",
     "IMoveBuilder",
+    "LegalMove",
+    "MoveActionEnum",
+    "MoveLog",
+    "MoveRecord",
+    "MovePolicy",
+    "HighestDamagePolicy",
+    "FocusLowestLifePolicy",
+    "ManaConservingPolicy",
+    "LowestLifeHeap",
+    "CompactAction",
+    "CompactBattleRules",
+    "CompactBattleState",
+    "greedy_action",
+    "MCTSPolicy",
+    "EffectTimerWheel",
+    "StatusEffect",
+    "StatusEffectEngine",
+    "StatusEffectKindEnum",
 ]
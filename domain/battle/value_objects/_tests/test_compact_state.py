@@ -0,0 +1,87 @@
+from itertools import count
+
+from domain._tests.fakes import fake_battle, fake_battle_allies, fake_character, fake_team
+from domain.battle.value_objects import (
+    CompactAction,
+    CompactBattleRules,
+    CompactBattleState,
+    IBattleAllies,
+    IMoveBuilder,
+    MCTSPolicy,
+    PassTurnAlgorithmEnum,
+)
+from domain.battle_event_dispatcher import BattleEventDispatcher
+from domain.character import ICharacter
+
+
+def fake_participants() -> tuple[tuple[IBattleAllies, ...], tuple[ICharacter, ...]]:
+    characters = (
+        fake_character("First", 30, 2, 1),
+        fake_character("Second", 20, 1, 2),
+        fake_character("Third", 25, 1, 1),
+        fake_character("Fourth", 15, 2, 0),
+    )
+    participants = (
+        fake_battle_allies(fake_team(characters[0], characters[2])),
+        fake_battle_allies(fake_team(characters[1], characters[3])),
+    )
+    return participants, characters
+
+
+def assert_mirrors(state: CompactBattleState, rules: CompactBattleRules) -> None:
+    assert state.life == [character.current_life_points for character in rules.characters]
+    assert state.stamina == [character.current_stamina_points for character in rules.characters]
+    assert state.mana == [character.current_mana_points for character in rules.characters]
+    assert state.loading == [skill.loading_time for skill in rules.skills]
+
+
+def test_compact_state_mirrors_the_rules_of_the_battle() -> None:
+    participants, characters = fake_participants()
+    battle = fake_battle(BattleEventDispatcher(), PassTurnAlgorithmEnum.REGULAR_PASS_TURN, *participants)
+    rules = CompactBattleRules(participants)
+    state = CompactBattleState.snapshot(rules, characters[0])
+    assert rules.characters == (characters[0], characters[1], characters[2], characters[3])
+
+    for turn in range(12):
+        attack_actions = state.attack_actions()
+        action = (
+            attack_actions[turn % len(attack_actions)] if attack_actions and turn % 5 else state.legal_actions()[-1]
+        )
+        next_state = state.apply(action)
+
+        def move(move_builder: IMoveBuilder) -> None:
+            if action.skill < 0:
+                move_builder.rest()
+            else:
+                move_builder.attack(rules.characters[action.target].entity_id, rules.skills[action.skill])
+
+        battle.play_sync(move)
+        assert_mirrors(next_state, rules)
+        assert next_state is not state and next_state.turn == state.turn + 1
+        state = next_state
+
+
+def test_mcts_finishes_the_enemy_it_can_knock_out() -> None:
+    participants, characters = fake_participants()
+    characters[1]._receive_attack(80)
+    characters[3]._receive_attack(90)
+    policy = MCTSPolicy(participants, time_budget=10, max_iterations=400, seed=3)
+    state = CompactBattleState.snapshot(CompactBattleRules(participants), characters[0])
+
+    action = policy.search(state)
+
+    assert action.target in (1, 3)
+    assert state.apply(action).life[action.target] == 0
+    assert policy.iterations == 400
+    assert 0 < policy.nodes <= 400
+
+
+def test_mcts_stops_when_the_time_budget_is_spent() -> None:
+    participants, characters = fake_participants()
+    ticks = count()
+    policy = MCTSPolicy(participants, time_budget=5, clock=lambda: next(ticks))
+
+    action = policy.search(CompactBattleState.snapshot(CompactBattleRules(participants), characters[0]))
+
+    assert isinstance(action, CompactAction)
+    assert policy.iterations == 5
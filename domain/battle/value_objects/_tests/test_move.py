@@ -1,6 +1,10 @@
-from domain._tests.fakes import fake_character_gen
+import pytest
+
+from domain._tests.fakes import MAXIMUS_POINTS, fake_character, fake_character_gen
+from domain.battle.exceptions import EnemyNotFoundException
 from domain.battle.value_objects.interfaces import IMoveBuilder
-from domain.battle.value_objects.move import Move
+from domain.battle.value_objects.move import Move, MoveContext
+from domain.battle.value_objects.move_log import MoveActionEnum, MoveLog
 
 
 def test_player_move_behavior() -> None:
@@ -17,3 +21,83 @@ def test_player_move_behavior() -> None:
 
     move_builder = Move.create_new(playing_character, enemy_characters)
     move(move_builder)
+
+
+def test_attack_resolves_the_target_through_the_enemy_index() -> None:
+    seed = 10
+    playing_character = next(fake_character_gen(seed, 1))
+    enemy_characters = tuple(fake_character_gen(seed, 3))
+    character_skill = next(playing_character.available_combat_techniques)
+    enemy_index = {enemy.entity_id: enemy for enemy in enemy_characters}
+
+    Move.create_new(playing_character, (), enemy_index=enemy_index).attack(
+        enemy_characters[2].entity_id, character_skill
+    )
+
+    assert enemy_characters[2].current_life_points < enemy_characters[0].current_life_points
+
+
+def test_attack_an_unknown_target() -> None:
+    seed = 10
+    playing_character, ally_character = fake_character_gen(seed, 2)
+    enemy_characters = tuple(fake_character_gen(seed, 2))
+    character_skill = next(playing_character.available_spells)
+    move_builder = Move.create_new(playing_character, enemy_characters)
+
+    with pytest.raises(EnemyNotFoundException):
+        move_builder.attack(ally_character.entity_id, character_skill)
+
+
+def test_move_context_reuses_the_move_every_turn() -> None:
+    seed = 10
+    playing_character = next(fake_character_gen(seed, 1))
+    enemy_characters = tuple(fake_character_gen(seed, 2))
+    first_skill, second_skill, *_ = playing_character.available_combat_techniques
+    move_log = MoveLog()
+    move_context = MoveContext(move_log)
+
+    first_move_builder = move_context.next_move(playing_character, enemy_characters, turn=1)
+    first_rest_builder = first_move_builder.attack(enemy_characters[0].entity_id, first_skill)
+    second_move_builder = move_context.next_move(playing_character, enemy_characters, turn=2)
+    second_move_builder.rest()
+
+    assert first_move_builder is second_move_builder
+    assert second_move_builder.attack(enemy_characters[1].entity_id, second_skill) is first_rest_builder
+    assert [(record.turn, record.action) for record in move_log] == [
+        (1, MoveActionEnum.ATTACK),
+        (2, MoveActionEnum.REST),
+        (2, MoveActionEnum.ATTACK),
+    ]
+
+
+def test_legal_moves_filter_the_skills_the_character_cannot_afford() -> None:
+    seed = 60
+    playing_character = fake_character("Playing", seed, 2, 1)
+    enemy_characters = tuple(fake_character_gen(seed, 2))
+    first_technique, second_technique = playing_character.available_combat_techniques
+    spell = next(playing_character.available_spells)
+    move_builder = Move.create_new(playing_character, enemy_characters)
+
+    legal_moves = move_builder.legal_moves
+
+    assert move_builder.legal_moves is legal_moves
+    assert {(legal_move.skill.entity_id, legal_move.target_id) for legal_move in legal_moves} == {
+        (skill.entity_id, enemy.entity_id)
+        for skill in (first_technique, second_technique, spell)
+        for enemy in enemy_characters
+    }
+
+    move_builder.attack(enemy_characters[0].entity_id, first_technique)
+
+    assert [legal_move.skill for legal_move in move_builder.legal_moves] == [spell, spell]
+
+
+def test_legal_moves_skip_the_enemies_knocked_out() -> None:
+    playing_character = fake_character("Playing", 10, 1, 0)
+    enemy_characters = tuple(fake_character_gen(10, 2))
+    enemy_characters[0]._receive_attack(MAXIMUS_POINTS)
+    move_context = MoveContext()
+
+    move_builder = move_context.next_move(playing_character, enemy_characters, turn=1)
+
+    assert {legal_move.target_id for legal_move in move_builder.legal_moves} == {enemy_characters[1].entity_id}
@@ -0,0 +1,170 @@
+import gc
+import pickle
+from weakref import ref
+
+from domain._tests.fakes import (
+    MAXIMUS_POINTS,
+    fake_battle,
+    fake_battle_allies,
+    fake_character,
+    fake_character_gen,
+    fake_multi_target_character,
+    fake_team,
+)
+from domain.battle.value_objects import (
+    FocusLowestLifePolicy,
+    HighestDamagePolicy,
+    LowestLifeHeap,
+    ManaConservingPolicy,
+    Move,
+    MoveActionEnum,
+    MoveLog,
+    PassTurnAlgorithmEnum,
+)
+from domain.battle_event_dispatcher import BattleEventDispatcher
+from domain.character import Character, ICharacter
+from domain.skill.combat_technique import CombatTechnique
+from domain.skill.spell import Spell
+from domain.value_objects import EntityID
+
+
+def fake_caster(name: str, technique_damage: int, spell_damage: int, spell_max_targets: int | None) -> ICharacter:
+    combat_technique = CombatTechnique.create_new(entity_id=EntityID(), name=f"{name} punch")
+    spell = Spell.create_new(entity_id=EntityID(), name=f"{name} storm")
+    return (
+        Character.create_new(entity_id=EntityID(), name=name)
+        .specify_skill_properties(life_points=MAXIMUS_POINTS, stamina_points=MAXIMUS_POINTS, mana_points=MAXIMUS_POINTS)
+        .add_skills(
+            combat_technique.specify_combat_technique_properties(stamina_cost=1, damage=technique_damage, cooldown=0),
+            spell.specify_spell_properties(
+                mana_cost=10, damage=spell_damage, cooldown=0, max_targets=spell_max_targets
+            ),
+        )
+    )
+
+
+def test_lowest_life_heap_follows_damage_and_heals() -> None:
+    characters = tuple(fake_character_gen(10, 3))
+    heap = LowestLifeHeap(characters)
+
+    characters[1]._receive_attack(30)
+    characters[2]._receive_attack(20)
+    assert heap.lowest(2) == (characters[1], characters[2])
+
+    characters[1]._heal(30)
+    assert heap.lowest() == (characters[2],)
+
+    characters[2]._receive_attack(MAXIMUS_POINTS)
+    assert len(heap) == 2
+    assert heap.lowest(3) == (characters[0], characters[1])
+
+
+def test_lowest_life_heap_discards_outdated_entries() -> None:
+    characters = tuple(fake_character_gen(10, 3))
+    heap = LowestLifeHeap(characters)
+
+    for _ in range(50):
+        for character in characters:
+            character._receive_attack(1)
+            character._heal(1)
+        heap.lowest(3)
+
+    assert len(heap._LowestLifeHeap__entries) <= 2 * len(characters) + 1  # type: ignore[attr-defined]
+
+
+def test_focus_lowest_life_finishes_the_weakest_enemy_cheaply() -> None:
+    playing_character = fake_caster("Caster", technique_damage=10, spell_damage=40, spell_max_targets=1)
+    enemies = tuple(fake_character_gen(10, 3))
+    policy = FocusLowestLifePolicy()
+    enemies[1]._receive_attack(95)
+    move_log = MoveLog()
+
+    policy(Move.create_new(playing_character, enemies, move_log=move_log))
+
+    assert not enemies[1].is_alive
+    assert playing_character.current_mana_points == MAXIMUS_POINTS
+    assert [(record.target_id, record.damage) for record in move_log] == [(enemies[1].entity_id, 5)]
+
+
+def test_highest_damage_prefers_the_area_of_effect_skill() -> None:
+    playing_character = fake_caster("Caster", technique_damage=30, spell_damage=15, spell_max_targets=None)
+    enemies = tuple(fake_character_gen(10, 3))
+    policy = HighestDamagePolicy()
+
+    policy(Move.create_new(playing_character, enemies))
+
+    assert [enemy.current_life_points for enemy in enemies] == [85, 85, 85]
+
+
+def test_mana_conserving_casts_only_when_nothing_else_is_affordable() -> None:
+    playing_character = fake_caster("Caster", technique_damage=10, spell_damage=40, spell_max_targets=1)
+    enemies = tuple(fake_character_gen(10, 1))
+    policy = ManaConservingPolicy()
+
+    policy(Move.create_new(playing_character, enemies))
+    assert playing_character.current_mana_points == MAXIMUS_POINTS
+
+    exhausted_character = fake_character("Exhausted", 60, 1, 1)
+    next(exhausted_character.available_combat_techniques).use()
+    policy(Move.create_new(exhausted_character, enemies))
+    assert exhausted_character.current_mana_points == MAXIMUS_POINTS - 60
+
+
+def test_policies_play_a_whole_battle() -> None:
+    attackers = tuple(fake_multi_target_character(f"Attacker {index}", damage=20, max_targets=2) for index in range(2))
+    defenders = tuple(fake_multi_target_character(f"Defender {index}", damage=5, max_targets=1) for index in range(2))
+    battle = fake_battle(
+        BattleEventDispatcher(),
+        PassTurnAlgorithmEnum.REGULAR_PASS_TURN,
+        fake_battle_allies(fake_team(*attackers)),
+        fake_battle_allies(fake_team(*defenders)),
+    )
+    policy = FocusLowestLifePolicy()
+
+    while battle.is_ongoing:
+        battle.play_sync(policy)
+
+    assert not any(defender.is_alive for defender in defenders)
+    assert all(record.action is MoveActionEnum.ATTACK for record in battle.move_log)
+
+
+def test_lowest_life_heap_stops_following_the_characters_once_closed() -> None:
+    characters = tuple(fake_character_gen(10, 3))
+    heap = LowestLifeHeap(characters)
+    heap_reference = ref(heap)
+
+    heap.close()
+    del heap
+
+    assert heap_reference() is None
+    characters[0]._receive_attack(10)
+    assert characters[0].current_life_points == MAXIMUS_POINTS - 10
+
+
+def test_policy_heaps_are_released_with_the_battle() -> None:
+    attackers = tuple(fake_multi_target_character(f"Attacker {index}", damage=20, max_targets=2) for index in range(2))
+    defenders = tuple(fake_multi_target_character(f"Defender {index}", damage=5, max_targets=1) for index in range(2))
+    battle = fake_battle(
+        BattleEventDispatcher(),
+        PassTurnAlgorithmEnum.REGULAR_PASS_TURN,
+        fake_battle_allies(fake_team(*attackers)),
+        fake_battle_allies(fake_team(*defenders)),
+    )
+    policy = HighestDamagePolicy()
+    battle.play_sync(policy)
+    battle.play_sync(policy)
+    heaps_references = [
+        ref(enemies_heap)
+        for battle_heaps in policy._MovePolicy__heaps.values()  # type: ignore[attr-defined]
+        for enemies_heap in battle_heaps.values()
+    ]
+
+    assert len(heaps_references) == 2
+    assert pickle.loads(pickle.dumps(attackers[0])).current_life_points == attackers[0].current_life_points
+
+    del battle
+    gc.collect()
+
+    assert not policy._MovePolicy__heaps  # type: ignore[attr-defined]
+    assert all(heap_reference() is None for heap_reference in heaps_references)
+    assert all(not attacker._Character__damage_listeners for attacker in attackers)  # type: ignore[attr-defined]
@@ -47,3 +47,17 @@ def test_data_structure_creation(
     assert current_character == battle_allies_groups[0].teams[0].characters[0]
     playing_character, _ = pass_turn_algorithmn.next_turn()
     assert playing_character == current_character
+
+
+def test_enemy_index_holds_the_characters_of_the_other_battle_allies() -> None:
+    battle_allies_groups = many_battle_allies(10, 3, 2, 2)
+    pass_turn_algorithmn = RegularPassTurn(battle_allies_groups)
+
+    pass_turn_algorithmn.next_turn()
+
+    assert set(pass_turn_algorithmn.enemy_index) == {
+        character.entity_id
+        for battle_allies in battle_allies_groups[1:]
+        for team in battle_allies.teams
+        for character in team.characters
+    }
@@ -0,0 +1,90 @@
+import pytest
+
+from domain._tests.fakes import fake_character
+from domain.battle.exceptions import InvalidStatusEffectException
+from domain.battle.value_objects import EffectTimerWheel, StatusEffectEngine, StatusEffectKindEnum
+
+
+def test_timer_wheel_only_pops_the_entries_due_on_the_turn() -> None:
+    wheel: EffectTimerWheel[str] = EffectTimerWheel(slots=4)
+    wheel.schedule(1, "first")
+    wheel.schedule(5, "next rotation")
+    wheel.schedule(1, "second")
+
+    assert wheel.pop_due(1) == ["first", "second"]
+    assert len(wheel) == 1
+    assert wheel.pop_due(2) == []
+    assert wheel.pop_due(5) == ["next rotation"]
+    assert len(wheel) == 0
+
+
+def test_poison_ticks_every_period_until_it_expires() -> None:
+    character = fake_character("Poisoned", 10, 1, 0)
+    engine = StatusEffectEngine(slots=2)
+
+    engine.apply(StatusEffectKindEnum.POISON, character, magnitude=10, duration=4, turn=0, period=2)
+    life_points = []
+    for turn in range(1, 7):
+        engine.on_turn(turn)
+        life_points.append(character.current_life_points)
+
+    assert life_points == [100, 90, 90, 80, 80, 80]
+    assert len(engine) == 0
+
+
+def test_poison_that_knocks_out_a_character() -> None:
+    character = fake_character("Poisoned", 10, 1, 0)
+    engine = StatusEffectEngine()
+    engine.apply(StatusEffectKindEnum.POISON, character, magnitude=60, duration=3, turn=0)
+
+    assert [engine.on_turn(turn) for turn in range(1, 4)] == [0, 1, 0]
+    assert not character.is_alive
+    assert len(engine) == 0
+
+
+def test_regeneration_never_exceeds_the_initial_life_points() -> None:
+    character = fake_character("Regenerating", 10, 1, 0)
+    character._receive_attack(15)
+    engine = StatusEffectEngine()
+    engine.apply(StatusEffectKindEnum.REGENERATION, character, magnitude=10, duration=2, turn=0)
+
+    engine.on_turn(1)
+    assert character.current_life_points == 95
+    engine.on_turn(2)
+    assert character.current_life_points == 100
+
+
+def test_shield_absorbs_damage_until_it_expires() -> None:
+    character = fake_character("Shielded", 10, 1, 0)
+    engine = StatusEffectEngine()
+    engine.apply(StatusEffectKindEnum.SHIELD, character, magnitude=30, duration=2, turn=0)
+
+    character._receive_attack(20)
+    assert (character.current_life_points, character.current_shield_points) == (100, 10)
+    engine.on_turn(1)
+    character._receive_attack(20)
+    assert (character.current_life_points, character.current_shield_points) == (90, 0)
+    engine.on_turn(2)
+    assert character.current_shield_points == 0
+
+
+def test_expired_shield_only_revokes_its_own_points_left() -> None:
+    character = fake_character("Shielded", 10, 1, 0)
+    engine = StatusEffectEngine()
+    engine.apply(StatusEffectKindEnum.SHIELD, character, magnitude=30, duration=1, turn=0)
+    engine.apply(StatusEffectKindEnum.SHIELD, character, magnitude=30, duration=3, turn=0)
+    character._grant_shield(5)
+
+    character._receive_attack(40)
+    assert character.current_shield_points == 25
+    engine.on_turn(1)
+    assert character.current_shield_points == 25
+    engine.on_turn(3)
+    assert (character.current_life_points, character.current_shield_points) == (100, 5)
+
+
+def test_invalid_status_effect() -> None:
+    with pytest.raises(InvalidStatusEffectException):
+        StatusEffectEngine().apply(
+            StatusEffectKindEnum.POISON, fake_character("Poisoned", 10, 1, 0), magnitude=10, duration=0, turn=0
+        )
@@ -0,0 +1,114 @@
+import pytest
+
+from domain._tests.fakes import fake_battle, fake_battle_allies, fake_character, fake_team
+from domain.battle import IBattle
+from domain.battle.value_objects import (
+    CompactBattleRules,
+    CompactBattleState,
+    IBattleAllies,
+    IMoveBuilder,
+    PassTurnAlgorithmEnum,
+    greedy_action,
+)
+from domain.battle_event_dispatcher import BattleEventDispatcher
+from domain.character import Character, ICharacter
+from domain.skill.combat_technique import CombatTechnique
+from domain.skill.spell import Spell
+from domain.value_objects import EntityID
+
+np = pytest.importorskip("numpy")
+vectorized_battles = pytest.importorskip("domain.battle.value_objects.vectorized_battles")
+
+
+def fake_fighter(name: str, life_points: int, damage: int, area: bool) -> ICharacter:
+    combat_technique = CombatTechnique.create_new(entity_id=EntityID(), name=f"{name} slash")
+    spell = Spell.create_new(entity_id=EntityID(), name=f"{name} blast")
+    return (
+        Character.create_new(entity_id=EntityID(), name=name)
+        .specify_skill_properties(life_points=life_points, stamina_points=100, mana_points=100)
+        .add_skills(
+            combat_technique.specify_combat_technique_properties(stamina_cost=10, damage=damage, cooldown=1),
+            spell.specify_spell_properties(
+                mana_cost=40, damage=damage + 5, cooldown=2, max_targets=None if area else 1
+            ),
+        )
+    )
+
+
+def fake_participants(seed: int) -> tuple[IBattleAllies, ...]:
+    return (
+        fake_battle_allies(
+            fake_team(
+                fake_fighter("Knight", 60 + seed * 7 % 50, 10, area=False),
+                fake_fighter("Mage", 40 + seed * 3 % 30, 8, area=True),
+            )
+        ),
+        fake_battle_allies(
+            fake_team(
+                fake_fighter("Orc", 70 + seed * 5 % 40, 12, area=False),
+                fake_fighter("Shaman", 45 + seed * 11 % 20, 7, area=True),
+            )
+        ),
+    )
+
+
+def play_greedy(battle: IBattle, rules: CompactBattleRules, max_turns: int) -> None:
+    def move(move_builder: IMoveBuilder) -> None:
+        action = greedy_action(CompactBattleState.snapshot(rules, move_builder.playing_character))
+        if action.skill < 0:
+            move_builder.rest()
+        elif action.target < 0:
+            move_builder.attack_all(rules.skills[action.skill])
+        else:
+            move_builder.attack(rules.characters[action.target].entity_id, rules.skills[action.skill])
+
+    for _ in range(max_turns):
+        if not battle.is_ongoing:
+            return
+        battle.play_sync(move)
+
+
+def test_vectorized_battles_have_the_same_outcomes_as_the_object_model() -> None:
+    participants = [fake_participants(seed) for seed in range(12)]
+    rules = [CompactBattleRules(battle_participants) for battle_participants in participants]
+    engine = vectorized_battles.VectorizedBattles.from_states(
+        [CompactBattleState.snapshot(battle_rules, battle_rules.characters[0]) for battle_rules in rules]
+    )
+
+    turns = engine.run(max_turns=200)
+    battles = [
+        fake_battle(BattleEventDispatcher(), PassTurnAlgorithmEnum.REGULAR_PASS_TURN, *battle_participants)
+        for battle_participants in participants
+    ]
+    for battle, battle_rules in zip(battles, rules):
+        play_greedy(battle, battle_rules, turns)
+
+    assert engine.finished.all()
+    for index, (battle, battle_rules) in enumerate(zip(battles, rules)):
+        characters = battle_rules.characters
+        assert engine.finished[index] == (not battle.is_ongoing)
+        assert engine.life[index].tolist() == [character.current_life_points for character in characters]
+        assert engine.stamina[index].tolist() == [character.current_stamina_points for character in characters]
+        assert engine.mana[index].tolist() == [character.current_mana_points for character in characters]
+        assert engine.loading[index].tolist() == [skill.loading_time for skill in battle_rules.skills]
+        if engine.finished[index]:
+            winners = {battle_rules.sides[turn] for turn, character in enumerate(characters) if character.is_alive}
+            assert winners == {engine.winners[index]}
+
+
+def test_battles_with_other_rules_are_not_played_in_lockstep() -> None:
+    first_rules = CompactBattleRules(fake_participants(0))
+    other_rules = CompactBattleRules(
+        (
+            fake_battle_allies(fake_team(fake_character("A", 10, 1, 0))),
+            fake_battle_allies(fake_team(fake_character("B", 10, 1, 0))),
+        )
+    )
+
+    with pytest.raises(ValueError):
+        vectorized_battles.VectorizedBattles.from_states(
+            [
+                CompactBattleState.snapshot(first_rules, first_rules.characters[0]),
+                CompactBattleState.snapshot(other_rules, other_rules.characters[0]),
+            ]
+        )
@@ -0,0 +1,221 @@
+"""Module describes a compact copy of the state of a Battle, cheap to clone for the lookahead search
+
+What does not change while the Battle is played (the owner, cost, damage and cooldown of each skill and
+the turn order) lives in ``CompactBattleRules``, shared by every state. ``CompactBattleState`` only keeps
+flat lists of the points of each Character and of the loading time of each attack skill, and its
+``play`` method mirrors ``Move._attack``, ``Move._rest`` and the rest of the Characters after the turn.
+
+Passives, status effects and damage modifiers are not part of the compact state.
+"""
+from typing import NamedTuple
+
+from domain.character import ICharacter
+from domain.skill import IAttackable, IMagicalAttack
+
+from .interfaces import IBattleAllies
+
+REST = -1
+ALL_TARGETS = -1
+
+
+class CompactAction(NamedTuple):
+    """Skill and target of a move, as indexes of the CompactBattleRules"""
+
+    skill: int
+    target: int
+
+
+REST_ACTION = CompactAction(REST, REST)
+
+
+class CompactBattleRules:
+    """Static part of a Battle, indexed so that the Characters follow the regular pass turn order"""
+
+    def __init__(self, participants_battle_allies: tuple[IBattleAllies, ...]) -> None:
+        positions = [[team.characters for team in battle_allies.teams] for battle_allies in participants_battle_allies]
+        turn_order = [
+            (battle_allies_index, positions[battle_allies_index][team_index][character_index])
+            for character_index in range(len(positions[0][0]))
+            for team_index in range(len(positions[0]))
+            for battle_allies_index in range(len(positions))
+        ]
+        self.characters: tuple[ICharacter, ...] = tuple(character for _, character in turn_order)
+        self.sides: tuple[int, ...] = tuple(battle_allies_index for battle_allies_index, _ in turn_order)
+        self.side_quantity = len(positions)
+        skills: list[IAttackable] = []
+        skills_of: list[tuple[int, ...]] = []
+        for character in self.characters:
+            character_skills = character.attack_skills
+            skills_of.append(tuple(range(len(skills), len(skills) + len(character_skills))))
+            skills.extend(character_skills)
+        self.skills: tuple[IAttackable, ...] = tuple(skills)
+        self.skills_of: tuple[tuple[int, ...], ...] = tuple(skills_of)
+        self.costs: tuple[int, ...] = tuple(skill.cost for skill in skills)
+        self.damages: tuple[int, ...] = tuple(skill.damage for skill in skills)
+        self.cooldowns: tuple[int, ...] = tuple(skill.cooldown for skill in skills)
+        self.magical: tuple[bool, ...] = tuple(isinstance(skill, IMagicalAttack) for skill in skills)
+        self.area: tuple[bool, ...] = tuple(skill.max_targets is None for skill in skills)
+        self.enemies_of: tuple[tuple[int, ...], ...] = tuple(
+            tuple(enemy for enemy, enemy_side in enumerate(self.sides) if enemy_side != side) for side in self.sides
+        )
+        self.__turn_of = {id(character): turn for turn, character in enumerate(self.characters)}
+
+    def turn_of(self, character: ICharacter) -> int:
+        """Position of the Character in the turn order"""
+        return self.__turn_of[id(character)]
+
+
+class CompactBattleState:
+    """Points of every Character and loading time of every skill, in flat lists that are cheap to copy"""
+
+    __slots__ = ("rules", "life", "shield", "stamina", "mana", "loading", "just_used", "turn")
+
+    def __init__(
+        self,
+        rules: CompactBattleRules,
+        life: list[int],
+        shield: list[int],
+        stamina: list[int],
+        mana: list[int],
+        loading: list[int],
+        just_used: list[bool],
+        turn: int,
+    ) -> None:
+        self.rules = rules
+        self.life = life
+        self.shield = shield
+        self.stamina = stamina
+        self.mana = mana
+        self.loading = loading
+        self.just_used = just_used
+        self.turn = turn
+
+    @classmethod
+    def snapshot(cls, rules: CompactBattleRules, playing_character: ICharacter) -> "CompactBattleState":
+        """Copy the current state of the Characters at the start of the turn of the playing Character"""
+        characters = rules.characters
+        return cls(
+            rules,
+            [character.current_life_points for character in characters],
+            [character.current_shield_points for character in characters],
+            [character.current_stamina_points for character in characters],
+            [character.current_mana_points for character in characters],
+            [skill.loading_time for skill in rules.skills],
+            [False] * len(rules.skills),
+            rules.turn_of(playing_character),
+        )
+
+    def copy(self) -> "CompactBattleState":
+        return CompactBattleState(
+            self.rules,
+            self.life[:],
+            self.shield[:],
+            self.stamina[:],
+            self.mana[:],
+            self.loading[:],
+            self.just_used[:],
+            self.turn,
+        )
+
+    @property
+    def actor(self) -> int:
+        return self.turn % len(self.rules.characters)
+
+    @property
+    def winner(self) -> int | None:
+        """Side of the only Battle Allies with Characters alive, None while more than one is alive"""
+        alive_sides = {side for side, life_points in zip(self.rules.sides, self.life) if life_points > 0}
+        return alive_sides.pop() if len(alive_sides) == 1 else None
+
+    def score(self, side: int) -> float:
+        """One when the side won, zero when it lost, otherwise its share of the life points left"""
+        winner = self.winner
+        if winner is not None:
+            return 1.0 if winner == side else 0.0
+        total_life_points = sum(self.life)
+        side_life_points = sum(
+            life_points for character_side, life_points in zip(self.rules.sides, self.life) if character_side == side
+        )
+        return side_life_points / total_life_points if total_life_points else 0.0
+
+    def alive_enemies(self, character: int) -> list[int]:
+        life = self.life
+        return [enemy for enemy in self.rules.enemies_of[character] if life[enemy] > 0]
+
+    def attack_actions(self) -> list[CompactAction]:
+        """Attacks ready and affordable by the actor against every enemy alive"""
+        rules, actor = self.rules, self.actor
+        if self.life[actor] == 0:
+            return []
+        enemies = self.alive_enemies(actor)
+        actions: list[CompactAction] = []
+        for skill in rules.skills_of[actor]:
+            points = self.mana[actor] if rules.magical[skill] else self.stamina[actor]
+            if self.loading[skill] != 0 or rules.costs[skill] > points:
+                continue
+            if rules.area[skill]:
+                actions.append(CompactAction(skill, ALL_TARGETS))
+            else:
+                actions.extend(CompactAction(skill, enemy) for enemy in enemies)
+        return actions
+
+    def legal_actions(self) -> list[CompactAction]:
+        return [*self.attack_actions(), REST_ACTION]
+
+    def apply(self, action: CompactAction) -> "CompactBattleState":
+        """Returns the state after the action, leaving this one untouched"""
+        next_state = self.copy()
+        next_state.play(action)
+        return next_state
+
+    def play(self, action: CompactAction) -> None:
+        """Play the action of the actor in place, then rest the actor and its enemies as the Battle does"""
+        actor = self.actor
+        enemies = self.alive_enemies(actor)
+        if action.skill == REST:
+            self.__rest(actor)
+        else:
+            self.__attack(actor, action, enemies)
+        self.__rest(actor)
+        for enemy in enemies:
+            self.__rest(enemy)
+        self.turn += 1
+
+    def __attack(self, actor: int, action: CompactAction, enemies: list[int]) -> None:
+        rules, skill = self.rules, action.skill
+        self.loading[skill] = rules.cooldowns[skill]
+        self.just_used[skill] = True
+        points = self.mana if rules.magical[skill] else self.stamina
+        points[actor] -= min(rules.costs[skill], points[actor])
+        damage = rules.damages[skill]
+        for target in enemies if action.target == ALL_TARGETS else (action.target,):
+            absorbed_damage = min(self.shield[target], damage)
+            self.shield[target] -= absorbed_damage
+            self.life[target] -= min(self.life[target], damage - absorbed_damage)
+
+    def __rest(self, character: int) -> None:
+        loading, just_used = self.loading, self.just_used
+        for skill in self.rules.skills_of[character]:
+            if loading[skill] == 0:
+                continue
+            if just_used[skill]:
+                just_used[skill] = False
+            else:
+                loading[skill] -= 1
+
+
+def greedy_action(state: CompactBattleState) -> CompactAction:
+    """Deterministic policy that uses the usable skill with the most damage on the enemy with the least life
+
+    Ties go to the first skill of the actor and to the first enemy in the turn order, and the actor rests
+    when no skill is usable.
+    """
+    attack_actions = state.attack_actions()
+    if not attack_actions:
+        return REST_ACTION
+    rules = state.rules
+    skill = max((action.skill for action in attack_actions), key=rules.damages.__getitem__)
+    if rules.area[skill]:
+        return CompactAction(skill, ALL_TARGETS)
+    target = min(state.alive_enemies(state.actor), key=state.life.__getitem__)
+    return CompactAction(skill, target)
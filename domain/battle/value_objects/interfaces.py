@@ -1,18 +1,35 @@
 from abc import ABCMeta, abstractmethod
 from enum import Enum
-from typing import Callable
+from typing import Callable, Iterable, Mapping, NamedTuple
 
 from domain import IEntityID
 from domain.character import ICharacter
 from domain.skill import IAttackable
 
+from .move_log import MoveLog
+
+
+class LegalMove(NamedTuple):
+    """Attack the playing Character can afford against an enemy alive"""
+
+    skill: IAttackable
+    target_id: IEntityID
+
 
 class IMove(metaclass=ABCMeta):
     """Interface that defines the public methods in Move"""
 
     @classmethod
     @abstractmethod
-    def create_new(cls, playing_character: ICharacter, enemy_characters: tuple[ICharacter, ...]) -> "IMoveBuilder":
+    def create_new(
+        cls,
+        playing_character: ICharacter,
+        enemy_characters: tuple[ICharacter, ...],
+        *,
+        move_log: MoveLog | None = None,
+        turn: int = 0,
+        enemy_index: Mapping[IEntityID, ICharacter] | None = None,
+    ) -> "IMoveBuilder":
         ...
 
 
@@ -31,6 +48,29 @@ class IMoveBuilder(IRestBuilder, metaclass=ABCMeta):
     def attack(self, target_enemy_id: IEntityID, attack_skill: IAttackable) -> IRestBuilder:
         ...
 
+    @abstractmethod
+    def attack_many(self, target_enemy_ids: Iterable[IEntityID], attack_skill: IAttackable) -> IRestBuilder:
+        ...
+
+    @abstractmethod
+    def attack_all(self, attack_skill: IAttackable) -> IRestBuilder:
+        ...
+
+    @property
+    @abstractmethod
+    def playing_character(self) -> ICharacter:
+        ...
+
+    @property
+    @abstractmethod
+    def legal_moves(self) -> tuple[LegalMove, ...]:
+        """Every skill ready and affordable by the playing Character paired with every enemy alive"""
+
+    @property
+    @abstractmethod
+    def enemy_index(self) -> Mapping[IEntityID, ICharacter]:
+        """Enemies of the playing Character by their id, the same mapping for every turn of its side"""
+
 
 class ITeam(metaclass=ABCMeta):
     """Interface that defines the public methods that Battle expects to find in Team"""
@@ -116,6 +156,11 @@ class IPassTurnAlgorithm(metaclass=ABCMeta):
     def enemies(self) -> tuple[ICharacter, ...]:
         """Returns the enemies of the current character""" ""
 
+    @property
+    @abstractmethod
+    def enemy_index(self) -> Mapping[IEntityID, ICharacter]:
+        """Returns every character, alive or not, that is an enemy of the current character, by ID"""
+
     @property
     @abstractmethod
     def finalists(self) -> tuple[tuple[ICharacter, ...], tuple[ICharacter, ...]] | None:
@@ -0,0 +1,127 @@
+"""Module describes the lookahead move policy, a Monte Carlo tree search over compact Battle states"""
+import math
+from random import Random
+from time import perf_counter
+from typing import Callable
+
+from .compact_state import ALL_TARGETS, REST, REST_ACTION, CompactAction, CompactBattleRules, CompactBattleState
+from .interfaces import IBattleAllies, IMoveBuilder
+
+
+class _SearchNode:
+    """Node of the search tree, reached by the action of the given side from its parent"""
+
+    __slots__ = ("parent", "action", "side", "children", "untried_actions", "visits", "value")
+
+    def __init__(
+        self,
+        parent: "_SearchNode | None",
+        action: CompactAction,
+        side: int | None,
+        untried_actions: list[CompactAction],
+    ) -> None:
+        self.parent = parent
+        self.action = action
+        self.side = side
+        self.children: list[_SearchNode] = []
+        self.untried_actions = untried_actions
+        self.visits = 0
+        self.value = 0.0
+
+    def best_child(self, exploration: float) -> "_SearchNode":
+        log_visits = math.log(self.visits)
+        return max(
+            self.children,
+            key=lambda child: child.value / child.visits + exploration * math.sqrt(log_visits / child.visits),
+        )
+
+
+class MCTSPolicy:
+    """Chooses the move of the playing Character searching the next turns of the Battle
+
+    Each iteration replays the tree from a copy of the compact state of the turn, expands one node and
+    finishes with a random playout of at most ``rollout_depth`` turns. The search stops once the time
+    budget, in seconds, is spent or after ``max_iterations``, whichever happens first.
+    """
+
+    def __init__(
+        self,
+        participants_battle_allies: tuple[IBattleAllies, ...],
+        time_budget: float = 0.05,
+        max_iterations: int | None = None,
+        rollout_depth: int = 30,
+        exploration: float = math.sqrt(2),
+        seed: int | None = None,
+        clock: Callable[[], float] = perf_counter,
+    ) -> None:
+        self.__rules = CompactBattleRules(participants_battle_allies)
+        self.__time_budget = time_budget
+        self.__max_iterations = max_iterations
+        self.__rollout_depth = rollout_depth
+        self.__exploration = exploration
+        self.__random = Random(seed)
+        self.__clock = clock
+        self.__nodes = 0
+        self.__iterations = 0
+
+    @property
+    def nodes(self) -> int:
+        """Nodes expanded by every search of the policy"""
+        return self.__nodes
+
+    @property
+    def iterations(self) -> int:
+        return self.__iterations
+
+    def __call__(self, move_builder: IMoveBuilder) -> None:
+        action = self.search(CompactBattleState.snapshot(self.__rules, move_builder.playing_character))
+        if action.skill == REST:
+            move_builder.rest()
+            return
+        skill = self.__rules.skills[action.skill]
+        if action.target == ALL_TARGETS:
+            move_builder.attack_all(skill)
+        else:
+            move_builder.attack(self.__rules.characters[action.target].entity_id, skill)
+
+    def search(self, state: CompactBattleState) -> CompactAction:
+        """Returns the most visited action of the actor of the state"""
+        root = _SearchNode(None, REST_ACTION, None, state.legal_actions())
+        deadline = self.__clock() + self.__time_budget
+        iterations = 0
+        while iterations == 0 or (
+            self.__clock() < deadline and (self.__max_iterations is None or iterations < self.__max_iterations)
+        ):
+            self.__iterate(root, state.copy())
+            iterations += 1
+        self.__iterations += iterations
+        if not root.children:
+            return REST_ACTION
+        return max(root.children, key=lambda child: child.visits).action
+
+    def __iterate(self, root: _SearchNode, state: CompactBattleState) -> None:
+        node = root
+        while not node.untried_actions and node.children:
+            node = node.best_child(self.__exploration)
+            state.play(node.action)
+        if node.untried_actions and state.winner is None:
+            action = node.untried_actions.pop(self.__random.randrange(len(node.untried_actions)))
+            side = self.__rules.sides[state.actor]
+            state.play(action)
+            node.children.append(_SearchNode(node, action, side, state.legal_actions()))
+            node = node.children[-1]
+            self.__nodes += 1
+        self.__rollout(state)
+        visited_node: _SearchNode | None = node
+        while visited_node is not None:
+            visited_node.visits += 1
+            if visited_node.side is not None:
+                visited_node.value += state.score(visited_node.side)
+            visited_node = visited_node.parent
+
+    def __rollout(self, state: CompactBattleState) -> None:
+        for _ in range(self.__rollout_depth):
+            if state.winner is not None:
+                return
+            attack_actions = state.attack_actions()
+            state.play(self.__random.choice(attack_actions) if attack_actions else REST_ACTION)
@@ -1,8 +1,13 @@
+from typing import Iterable, Mapping
+
 from domain import IEntityID, ValueObject
 from domain.character import ICharacter
+from domain.damage_modifiers import DamageTable
 from domain.skill import IAttackable
 
-from .interfaces import IMove, IMoveBuilder, IRestBuilder
+from ..exceptions import EnemyNotFoundException
+from .interfaces import IMove, IMoveBuilder, IRestBuilder, LegalMove
+from .move_log import MoveLog
 
 
 class Move(ValueObject, IMove):
@@ -15,28 +20,126 @@ class Move(ValueObject, IMove):
         self,
         playing_character: ICharacter,
         enemy_characters: tuple[ICharacter, ...],
+        move_log: MoveLog | None,
+        turn: int,
+        enemy_index: Mapping[IEntityID, ICharacter] | None,
+        damage_table: DamageTable | None = None,
     ) -> None:
         self.__playing_character = playing_character
         self.__enemy_characters = enemy_characters
+        self.__move_log = move_log
+        self.__turn = turn
+        self.__enemy_index = enemy_index
+        self.__damage_table = damage_table
+        self.__legal_moves: tuple[LegalMove, ...] | None = None
 
     @classmethod
-    def create_new(cls, playing_character: ICharacter, enemy_characters: tuple[ICharacter, ...]) -> IMoveBuilder:
+    def create_new(
+        cls,
+        playing_character: ICharacter,
+        enemy_characters: tuple[ICharacter, ...],
+        *,
+        move_log: MoveLog | None = None,
+        turn: int = 0,
+        enemy_index: Mapping[IEntityID, ICharacter] | None = None,
+        damage_table: DamageTable | None = None,
+    ) -> IMoveBuilder:
         new_move = cls.__new__(cls)
-        new_move._init(playing_character, enemy_characters)
+        new_move._init(playing_character, enemy_characters, move_log, turn, enemy_index, damage_table)
         return _MoveBuilder(new_move)
 
+    @property
+    def _playing_character(self) -> ICharacter:
+        return self.__playing_character
+
+    @property
+    def _enemy_index(self) -> Mapping[IEntityID, ICharacter]:
+        if self.__enemy_index is None:
+            self.__enemy_index = {enemy.entity_id: enemy for enemy in self.__enemy_characters}
+        return self.__enemy_index
+
+    @property
+    def _legal_moves(self) -> tuple[LegalMove, ...]:
+        """Legal moves of the turn, derived again only after an action of the Move changes the state"""
+        if self.__legal_moves is None:
+            alive_enemies = tuple(enemy for enemy in self.__enemy_characters if enemy.is_alive)
+            self.__legal_moves = tuple(
+                LegalMove(skill, enemy.entity_id)
+                for skill in self.__playing_character.affordable_attack_skills
+                for enemy in alive_enemies
+            )
+        return self.__legal_moves
+
     def _attack(self, target_enemy_id: IEntityID, attack_skill: IAttackable) -> None:
+        self.__legal_moves = None
         target_enemy = self.__specific_enemy(target_enemy_id)
-        self.__playing_character.attack(attack_skill.entity_id, target_enemy)
+        damage = self.__playing_character.attack(attack_skill.entity_id, target_enemy, self.__damage_table)
+        if self.__move_log is not None:
+            self.__move_log.record_attack(
+                self.__turn,
+                self.__playing_character.entity_id,
+                target_enemy.entity_id,
+                attack_skill.entity_id,
+                damage,
+            )
+
+    def _attack_many(self, target_enemy_ids: Iterable[IEntityID], attack_skill: IAttackable) -> None:
+        target_enemies = tuple(
+            self.__specific_enemy(target_enemy_id) for target_enemy_id in dict.fromkeys(target_enemy_ids)
+        )
+        self.__attack_targets(target_enemies, attack_skill)
+
+    def _attack_all(self, attack_skill: IAttackable) -> None:
+        self.__attack_targets(tuple(enemy for enemy in self.__enemy_characters if enemy.is_alive), attack_skill)
+
+    def __attack_targets(self, target_enemies: tuple[ICharacter, ...], attack_skill: IAttackable) -> None:
+        self.__legal_moves = None
+        damages = self.__playing_character.attack_many(attack_skill.entity_id, target_enemies, self.__damage_table)
+        if self.__move_log is None:
+            return
+        for target_enemy, damage in zip(target_enemies, damages):
+            self.__move_log.record_attack(
+                self.__turn,
+                self.__playing_character.entity_id,
+                target_enemy.entity_id,
+                attack_skill.entity_id,
+                damage,
+            )
 
     def _rest(self) -> None:
+        self.__legal_moves = None
         self.__playing_character.rest()
+        if self.__move_log is not None:
+            self.__move_log.record_rest(self.__turn, self.__playing_character.entity_id)
 
     def __specific_enemy(self, character_id: IEntityID) -> ICharacter:
-        def _is_enemy(character: ICharacter) -> bool:
-            return character.entity_id == character_id
+        enemy = self._enemy_index.get(character_id)
+        if enemy is None or not enemy.is_alive:
+            raise EnemyNotFoundException(f"Character <{character_id}> is not an enemy alive in the Battle")
+        return enemy
+
+
+class MoveContext:
+    """Move and builders of a Battle, reset every turn instead of allocated again
+
+    The Move handed to the caller through the builders is only valid during its own turn.
+    """
+
+    def __init__(self, move_log: MoveLog | None = None, damage_table: DamageTable | None = None) -> None:
+        self.__move_log = move_log
+        self.__damage_table = damage_table
+        self.__move = Move.__new__(Move)
+        self.__move_builder = _MoveBuilder(self.__move)
 
-        return next(filter(_is_enemy, self.__enemy_characters))
+    def next_move(
+        self,
+        playing_character: ICharacter,
+        enemy_characters: tuple[ICharacter, ...],
+        turn: int,
+        enemy_index: Mapping[IEntityID, ICharacter] | None = None,
+    ) -> IMoveBuilder:
+        self.__move._init(playing_character, enemy_characters, self.__move_log, turn, enemy_index, self.__damage_table)
+        return self.__move_builder
 
 
 class _RestBuilder(IRestBuilder):
@@ -50,9 +153,30 @@ class _RestBuilder(IRestBuilder):
 
 class _MoveBuilder(IMoveBuilder, _RestBuilder):
     def __init__(self, move_obj: Move) -> None:
+        super().__init__(move_obj)
         self.__move_obj = move_obj
+        self.__rest_builder = _RestBuilder(move_obj)
 
     def attack(self, target_enemy_id: IEntityID, attack_skill: IAttackable) -> IRestBuilder:
         self.__move_obj._attack(target_enemy_id, attack_skill)
-        rest_builder = _RestBuilder(self.__move_obj)
-        return rest_builder
+        return self.__rest_builder
+
+    def attack_many(self, target_enemy_ids: Iterable[IEntityID], attack_skill: IAttackable) -> IRestBuilder:
+        self.__move_obj._attack_many(target_enemy_ids, attack_skill)
+        return self.__rest_builder
+
+    def attack_all(self, attack_skill: IAttackable) -> IRestBuilder:
+        self.__move_obj._attack_all(attack_skill)
+        return self.__rest_builder
+
+    @property
+    def playing_character(self) -> ICharacter:
+        return self.__move_obj._playing_character
+
+    @property
+    def legal_moves(self) -> tuple[LegalMove, ...]:
+        return self.__move_obj._legal_moves
+
+    @property
+    def enemy_index(self) -> Mapping[IEntityID, ICharacter]:
+        return self.__move_obj._enemy_index
@@ -0,0 +1,51 @@
+from enum import IntEnum
+from typing import Iterator, NamedTuple
+
+from domain import IEntityID
+
+
+class MoveActionEnum(IntEnum):
+    """Enum that defines the actions a Move can record"""
+
+    ATTACK = 1
+    REST = 2
+
+
+class MoveRecord(NamedTuple):
+    """Record of a single action performed during a turn of the Battle"""
+
+    turn: int
+    action: MoveActionEnum
+    actor_id: IEntityID
+    target_id: IEntityID | None
+    skill_id: IEntityID | None
+    damage: int
+
+
+class MoveLog:
+    """Append-only log of every action performed in a Battle"""
+
+    def __init__(self) -> None:
+        self.__records: list[MoveRecord] = []
+
+    def record_attack(
+        self, turn: int, actor_id: IEntityID, target_id: IEntityID, skill_id: IEntityID, damage: int
+    ) -> None:
+        self.__records.append(MoveRecord(turn, MoveActionEnum.ATTACK, actor_id, target_id, skill_id, damage))
+
+    def record_rest(self, turn: int, actor_id: IEntityID) -> None:
+        self.__records.append(MoveRecord(turn, MoveActionEnum.REST, actor_id, None, None, 0))
+
+    @property
+    def records(self) -> tuple[MoveRecord, ...]:
+        return tuple(self.__records)
+
+    def records_since(self, position: int) -> tuple[MoveRecord, ...]:
+        """Returns the records appended after the given position of the log"""
+        return tuple(self.__records[position:])
+
+    def __iter__(self) -> Iterator[MoveRecord]:
+        return iter(self.__records)
+
+    def __len__(self) -> int:
+        return len(self.__records)
@@ -0,0 +1,160 @@
+"""Module describes the move policies that choose the move of a Character, e.g. for auto-battle
+
+A policy is a callable that builds the move, so it is passed to ``Battle.play`` as is. Targets are read
+from a heap of the enemies of the playing side ordered by their life points, kept up to date by the damage
+they receive, so choosing a move never scans every enemy.
+"""
+import heapq
+from abc import ABCMeta, abstractmethod
+from itertools import count
+from typing import Iterable
+from weakref import WeakKeyDictionary, finalize
+
+from domain import IEntityID
+from domain.character import ICharacter
+from domain.skill import IAttackable, IMagicalAttack
+
+from .interfaces import IMoveBuilder
+
+
+class LowestLifeHeap:
+    """Heap of Characters ordered by their life points, updated every time one of them is damaged
+
+    Every Character has a single entry that is current, the one with its latest sequence. Damage pushes
+    a fresh entry, and the outdated ones are discarded when they reach the top or when they outnumber
+    the current ones.
+    """
+
+    def __init__(self, characters: Iterable[ICharacter]) -> None:
+        self.__characters = tuple(characters)
+        self.__sequence = count()
+        self.__entries: list[tuple[int, int, ICharacter]] = []
+        self.__latest_sequences: dict[IEntityID, int] = {}
+        for character in self.__characters:
+            character._add_damage_listener(self._on_damage)
+            if character.is_alive:
+                self.__entries.append(self.__new_entry(character))
+        heapq.heapify(self.__entries)
+
+    def __len__(self) -> int:
+        return len(self.__latest_sequences)
+
+    def close(self) -> None:
+        """Stop following the damage of the Characters, which then no longer reference the heap"""
+        for character in self.__characters:
+            character._remove_damage_listener(self._on_damage)
+
+    def _on_damage(self, character: ICharacter) -> None:
+        if not character.is_alive:
+            self.__latest_sequences.pop(character.entity_id, None)
+        elif character.entity_id in self.__latest_sequences:
+            heapq.heappush(self.__entries, self.__new_entry(character))
+        if len(self.__entries) > 2 * len(self.__latest_sequences) + 1:
+            self.__entries = [entry for entry in self.__entries if self.__is_latest(entry)]
+            heapq.heapify(self.__entries)
+
+    def lowest(self, quantity: int = 1) -> tuple[ICharacter, ...]:
+        """Returns up to the given quantity of Characters alive with the lowest life points"""
+        lowest_entries: list[tuple[int, int, ICharacter]] = []
+        while self.__entries and len(lowest_entries) < quantity:
+            life_points, _, character = entry = heapq.heappop(self.__entries)
+            if not self.__is_latest(entry):
+                continue
+            if life_points != character.current_life_points:
+                heapq.heappush(self.__entries, self.__new_entry(character))
+                continue
+            lowest_entries.append(entry)
+        for entry in lowest_entries:
+            heapq.heappush(self.__entries, entry)
+        return tuple(character for _, _, character in lowest_entries)
+
+    def __new_entry(self, character: ICharacter) -> tuple[int, int, ICharacter]:
+        sequence = self.__latest_sequences[character.entity_id] = next(self.__sequence)
+        return character.current_life_points, sequence, character
+
+    def __is_latest(self, entry: tuple[int, int, ICharacter]) -> bool:
+        _, sequence, character = entry
+        return self.__latest_sequences.get(character.entity_id) == sequence
+
+
+_NO_ENEMIES = LowestLifeHeap(())
+
+
+def _close_heaps(battle_heaps: dict[int, LowestLifeHeap]) -> None:
+    for enemies_heap in battle_heaps.values():
+        enemies_heap.close()
+
+
+class MovePolicy(metaclass=ABCMeta):
+    """Chooses and builds the move of the playing Character against the enemies in the heap
+
+    The same policy plays every side of a Battle, keeping a heap for the enemies of each side. The heaps
+    are scoped to the move builder of the Battle, and closed once the Battle no longer exists.
+    """
+
+    def __init__(self) -> None:
+        self.__heaps: WeakKeyDictionary[IMoveBuilder, dict[int, LowestLifeHeap]] = WeakKeyDictionary()
+        self._enemies = _NO_ENEMIES
+
+    def __call__(self, move_builder: IMoveBuilder) -> None:
+        self._enemies = self.__enemies_heap(move_builder)
+        try:
+            skills = move_builder.playing_character.affordable_attack_skills
+            skill = self._choose_skill(skills) if skills and len(self._enemies) else None
+            if skill is None:
+                move_builder.rest()
+            elif skill.max_targets is None:
+                move_builder.attack_all(skill)
+            elif skill.max_targets == 1:
+                move_builder.attack(self._enemies.lowest()[0].entity_id, skill)
+            else:
+                move_builder.attack_many((enemy.entity_id for enemy in self._enemies.lowest(skill.max_targets)), skill)
+        finally:
+            self._enemies = _NO_ENEMIES
+
+    def __enemies_heap(self, move_builder: IMoveBuilder) -> LowestLifeHeap:
+        battle_heaps = self.__heaps.get(move_builder)
+        if battle_heaps is None:
+            battle_heaps = self.__heaps[move_builder] = {}
+            finalize(move_builder, _close_heaps, battle_heaps)
+        enemy_index = move_builder.enemy_index
+        enemies_heap = battle_heaps.get(id(enemy_index))
+        if enemies_heap is None:
+            enemies_heap = battle_heaps[id(enemy_index)] = LowestLifeHeap(enemy_index.values())
+        return enemies_heap
+
+    @abstractmethod
+    def _choose_skill(self, skills: tuple[IAttackable, ...]) -> IAttackable | None:
+        """Choose one of the skills the playing Character can afford, or None to rest"""
+
+    def _total_damage(self, skill: IAttackable) -> int:
+        enemies_hit = len(self._enemies) if skill.max_targets is None else min(skill.max_targets, len(self._enemies))
+        return skill.damage * enemies_hit
+
+
+class HighestDamagePolicy(MovePolicy):
+    """Uses the skill that deals the most damage in total, hitting the enemies with the lowest life points"""
+
+    def _choose_skill(self, skills: tuple[IAttackable, ...]) -> IAttackable | None:
+        return max(skills, key=self._total_damage)
+
+
+class FocusLowestLifePolicy(MovePolicy):
+    """Focuses the enemy with the lowest life points, finishing it with the cheapest skill able to do it"""
+
+    def _choose_skill(self, skills: tuple[IAttackable, ...]) -> IAttackable | None:
+        target_life_points = self._enemies.lowest()[0].current_life_points
+        finishing_skills = [skill for skill in skills if skill.damage >= target_life_points]
+        if finishing_skills:
+            return min(finishing_skills, key=lambda skill: skill.cost)
+        return max(skills, key=lambda skill: skill.damage)
+
+
+class ManaConservingPolicy(MovePolicy):
+    """Prefers the skills that cost no mana, casting spells only when no other attack is affordable"""
+
+    def _choose_skill(self, skills: tuple[IAttackable, ...]) -> IAttackable | None:
+        free_skills = [skill for skill in skills if not isinstance(skill, IMagicalAttack)]
+        if free_skills:
+            return max(free_skills, key=self._total_damage)
+        return max(skills, key=lambda skill: self._total_damage(skill) / max(skill.cost, 1))
@@ -1,6 +1,7 @@
 from abc import ABCMeta
-from typing import Type
+from typing import Mapping, Type
 
+from domain import IEntityID
 from domain.character import ICharacter
 
 from .interfaces import IBattleAllies, IPassTurnAlgorithm, ITeam, PassTurnAlgorithmEnum
@@ -20,6 +21,17 @@ class _BasePassTurnAlgorithm(IPassTurnAlgorithm, metaclass=ABCMeta):
             index: self.__organize_team_positions(battle_allies)
             for index, battle_allies in enumerate(participants_battle_allies)
         }
+        self._enemy_indexes: dict[int, dict[IEntityID, ICharacter]] = {
+            battle_allies_index: {
+                enemy.entity_id: enemy
+                for enemies_index, enemy_teams in self._static_turn_positions.items()
+                if enemies_index != battle_allies_index
+                for enemies in enemy_teams.values()
+                for enemy in enemies.values()
+            }
+            for battle_allies_index in self._static_turn_positions
+        }
+        self._alive_enemies: dict[int, tuple[ICharacter, ...]] = {}
 
     @property
     def current_character(self) -> ICharacter:
@@ -27,15 +39,17 @@ class _BasePassTurnAlgorithm(IPassTurnAlgorithm, metaclass=ABCMeta):
 
     @property
     def enemies(self) -> tuple[ICharacter, ...]:
-        enemies_groups = self._static_turn_positions.copy()
-        enemies_groups.pop(self._playing_battle_allies)
-        return tuple(
-            enemy
-            for enemy_teams in enemies_groups.values()
-            for enemies in enemy_teams.values()
-            for enemy in enemies.values()
-            if enemy.is_alive
-        )
+        """Alive enemies, rebuilt only after one of them dies, since characters never come back to life"""
+        alive_enemies = self._alive_enemies.get(self._playing_battle_allies)
+        if alive_enemies is None or not all(enemy.is_alive for enemy in alive_enemies):
+            alive_enemies = self._alive_enemies[self._playing_battle_allies] = tuple(
+                enemy for enemy in self._enemy_indexes[self._playing_battle_allies].values() if enemy.is_alive
+            )
+        return alive_enemies
+
+    @property
+    def enemy_index(self) -> Mapping[IEntityID, ICharacter]:
+        return self._enemy_indexes[self._playing_battle_allies]
 
     @property
     def finalists(self) -> tuple[tuple[ICharacter, ...], tuple[ICharacter, ...]] | None:
@@ -106,7 +120,6 @@ class JumpNextPassTurn(_BasePassTurnAlgorithm):
 class PassTurnAlgorithmStrategy(IPassTurnAlgorithm):
     """Class that implements the Strategy Pattern to define the algorithm of a PassTurnAlgorithm"""
 
-    __pass_turn_algorithm_cache: dict[PassTurnAlgorithmEnum, IPassTurnAlgorithm] = {}
     __available_algorithms: dict[PassTurnAlgorithmEnum, Type[_BasePassTurnAlgorithm]] = {
         PassTurnAlgorithmEnum.REGULAR_PASS_TURN: RegularPassTurn,
         PassTurnAlgorithmEnum.JUMP_TO_THE_NEXT_PASS_TURN_ALGORITHM: JumpNextPassTurn,
@@ -119,6 +132,7 @@ class PassTurnAlgorithmStrategy(IPassTurnAlgorithm):
     ) -> None:
         self.__pass_turn_algorithm_enum = pass_turn_algorithm_enum
         self.__participants_battle_allies = participants_battle_allies
+        self.__pass_turn_algorithm_cache: dict[PassTurnAlgorithmEnum, IPassTurnAlgorithm] = {}
 
     @property
     def current_character(self) -> ICharacter:
@@ -138,6 +152,15 @@ class PassTurnAlgorithmStrategy(IPassTurnAlgorithm):
             msg = f"Algorithm <{self.__pass_turn_algorithm_enum.value}> is not available"
             raise NotImplementedError(msg) from error
 
+    @property
+    def enemy_index(self) -> Mapping[IEntityID, ICharacter]:
+        try:
+            self.__singleton_cache(self.__pass_turn_algorithm_enum)
+            return self.__pass_turn_algorithm_cache[self.__pass_turn_algorithm_enum].enemy_index
+        except KeyError as error:
+            msg = f"Algorithm <{self.__pass_turn_algorithm_enum.value}> is not available"
+            raise NotImplementedError(msg) from error
+
     @property
     def finalists(self) -> tuple[tuple[ICharacter, ...], tuple[ICharacter, ...]] | None:
         try:
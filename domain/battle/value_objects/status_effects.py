@@ -0,0 +1,123 @@
+"""Module describes the effects that act on the Characters over several turns of the Battle"""
+from enum import IntEnum
+from typing import Generic, TypeVar
+
+from domain.character import ICharacter, ShieldLayer
+
+from ..exceptions import InvalidStatusEffectException
+
+T_entry = TypeVar("T_entry")
+
+
+class StatusEffectKindEnum(IntEnum):
+    """Enum that defines the available status effects"""
+
+    POISON = 1
+    REGENERATION = 2
+    SHIELD = 3
+
+
+class StatusEffect:
+    """Effect applied to a Character until the turn it expires"""
+
+    __slots__ = ("kind", "target", "magnitude", "period", "expires_at_turn", "shield_layer")
+
+    def __init__(
+        self, kind: StatusEffectKindEnum, target: ICharacter, magnitude: int, period: int, expires_at_turn: int
+    ) -> None:
+        self.kind = kind
+        self.target = target
+        self.magnitude = magnitude
+        self.period = period
+        self.expires_at_turn = expires_at_turn
+        self.shield_layer: ShieldLayer | None = None
+
+
+class EffectTimerWheel(Generic[T_entry]):
+    """Hashed timer wheel indexed by turn
+
+    An entry due on a turn sits in the slot ``turn % slots``, so advancing to a turn only touches the
+    entries of a single slot, no matter how many entries are scheduled for the turns ahead.
+    """
+
+    def __init__(self, slots: int = 64) -> None:
+        if slots < 1:
+            raise ValueError("The timer wheel should have at least one slot.")
+        self.__slots: list[list[tuple[int, T_entry]]] = [[] for _ in range(slots)]
+        self.__size = 0
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def schedule(self, due_turn: int, entry: T_entry) -> None:
+        self.__slots[due_turn % len(self.__slots)].append((due_turn, entry))
+        self.__size += 1
+
+    def pop_due(self, turn: int) -> list[T_entry]:
+        """Remove and return the entries due on the given turn, in the order they were scheduled"""
+        slot = self.__slots[turn % len(self.__slots)]
+        due_entries = [entry for due_turn, entry in slot if due_turn <= turn]
+        if due_entries:
+            slot[:] = [(due_turn, entry) for due_turn, entry in slot if due_turn > turn]
+            self.__size -= len(due_entries)
+        return due_entries
+
+
+class StatusEffectEngine:
+    """Applies the status effects of a Battle, touching on each turn only the effects due on it
+
+    Poison and regeneration tick every ``period`` turns until they expire, poison damage going through
+    ``Character._receive_attack`` and thus through the shields; a shield is granted at once as a layer of
+    its own, which damage spends before the permanent shield points, and only the points left of that
+    layer are revoked when it expires.
+    """
+
+    def __init__(self, slots: int = 64) -> None:
+        self.__wheel: EffectTimerWheel[StatusEffect] = EffectTimerWheel(slots)
+        self.__knocked_out = 0
+
+    def __len__(self) -> int:
+        """Number of effects still active"""
+        return len(self.__wheel)
+
+    @property
+    def knocked_out(self) -> int:
+        """Number of Characters knocked out by the effects of the last turn"""
+        return self.__knocked_out
+
+    def apply(
+        self,
+        kind: StatusEffectKindEnum,
+        target: ICharacter,
+        magnitude: int,
+        duration: int,
+        turn: int,
+        period: int = 1,
+    ) -> StatusEffect:
+        if magnitude < 0 or duration < 1 or period < 1:
+            raise InvalidStatusEffectException()
+        effect = StatusEffect(kind, target, magnitude, period, turn + duration)
+        if kind is StatusEffectKindEnum.SHIELD:
+            effect.shield_layer = target._grant_temporary_shield(magnitude)
+            self.__wheel.schedule(effect.expires_at_turn, effect)
+        elif turn + period <= effect.expires_at_turn:
+            self.__wheel.schedule(turn + period, effect)
+        return effect
+
+    def on_turn(self, turn: int) -> int:
+        """Apply the effects due on the turn, returning how many Characters they knocked out"""
+        self.__knocked_out = 0
+        for effect in self.__wheel.pop_due(turn):
+            if effect.shield_layer is not None:
+                effect.target._revoke_shield(effect.shield_layer)
+                continue
+            if not effect.target.is_alive:
+                continue
+            if effect.kind is StatusEffectKindEnum.POISON:
+                effect.target._receive_attack(effect.magnitude)
+                self.__knocked_out += not effect.target.is_alive
+            else:
+                effect.target._heal(effect.magnitude)
+            if turn + effect.period <= effect.expires_at_turn:
+                self.__wheel.schedule(turn + effect.period, effect)
+        return self.__knocked_out
@@ -41,5 +41,8 @@ class _TeamBuilder(ITeamBuilder):
     def build(self) -> ITeam:
         if len(self.__characters) == 0:
             raise ValueError("Team should have at least one Character.")
-        self.__team._set_characters(tuple(self.__characters))
+        characters = tuple(self.__characters)
+        for character in characters:
+            character._set_ally_death_listeners(characters)
+        self.__team._set_characters(characters)
         return self.__team
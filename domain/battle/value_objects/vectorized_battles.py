@@ -0,0 +1,173 @@
+"""Module describes a structure-of-arrays engine that plays many battles with the same rules in lockstep
+
+Every battle is a row of NumPy arrays with the points of each Character and the loading time of each
+attack skill, indexed as in ``CompactBattleRules``. A step plays the turn of the same Character in every
+battle still ongoing, with the rules of ``CompactBattleState.play``, and then looks for the finalists.
+
+NumPy is an optional dependency (``pip install death-march[simulation]``), so this module is not
+re-exported by the package.
+"""
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .compact_state import ALL_TARGETS, REST, CompactBattleRules, CompactBattleState
+
+NO_WINNER = -1
+
+
+class VectorizedBattles:
+    """Battles with the same rules, advanced together by array operations"""
+
+    def __init__(
+        self,
+        rules: CompactBattleRules,
+        life: NDArray[np.int64],
+        shield: NDArray[np.int64],
+        stamina: NDArray[np.int64],
+        mana: NDArray[np.int64],
+        loading: NDArray[np.int64],
+        turn: int,
+    ) -> None:
+        self.__rules = rules
+        self.life = life
+        self.shield = shield
+        self.stamina = stamina
+        self.mana = mana
+        self.loading = loading
+        self.just_used = np.zeros_like(loading, dtype=bool)
+        self.winners = np.full(len(life), NO_WINNER, dtype=np.int64)
+        self.__turn = turn
+        self.__costs = np.array(rules.costs, dtype=np.int64)
+        self.__damages = np.array(rules.damages, dtype=np.int64)
+        self.__cooldowns = np.array(rules.cooldowns, dtype=np.int64)
+        self.__magical = np.array(rules.magical, dtype=bool)
+        self.__area = np.array(rules.area, dtype=bool)
+        self.__owners = np.array(
+            [owner for owner, skills in enumerate(rules.skills_of) for _ in skills], dtype=np.int64
+        )
+        sides = np.array(rules.sides, dtype=np.int64)
+        self.__enemy_masks = sides[:, None] != sides[None, :]
+        self.__side_masks = sides[None, :] == np.arange(rules.side_quantity)[:, None]
+        self.__detect_finalists()
+
+    @classmethod
+    def from_states(cls, states: Sequence[CompactBattleState]) -> "VectorizedBattles":
+        """Stack the compact states of battles with the same rules, all of them at the same turn"""
+        rules = states[0].rules
+        for state in states:
+            if state.turn != states[0].turn or not _same_rules(state.rules, rules):
+                raise ValueError("Battles should share the rules and the turn to be played in lockstep.")
+        return cls(
+            rules,
+            np.array([state.life for state in states], dtype=np.int64),
+            np.array([state.shield for state in states], dtype=np.int64),
+            np.array([state.stamina for state in states], dtype=np.int64),
+            np.array([state.mana for state in states], dtype=np.int64),
+            np.array([state.loading for state in states], dtype=np.int64),
+            states[0].turn,
+        )
+
+    @property
+    def turn(self) -> int:
+        return self.__turn
+
+    @property
+    def actor(self) -> int:
+        return self.__turn % len(self.__rules.characters)
+
+    @property
+    def finished(self) -> NDArray[np.bool_]:
+        return self.winners != NO_WINNER
+
+    def greedy_actions(self) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Skill and target of every battle chosen as ``greedy_action`` does, REST when no skill is usable"""
+        actor = self.actor
+        skills = np.array(self.__rules.skills_of[actor], dtype=np.int64)
+        quantity = len(self.life)
+        if len(skills) == 0:
+            return np.full(quantity, REST, dtype=np.int64), np.full(quantity, REST, dtype=np.int64)
+        alive = self.life > 0
+        enemies = alive & self.__enemy_masks[actor]
+        points = np.where(self.__magical[skills], self.mana[:, actor, None], self.stamina[:, actor, None])
+        usable = (self.loading[:, skills] == 0) & (self.__costs[skills] <= points) & alive[:, actor, None]
+        scores = np.where(usable, self.__damages[skills], -1)
+        best = np.argmax(scores, axis=1)
+        resting = scores[np.arange(quantity), best] < 0
+        chosen_skills = np.where(resting, REST, skills[best])
+        lowest_enemies = np.argmin(np.where(enemies, self.life, np.iinfo(np.int64).max), axis=1)
+        targets = np.where(resting, REST, np.where(self.__area[skills[best]], ALL_TARGETS, lowest_enemies))
+        return chosen_skills, targets
+
+    def step(self, skills: NDArray[np.int64], targets: NDArray[np.int64]) -> None:
+        """Play the turn of the actor in every battle still ongoing, then rest the actor and its enemies"""
+        actor = self.actor
+        active = ~self.finished
+        enemies = (self.life > 0) & self.__enemy_masks[actor] & active[:, None]
+        rows = np.flatnonzero(active & (skills != REST))
+        if len(rows):
+            self.__attack(actor, rows, skills[rows], targets[rows], enemies[rows])
+        rests = enemies.astype(np.int64)
+        rests[:, actor] = active * np.where(skills == REST, 2, 1)
+        skill_rests = rests[:, self.__owners]
+        self.__rest(skill_rests >= 1)
+        self.__rest(skill_rests >= 2)
+        self.__turn += 1
+        self.__detect_finalists()
+
+    def run(self, max_turns: int) -> int:
+        """Play the greedy policy until every battle is finished, returning the turns played"""
+        turns = 0
+        while turns < max_turns and not self.finished.all():
+            self.step(*self.greedy_actions())
+            turns += 1
+        return turns
+
+    def __attack(
+        self,
+        actor: int,
+        rows: NDArray[np.intp],
+        skills: NDArray[np.int64],
+        targets: NDArray[np.int64],
+        enemies: NDArray[np.bool_],
+    ) -> None:
+        self.loading[rows, skills] = self.__cooldowns[skills]
+        self.just_used[rows, skills] = True
+        costs, magical = self.__costs[skills], self.__magical[skills]
+        for points, paying in ((self.mana, magical), (self.stamina, ~magical)):
+            paying_rows = rows[paying]
+            points[paying_rows, actor] -= np.minimum(costs[paying], points[paying_rows, actor])
+        area = self.__area[skills]
+        hits = np.where(area[:, None], enemies, False)
+        single = np.flatnonzero(~area)
+        hits[single, targets[single]] = True
+        damages = self.__damages[skills][:, None]
+        shield = self.shield[rows]
+        absorbed = np.where(hits, np.minimum(shield, damages), 0)
+        self.shield[rows] = shield - absorbed
+        life = self.life[rows]
+        self.life[rows] = life - np.where(hits, np.minimum(life, damages - absorbed), 0)
+
+    def __rest(self, resting: NDArray[np.bool_]) -> None:
+        on_cooldown = resting & (self.loading > 0)
+        self.loading -= on_cooldown & ~self.just_used
+        self.just_used &= ~on_cooldown
+
+    def __detect_finalists(self) -> None:
+        alive = self.life > 0
+        alive_sides = (alive[:, None, :] & self.__side_masks[None, :, :]).any(axis=2)
+        new_winners = ~self.finished & (alive_sides.sum(axis=1) == 1)
+        self.winners[new_winners] = np.argmax(alive_sides[new_winners], axis=1)
+
+
+def _same_rules(rules: CompactBattleRules, other_rules: CompactBattleRules) -> bool:
+    return (
+        rules.sides == other_rules.sides
+        and rules.skills_of == other_rules.skills_of
+        and rules.costs == other_rules.costs
+        and rules.damages == other_rules.damages
+        and rules.cooldowns == other_rules.cooldowns
+        and rules.magical == other_rules.magical
+        and rules.area == other_rules.area
+    )
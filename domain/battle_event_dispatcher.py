@@ -1,36 +1,167 @@
-from contextlib import suppress
+from collections import Counter, deque
+from contextlib import AbstractContextManager, nullcontext, suppress
+from enum import Enum
+from itertools import count
 from typing import Type
+from weakref import WeakKeyDictionary, WeakValueDictionary
 
-from trio import open_nursery
+from anyio import create_task_group
 
-from domain import DomainEvent, EventDispatcher, EventHandler, EventMediator
+from domain import DomainEvent, EventDispatcher, EventHandler, EventMediator, IEntityID
+from domain.battle.events import BATTLE_EVENT_HANDLERS
+from domain.clock import Clock, current_clock, use_clock
+from domain.event_dedup_index import EventDedupIndex
+from domain.event_exporter import EventExporter
+from domain.event_handler_registry import DispatchTable
+from domain.instrumentation import DISABLED_INSTRUMENTATION, Instrumentation
+from domain.tracing import Tracer, current_tracer, use_tracer
+
+
+class EventRetentionEnum(str, Enum):
+    """Enum that defines how the dispatcher references the events it already dispatched"""
+
+    STRONG = "strong"
+    WEAK = "weak"
+
+
+STRONGLY_RETAINED_EVENTS = 1024
+
+
+DispatchedEvent = DomainEvent | EventMediator
+
+
+def _battle_id(event: DomainEvent) -> str:
+    return str(getattr(event.payload, "battle_id", ""))
+
+
+def _domain_event(dispatched_event: DispatchedEvent) -> DomainEvent:
+    return dispatched_event.event if isinstance(dispatched_event, EventMediator) else dispatched_event
 
 
 class BattleEventDispatcher(EventDispatcher):
-    """Battle Event Dispatcher"""
+    """Battle Event Dispatcher
+
+    Published events are delivered to the Event Handler classes of the dispatch table, while registered
+    Event Mediators are still supported for the consumers that build their own. Events whose idempotency
+    key is already in the dedup index, or already queued, are dropped before any handler runs. A key is
+    only recorded once every handler of its event succeeded, so an event whose delivery failed can be
+    published again.
+
+    With the strong retention, only the latest ``STRONGLY_RETAINED_EVENTS`` dispatched events are kept.
+    With the weak retention, dispatched events are only referenced weakly, so a long-running worker keeps
+    no event of a finished Battle once its handlers ran; ``teardown`` forgets the rest of a Battle.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        instrumentation: Instrumentation = DISABLED_INSTRUMENTATION,
+        tracer: Tracer | None = None,
+        exporter: EventExporter | None = None,
+        dispatch_table: DispatchTable = BATTLE_EVENT_HANDLERS,
+        dedup_index: EventDedupIndex | None = None,
+        clock: Clock | None = None,
+        retention: EventRetentionEnum = EventRetentionEnum.STRONG,
+    ) -> None:
         self.events_mediators: list[EventMediator] = []
-        self.__dispatched_events: list[EventMediator] = []
+        self.__published_events: list[DomainEvent] = []
+        self.__dispatched_events: deque[DispatchedEvent] = deque(maxlen=STRONGLY_RETAINED_EVENTS)
+        self.__weak_dispatched_events: WeakValueDictionary[int, DispatchedEvent] = WeakValueDictionary()
+        self.__dispatch_sequence = count()
+        self.__dispatched_event_names: Counter[str] = Counter()
+        self.__retention = retention
+        self.__instrumentation = instrumentation
+        self.__tracer = tracer
+        self.__exporter = exporter
+        self.__dispatch_table = dispatch_table
+        self.__dedup_index = EventDedupIndex() if dedup_index is None else dedup_index
+        self.__duplicated_events = 0
+        self.__clock = clock
+        self.__queued_keys: WeakValueDictionary[str, DomainEvent] = WeakValueDictionary()
+        self.__skipped_handlers: WeakKeyDictionary[DomainEvent, set[Type[EventHandler]]] = WeakKeyDictionary()
+
+    @property
+    def dispatch_table(self) -> DispatchTable:
+        return self.__dispatch_table
+
+    @property
+    def duplicated_events(self) -> int:
+        """Number of events dropped because they had already been published"""
+        return self.__duplicated_events
 
     def has(self, event: Type[DomainEvent]) -> bool:
         """Check if an Event is registered"""
-        return event.event_name in [event_mediator.event_name for event_mediator in self.events_mediators]
+        return any(
+            published_event.event_name == event.event_name for published_event in self.__published_events
+        ) or any(event_mediator.event_name == event.event_name for event_mediator in self.events_mediators)
 
     def was_dispatched(self, event: Type[DomainEvent]) -> bool:
-        return event.event_name in [event_mediator.event_name for event_mediator in self.__dispatched_events]
+        return self.__dispatched_event_names[event.event_name] > 0
 
     def dispatched_events(self) -> list[EventMediator]:
-        """Return the list of dispatched events"""
-        return self.__dispatched_events
+        """Return the list of dispatched Event Mediators"""
+        return [
+            dispatched_event
+            for dispatched_event in self.__retained_events()
+            if isinstance(dispatched_event, EventMediator)
+        ]
+
+    def dispatched_domain_events(self) -> list[DomainEvent]:
+        """Return the list of dispatched events, whether they were published or registered with a mediator"""
+        return [_domain_event(dispatched_event) for dispatched_event in self.__retained_events()]
+
+    def __retained_events(self) -> list[DispatchedEvent]:
+        if self.__retention is EventRetentionEnum.WEAK:
+            return list(self.__weak_dispatched_events.values())
+        return list(self.__dispatched_events)
 
     def register(self, event_mediator: EventMediator) -> None:
         """Register an Event Handler to an Event"""
+        if self._is_duplicated(event_mediator.event):
+            return
         if event_mediator.event_name not in [event.event_name for event in self.events_mediators]:
             self.events_mediators.append(event_mediator)
 
+    def publish(self, event: DomainEvent) -> None:
+        """Queue an Event to be delivered to the Event Handlers of its dispatch table"""
+        if not self._is_duplicated(event):
+            self.__published_events.append(event)
+
+    def _is_duplicated(self, event: DomainEvent) -> bool:
+        """Whether the event was already delivered or is already queued, queueing its key otherwise"""
+        idempotency_key = event.idempotency_key
+        if idempotency_key is None:
+            return False
+        if idempotency_key in self.__dedup_index or idempotency_key in self.__queued_keys:
+            self.__duplicated_events += 1
+            return True
+        self.__queued_keys[idempotency_key] = event
+        return False
+
+    def _delivered(self, event: DomainEvent) -> None:
+        """Record the idempotency key of an event once it was delivered"""
+        idempotency_key = event.idempotency_key
+        if idempotency_key is not None:
+            self.__queued_keys.pop(idempotency_key, None)
+            self.__dedup_index.record(idempotency_key)
+
+    def _delivery_failed(self, event: DomainEvent) -> None:
+        """Forget the idempotency key of an event whose delivery failed, so it can be published again"""
+        idempotency_key = event.idempotency_key
+        if idempotency_key is not None:
+            self.__queued_keys.pop(idempotency_key, None)
+
     def unregister(self, event: DomainEvent, event_handler: Type[EventHandler]) -> None:
-        """Unregister an Event Handler to an Event"""
+        """Unregister an Event Handler to the first queued Event with the same name
+
+        Only that queued Event skips the Event Handler; later Events of the same type still reach it.
+        """
+        with suppress(StopIteration):
+            published_event = next(
+                published_event
+                for published_event in self.__published_events
+                if published_event.event_name == event.event_name
+            )
+            self.__skipped_handlers.setdefault(published_event, set()).add(event_handler)
         with suppress(StopIteration):
             event_mediator = next(
                 event_mediator
@@ -42,9 +173,37 @@ class BattleEventDispatcher(EventDispatcher):
     def unregister_all(self) -> None:
         """Unregister all Events"""
         self.events_mediators.clear()
+        self.__published_events.clear()
+        self.__queued_keys.clear()
+        self.__skipped_handlers.clear()
+
+    def teardown(self, battle_id: IEntityID | str) -> None:
+        """Forget every pending and dispatched Event of a finished Battle"""
+        battle_id = str(battle_id)
+        self.__published_events[:] = [event for event in self.__published_events if _battle_id(event) != battle_id]
+        self.events_mediators[:] = [
+            event_mediator for event_mediator in self.events_mediators if _battle_id(event_mediator.event) != battle_id
+        ]
+        self.__dispatched_events = deque(
+            (event for event in self.__dispatched_events if _battle_id(_domain_event(event)) != battle_id),
+            maxlen=STRONGLY_RETAINED_EVENTS,
+        )
+        for dispatch_index, event in list(self.__weak_dispatched_events.items()):
+            if _battle_id(_domain_event(event)) == battle_id:
+                del self.__weak_dispatched_events[dispatch_index]
 
     async def notify(self, event: DomainEvent) -> None:
         """Notify all Event Handlers of an Event"""
+        with self.__instrumentation.measure("dispatcher.notify"), self.__bind_tracer(), self.__bind_clock():
+            await self._notify_first(event)
+
+    async def _notify_first(self, event: DomainEvent) -> None:
+        """Deliver the first queued Event with the same name"""
+        for event_index, published_event in enumerate(self.__published_events):
+            if published_event.event_name == event.event_name:
+                self._mark_dispatched(self.__published_events.pop(event_index))
+                await self._dispatch(published_event)
+                return
         with suppress(StopIteration):
             event_data = next(
                 (event_index, event_mediator)
@@ -52,20 +211,110 @@ class BattleEventDispatcher(EventDispatcher):
                 if event_mediator.event_name == event.event_name
             )
             event_mediator = event_data[1]
-            await event_mediator.handle()
+            await self.__dispatch_mediator(event_mediator)
             event_index = event_data[0]
             self.__unqueue_event(event_index)
 
     async def notify_all(self) -> None:
         """Notify all Event Handlers of a list of Events"""
-        async with open_nursery() as nursery:
-            for event_index, event_mediator in enumerate(self.events_mediators):
-                nursery.start_soon(event_mediator.handle)
-                self.__unqueue_event(event_index)
+        with self.__instrumentation.measure("dispatcher.notify_all"), self.__bind_tracer(), self.__bind_clock():
+            await self._drain()
+
+    async def notify_battle(self, battle_id: IEntityID | str) -> None:
+        """Notify the Event Handlers of the queued Events of one Battle, leaving the other Battles queued"""
+        with self.__instrumentation.measure("dispatcher.notify_battle"), self.__bind_tracer(), self.__bind_clock():
+            await self._drain_battle(str(battle_id))
+
+    async def _drain(self) -> None:
+        """Deliver every queued Event concurrently"""
+        published_events = self.__published_events.copy()
+        self.__published_events.clear()
+        events_mediators = self.events_mediators.copy()
+        self.events_mediators.clear()
+        await self.__deliver(published_events, events_mediators)
+
+    async def _drain_battle(self, battle_id: str) -> None:
+        """Deliver the queued Events of one Battle concurrently"""
+        published_events = [event for event in self.__published_events if _battle_id(event) == battle_id]
+        self.__published_events[:] = [event for event in self.__published_events if _battle_id(event) != battle_id]
+        events_mediators = [
+            event_mediator for event_mediator in self.events_mediators if _battle_id(event_mediator.event) == battle_id
+        ]
+        self.events_mediators[:] = [
+            event_mediator for event_mediator in self.events_mediators if _battle_id(event_mediator.event) != battle_id
+        ]
+        await self.__deliver(published_events, events_mediators)
+
+    async def __deliver(self, published_events: list[DomainEvent], events_mediators: list[EventMediator]) -> None:
+        self._mark_dispatched(*published_events, *events_mediators)
+        async with create_task_group() as task_group:
+            for event in published_events:
+                task_group.start_soon(self._dispatch, event)
+            for event_mediator in events_mediators:
+                task_group.start_soon(self.__dispatch_mediator, event_mediator)
+
+    def _mark_dispatched(self, *events: DispatchedEvent) -> None:
+        self.__dispatched_event_names.update(event.event_name for event in events)
+        if self.__retention is EventRetentionEnum.STRONG:
+            self.__dispatched_events.extend(events)
+            return
+        for event in events:
+            self.__weak_dispatched_events[next(self.__dispatch_sequence)] = event
+
+    async def _dispatch(self, event: DomainEvent) -> None:
+        """Deliver a published Event to every Event Handler class the dispatch table holds for its type
+
+        The Event is exported once it was delivered, so an Event delivered again after a failure is only
+        exported once.
+        """
+        skipped_handlers = self.__skipped_handlers.pop(event, ())
+        try:
+            with self.__dispatch_span(event):
+                async with create_task_group() as task_group:
+                    for event_handler in self.__dispatch_table.handlers_for(type(event)):
+                        if event_handler not in skipped_handlers:
+                            task_group.start_soon(event_handler(event)._handle_traced)
+        except BaseException:
+            self._delivery_failed(event)
+            raise
+        self._delivered(event)
+        if self.__exporter is not None:
+            await self.__exporter.export_async(event)
+
+    async def __dispatch_mediator(self, event_mediator: EventMediator) -> None:
+        try:
+            with self.__dispatch_span(event_mediator.event):
+                await event_mediator.handle()
+        except BaseException:
+            self._delivery_failed(event_mediator.event)
+            raise
+        self._delivered(event_mediator.event)
+        if self.__exporter is not None:
+            await self.__exporter.export_async(event_mediator.event)
+
+    @staticmethod
+    def __dispatch_span(event: DomainEvent) -> AbstractContextManager[None]:
+        return current_tracer().span(
+            "event.dispatch",
+            event_name=event.event_name,
+            battle_id=str(getattr(event.payload, "battle_id", "")),
+        )
+
+    def __bind_tracer(self) -> AbstractContextManager[Tracer]:
+        """Binds the Tracer of the dispatcher, if any, as the current one while the events are delivered"""
+        if self.__tracer is None:
+            return nullcontext(current_tracer())
+        return use_tracer(self.__tracer)
+
+    def __bind_clock(self) -> AbstractContextManager[Clock]:
+        """Binds the Clock of the dispatcher, if any, as the one the Event Handlers wait on"""
+        if self.__clock is None:
+            return nullcontext(current_clock())
+        return use_clock(self.__clock)
 
     def _pop_event(self, event_index: int) -> EventMediator:
         """Unregister an entire Event"""
         return self.events_mediators.pop(event_index)
 
     def __unqueue_event(self, event_index: int) -> None:
-        self.__dispatched_events.append(self._pop_event(event_index))
+        self._mark_dispatched(self._pop_event(event_index))
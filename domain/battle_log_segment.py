@@ -0,0 +1,181 @@
+"""Module describes the binary segment files used to store the move log of finished Battles.
+
+A segment is laid out as a fixed header, an index with one entry per Battle and the
+fixed-width move records of every Battle stored one after the other:
+
+    header  : magic | version | battle count
+    index   : battle id | records offset | records count   (one per Battle)
+    records : turn | action | actor id | target id | skill id | damage
+"""
+import mmap
+import os
+import struct
+import uuid
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Iterator, cast
+
+from domain import IEntityID
+from domain.battle import IBattle
+from domain.battle.exceptions import BattleIsAlreadyHappeningException
+from domain.battle.value_objects import MoveActionEnum, MoveRecord
+from domain.value_objects import EntityID
+
+SEGMENT_MAGIC = b"DBLG"
+SEGMENT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHxxI")
+_INDEX_ENTRY = struct.Struct("<16sQI4x")
+_RECORD = struct.Struct("<IB3x16s16s16si")
+_EMPTY_ID = bytes(16)
+
+
+def _encode_entity_id(entity_id: IEntityID | None) -> bytes:
+    if entity_id is None:
+        return _EMPTY_ID
+    return cast(uuid.UUID, entity_id).bytes
+
+
+def _decode_entity_id(raw_bytes: bytes) -> IEntityID | None:
+    if raw_bytes == _EMPTY_ID:
+        return None
+    return EntityID.from_bytes(raw_bytes)
+
+
+class BattleLogSegmentWriter:
+    """Writes the move log of finished Battles as fixed-width records to a segment file"""
+
+    def __init__(self, path: str | Path) -> None:
+        self.__path = Path(path)
+        self.__battles: dict[bytes, bytes] = {}
+
+    def __enter__(self) -> "BattleLogSegmentWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.write()
+
+    def append(self, battle: IBattle) -> None:
+        """Encode the move log of a finished Battle to be written in the segment"""
+        if battle.is_ongoing:
+            raise BattleIsAlreadyHappeningException("Cannot store the move log of an ongoing battle")
+        battle_id = _encode_entity_id(battle.entity_id)
+        if battle_id in self.__battles:
+            raise ValueError(f"Battle <{battle.entity_id}> is already stored in this segment")
+        records = bytearray(_RECORD.size * len(battle.move_log))
+        for record_index, record in enumerate(battle.move_log):
+            _RECORD.pack_into(
+                records,
+                record_index * _RECORD.size,
+                record.turn,
+                record.action,
+                _encode_entity_id(record.actor_id),
+                _encode_entity_id(record.target_id),
+                _encode_entity_id(record.skill_id),
+                record.damage,
+            )
+        self.__battles[battle_id] = bytes(records)
+
+    def write(self) -> None:
+        """Write the header, the index and every appended move log to the segment file"""
+        records_offset = _HEADER.size + _INDEX_ENTRY.size * len(self.__battles)
+        with self.__path.open("wb") as segment_file:
+            segment_file.write(_HEADER.pack(SEGMENT_MAGIC, SEGMENT_VERSION, len(self.__battles)))
+            for battle_id, records in self.__battles.items():
+                segment_file.write(_INDEX_ENTRY.pack(battle_id, records_offset, len(records) // _RECORD.size))
+                records_offset += len(records)
+            for records in self.__battles.values():
+                segment_file.write(records)
+
+
+class BattleLogSegmentReader:
+    """Reads a segment file through a memory map, seeking straight to the records of a Battle
+
+    Records are unpacked straight from the memory map, so no buffer of it outlives a read and the reader
+    can be closed while a records iterator is only partly consumed.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        with Path(path).open("rb") as segment_file:
+            if os.fstat(segment_file.fileno()).st_size < _HEADER.size:
+                raise ValueError(f"{path} is too short to be a battle log segment")
+            self.__mmap = mmap.mmap(segment_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.__index = self.__read_index()
+        except ValueError as error:
+            self.close()
+            raise ValueError(f"{path} is not a battle log segment: {error}") from error
+
+    def __read_index(self) -> dict[bytes, tuple[int, int]]:
+        segment_size = len(self.__mmap)
+        magic, version, battles_count = _HEADER.unpack_from(self.__mmap, 0)
+        if magic != SEGMENT_MAGIC or version != SEGMENT_VERSION:
+            raise ValueError("unknown magic or version")
+        if _HEADER.size + battles_count * _INDEX_ENTRY.size > segment_size:
+            raise ValueError("truncated index")
+        index: dict[bytes, tuple[int, int]] = {}
+        for battle_index in range(battles_count):
+            battle_id, records_offset, records_count = _INDEX_ENTRY.unpack_from(
+                self.__mmap, _HEADER.size + battle_index * _INDEX_ENTRY.size
+            )
+            if records_offset + records_count * _RECORD.size > segment_size:
+                raise ValueError("truncated records")
+            index[battle_id] = (records_offset, records_count)
+        return index
+
+    def __enter__(self) -> "BattleLogSegmentReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def battle_ids(self) -> tuple[IEntityID, ...]:
+        return tuple(EntityID.from_bytes(battle_id) for battle_id in self.__index)
+
+    def __contains__(self, battle_id: object) -> bool:
+        return isinstance(battle_id, uuid.UUID) and battle_id.bytes in self.__index
+
+    def __len__(self) -> int:
+        return len(self.__index)
+
+    def records(self, battle_id: IEntityID) -> Iterator[MoveRecord]:
+        """Iterate over the move records of a single Battle without reading the rest of the segment"""
+        for turn, action, actor_id, target_id, skill_id, damage in self.raw_records(battle_id):
+            yield MoveRecord(
+                turn,
+                MoveActionEnum(action),
+                EntityID.from_bytes(actor_id),
+                _decode_entity_id(target_id),
+                _decode_entity_id(skill_id),
+                damage,
+            )
+
+    def raw_records(self, battle_id: IEntityID) -> Iterator[tuple[Any, ...]]:
+        """Iterate over the undecoded fields of the move records of a single Battle"""
+        try:
+            records_offset, records_count = self.__index[_encode_entity_id(battle_id)]
+        except KeyError as error:
+            raise KeyError(f"Battle <{battle_id}> is not stored in this segment") from error
+        segment = self.__mmap
+        for record_offset in range(records_offset, records_offset + records_count * _RECORD.size, _RECORD.size):
+            yield _RECORD.unpack_from(segment, record_offset)
+
+    def __iter__(self) -> Iterator[tuple[IEntityID, MoveRecord]]:
+        for battle_id in self.battle_ids:
+            for record in self.records(battle_id):
+                yield battle_id, record
+
+    def close(self) -> None:
+        self.__mmap.close()
@@ -0,0 +1,137 @@
+"""Module describes the Battle repository that keeps hot Battles in memory and cold ones in SQLite"""
+import pickle
+import sqlite3
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, NamedTuple, cast
+
+from domain import AggregateRoot, EventDispatcher, IEntityID
+from domain.battle import IBattle, IBattleRepository
+from domain.battle.exceptions import BattleNotFoundException
+
+_SQLITE_MAX_VARIABLES = 900
+
+
+class CacheStatistics(NamedTuple):
+    """Counters used to tune the size of the cache against the available memory"""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class SQLiteBattleRepository(IBattleRepository):
+    """Battle repository backed by a bounded LRU cache in front of a SQLite snapshot store
+
+    Battles evicted from the cache stay pending until the next ``flush``, which writes all of them
+    in a single transaction. Battles that are still hot are only written by ``close``.
+    """
+
+    def __init__(
+        self,
+        event_dispatcher: EventDispatcher,
+        database_path: str | Path = ":memory:",
+        cache_size: int = 128,
+    ) -> None:
+        if cache_size < 1:
+            raise ValueError("Cache size should be at least one Battle.")
+        self.__event_dispatcher = event_dispatcher
+        self.__cache_size = cache_size
+        self.__cache: OrderedDict[IEntityID, IBattle] = OrderedDict()
+        self.__pending_snapshots: dict[IEntityID, IBattle] = {}
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__connection = sqlite3.connect(database_path)
+        with self.__connection:
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS battle_snapshots (battle_id BLOB PRIMARY KEY, snapshot BLOB NOT NULL)"
+            )
+
+    @property
+    def statistics(self) -> CacheStatistics:
+        return CacheStatistics(self.__hits, self.__misses, self.__evictions, len(self.__cache))
+
+    def add(self, battle: IBattle) -> None:
+        self.__pending_snapshots.pop(battle.entity_id, None)
+        self.__cache_battle(battle)
+
+    def get(self, entity_id: IEntityID) -> IBattle:
+        return self.get_many((entity_id,))[0]
+
+    def get_many(self, entity_ids: Iterable[IEntityID]) -> tuple[IBattle, ...]:
+        """Returns the Battles in the requested order, leaving the repository untouched if any is not stored"""
+        entity_ids = tuple(entity_ids)
+        found_battles: dict[IEntityID, IBattle] = {}
+        cold_ids: list[IEntityID] = []
+        for entity_id in dict.fromkeys(entity_ids):
+            if entity_id in self.__cache:
+                self.__hits += 1
+                self.__cache.move_to_end(entity_id)
+                found_battles[entity_id] = self.__cache[entity_id]
+                continue
+            self.__misses += 1
+            if entity_id in self.__pending_snapshots:
+                found_battles[entity_id] = self.__pending_snapshots[entity_id]
+            else:
+                cold_ids.append(entity_id)
+        found_battles.update(self.__load_snapshots(cold_ids))
+        try:
+            battles = tuple(found_battles[entity_id] for entity_id in entity_ids)
+        except KeyError as error:
+            raise BattleNotFoundException(f"Battle <{error.args[0]}> is not stored") from error
+        for entity_id, battle in found_battles.items():
+            if entity_id not in self.__cache:
+                self.__pending_snapshots.pop(entity_id, None)
+                self.__cache_battle(battle)
+        return battles
+
+    def flush(self) -> None:
+        if not self.__pending_snapshots:
+            return
+        self.__write_snapshots(self.__pending_snapshots.values())
+        self.__pending_snapshots.clear()
+
+    def close(self) -> None:
+        """Write every Battle, hot or cold, and close the connection with the database"""
+        self.__pending_snapshots.update(self.__cache)
+        self.__cache.clear()
+        self.flush()
+        self.__connection.close()
+
+    def __cache_battle(self, battle: IBattle) -> None:
+        self.__cache[battle.entity_id] = battle
+        self.__cache.move_to_end(battle.entity_id)
+        while len(self.__cache) > self.__cache_size:
+            evicted_id, evicted_battle = self.__cache.popitem(last=False)
+            self.__pending_snapshots[evicted_id] = evicted_battle
+            self.__evictions += 1
+
+    def __write_snapshots(self, battles: Iterable[IBattle]) -> None:
+        rows = (
+            (self.__key(battle.entity_id), pickle.dumps(battle, protocol=pickle.HIGHEST_PROTOCOL)) for battle in battles
+        )
+        with self.__connection:
+            self.__connection.executemany("INSERT OR REPLACE INTO battle_snapshots VALUES (?, ?)", rows)
+
+    def __load_snapshots(self, entity_ids: list[IEntityID]) -> dict[IEntityID, IBattle]:
+        loaded_battles: dict[IEntityID, IBattle] = {}
+        for chunk_start in range(0, len(entity_ids), _SQLITE_MAX_VARIABLES):
+            keys = [
+                self.__key(entity_id) for entity_id in entity_ids[chunk_start : chunk_start + _SQLITE_MAX_VARIABLES]
+            ]
+            placeholders = ", ".join("?" * len(keys))
+            rows = self.__connection.execute(
+                f"SELECT snapshot FROM battle_snapshots WHERE battle_id IN ({placeholders})", keys
+            )
+            for (snapshot,) in rows:
+                battle = pickle.loads(snapshot)
+                cast(AggregateRoot, battle)._bind_event_dispatcher(self.__event_dispatcher)
+                loaded_battles[battle.entity_id] = battle
+        return loaded_battles
+
+    @staticmethod
+    def __key(entity_id: IEntityID) -> bytes:
+        return cast(uuid.UUID, entity_id).bytes
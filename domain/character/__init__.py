@@ -1,10 +1,11 @@
 from .entity import Character
 from .interfaces import ICharacter, ICharacterFactory
-from .value_objects import SkillProfile
+from .value_objects import ShieldLayer, SkillProfile
 
 __all__ = [
     "Character",
     "ICharacter",
     "ICharacterFactory",
+    "ShieldLayer",
     "SkillProfile",
 ]
@@ -1,7 +1,19 @@
-from typing import Generator, Type, TypeVar, cast
+from contextlib import suppress
+from typing import Callable, Generator, Type, TypeVar, cast
 
 from domain import Entity, IEntityID
-from domain.skill import IAttackable, ICooldownSkill, IMagicalAttack, IPhysicalAttack, ISkill
+from domain.damage_modifiers import DamageTable
+from domain.skill import (
+    ElementEnum,
+    IAttackable,
+    ICooldownSkill,
+    IMagicalAttack,
+    IPassive,
+    IPhysicalAttack,
+    ISkill,
+    PassiveEffectEnum,
+    PassiveTriggerEnum,
+)
 from domain.skill.combat_technique import CombatTechnique, ICombatTechnique
 from domain.skill.spell import ISpell, Spell
 
@@ -10,9 +22,10 @@ from .exceptions import (
     CharacterDoesNotHaveThatSkillException,
     NoCombatTechniqueAvailableException,
     NoSpellAvailableException,
+    TooManyTargetsException,
 )
 from .interfaces import ICharacter, ICharacterFactory, ISkillBuilder, IStatsProfileBuilder
-from .value_objects import SkillProfile
+from .value_objects import ShieldLayer, SkillProfile
 
 T_skill_contra = TypeVar("T_skill_contra", bound=ISkill, contravariant=True)
 
@@ -36,6 +49,13 @@ class Character(Entity, ICharacterFactory, ICharacter):
 
     def _build_skills(self, skills: tuple[ISkill, ...]) -> None:
         self.__skills = skills
+        passives_by_trigger: dict[PassiveTriggerEnum, list[IPassive]] = {}
+        for skill in skills:
+            if isinstance(skill, IPassive):
+                passives_by_trigger.setdefault(skill.trigger, []).append(skill)
+        self.__passives_by_trigger = {trigger: tuple(passives) for trigger, passives in passives_by_trigger.items()}
+        self.__allies_listening_death: tuple[ICharacter, ...] = ()
+        self.__damage_listeners: list[Callable[[ICharacter], None]] = []
 
     @classmethod
     def create_new(cls, *, entity_id: IEntityID, name: str) -> IStatsProfileBuilder:
@@ -51,10 +71,18 @@ class Character(Entity, ICharacterFactory, ICharacter):
     def is_alive(self) -> bool:
         return self.__skill_profile.current_life_points > 0
 
+    @property
+    def element(self) -> ElementEnum:
+        return self.__skill_profile.element
+
     @property
     def current_life_points(self) -> int:
         return self.__skill_profile.current_life_points
 
+    @property
+    def current_shield_points(self) -> int:
+        return self.__skill_profile.current_shield_points
+
     @property
     def current_stamina_points(self) -> int:
         return self.__skill_profile.current_stamina_points
@@ -79,26 +107,137 @@ class Character(Entity, ICharacterFactory, ICharacter):
         except StopIteration as error:
             raise NoSpellAvailableException() from error
 
-    def attack(self, skill_id: IEntityID, target_character: ICharacter) -> None:
-        try:
-            skill = next(skill for skill in self.__skills if skill == skill_id)
-            if not isinstance(skill, IAttackable):
-                raise CantUseThisSkillToAttackException()
-            skill.use()
-            if isinstance(skill, IMagicalAttack):
-                self.__skill_profile.use_mana(skill.cost)
-            if isinstance(skill, IPhysicalAttack):
-                self.__skill_profile.use_stamina(skill.cost)
-            target_character._receive_attack(skill.damage)
-        except StopIteration as error:
-            raise CharacterDoesNotHaveThatSkillException() from error
+    @property
+    def attack_skills(self) -> tuple[IAttackable, ...]:
+        return tuple(skill for skill in self.__skills if isinstance(skill, IAttackable))
+
+    @property
+    def affordable_attack_skills(self) -> tuple[IAttackable, ...]:
+        """Attack skills ready whose cost the Character can still pay, in a single pass over the skills"""
+        stamina_points, mana_points = self.current_stamina_points, self.current_mana_points
+        return tuple(
+            skill
+            for skill in self.__skills
+            if isinstance(skill, IAttackable)
+            and skill.is_ready
+            and (not isinstance(skill, IPhysicalAttack) or skill.cost <= stamina_points)
+            and (not isinstance(skill, IMagicalAttack) or skill.cost <= mana_points)
+        )
+
+    def attack(self, skill_id: IEntityID, target_character: ICharacter, damage_table: DamageTable | None = None) -> int:
+        """Hit the target with the skill, returning the damage taken by its life points"""
+        skill = self.__attack_skill(skill_id)
+        self.__use_attack_skill(skill)
+        if damage_table is None:
+            return target_character._receive_attack(skill.damage)
+        return target_character._receive_attack(
+            damage_table.resolve(skill.damage, self.element, skill.element, target_character.element)
+        )
+
+    def attack_many(
+        self,
+        skill_id: IEntityID,
+        target_characters: tuple[ICharacter, ...],
+        damage_table: DamageTable | None = None,
+    ) -> tuple[int, ...]:
+        """Use the skill once, paying its cost once, and hit every target in a single pass
+
+        Returns the damage taken by the life points of each target, in the order of the targets.
+        """
+        skill = self.__attack_skill(skill_id)
+        if skill.max_targets is not None and len(target_characters) > skill.max_targets:
+            raise TooManyTargetsException()
+        self.__use_attack_skill(skill)
+        damage = skill.damage
+        if damage_table is None:
+            return tuple(target_character._receive_attack(damage) for target_character in target_characters)
+        attacker, element, resolve = self.element, skill.element, damage_table.resolve
+        return tuple(
+            target_character._receive_attack(resolve(damage, attacker, element, target_character.element))
+            for target_character in target_characters
+        )
 
     def rest(self) -> None:
         for skill in self.__skills_on_cooldown():
             skill.rest()
 
-    def _receive_attack(self, damage: int) -> None:
-        self.__skill_profile.take_damage(damage)
+    def _receive_attack(self, damage: int) -> int:
+        """Take the damage left by the shields, returning what the life points lost before any passive fires"""
+        life_points_before_attack = self.current_life_points
+        self.__skill_profile.take_damage(self.__skill_profile.absorb_damage(damage))
+        damage_taken = life_points_before_attack - self.current_life_points
+        if not damage_taken:
+            return 0
+        if self.is_alive:
+            self._fire_passives(PassiveTriggerEnum.ON_DAMAGE_TAKEN)
+        else:
+            for ally in self.__allies_listening_death:
+                ally._fire_passives(PassiveTriggerEnum.ON_ALLY_DEATH)
+        for listener in tuple(self.__damage_listeners):
+            listener(self)
+        return damage_taken
+
+    def _add_damage_listener(self, listener: Callable[[ICharacter], None]) -> None:
+        """Call the listener with the Character every time an attack changes its life points"""
+        self.__damage_listeners.append(listener)
+
+    def _remove_damage_listener(self, listener: Callable[[ICharacter], None]) -> None:
+        with suppress(ValueError):
+            self.__damage_listeners.remove(listener)
+
+    def __getstate__(self) -> dict[str, object]:
+        """Damage listeners belong to the running process, so they are left out of snapshots"""
+        state = self.__dict__.copy()
+        state["_Character__damage_listeners"] = []
+        return state
+
+    def _subscribes(self, trigger: PassiveTriggerEnum) -> bool:
+        return trigger in self.__passives_by_trigger
+
+    def _set_ally_death_listeners(self, allies: tuple[ICharacter, ...]) -> None:
+        self.__allies_listening_death = tuple(
+            ally for ally in allies if ally is not self and ally._subscribes(PassiveTriggerEnum.ON_ALLY_DEATH)
+        )
+
+    def _fire_passives(self, trigger: PassiveTriggerEnum) -> None:
+        """Apply the effect of every Passive subscribed to the trigger, looked up through the index built once"""
+        if not self.is_alive:
+            return
+        for passive in self.__passives_by_trigger.get(trigger, ()):
+            if not passive.fire():
+                continue
+            if passive.effect is PassiveEffectEnum.HEAL:
+                self._heal(passive.magnitude)
+            elif passive.effect is PassiveEffectEnum.SHIELD:
+                self._grant_shield(passive.magnitude)
+
+    def _heal(self, life_points: int) -> None:
+        self.__skill_profile.heal(life_points)
+
+    def _grant_shield(self, shield_points: int) -> None:
+        self.__skill_profile.grant_shield(shield_points)
+
+    def _grant_temporary_shield(self, shield_points: int) -> ShieldLayer:
+        return self.__skill_profile.grant_temporary_shield(shield_points)
+
+    def _revoke_shield(self, shield_layer: ShieldLayer) -> None:
+        self.__skill_profile.revoke_shield(shield_layer)
+
+    def __attack_skill(self, skill_id: IEntityID) -> IAttackable:
+        try:
+            skill = next(skill for skill in self.__skills if skill == skill_id)
+        except StopIteration as error:
+            raise CharacterDoesNotHaveThatSkillException() from error
+        if not isinstance(skill, IAttackable):
+            raise CantUseThisSkillToAttackException()
+        return skill
+
+    def __use_attack_skill(self, skill: IAttackable) -> None:
+        skill.use()
+        if isinstance(skill, IMagicalAttack):
+            self.__skill_profile.use_mana(skill.cost)
+        if isinstance(skill, IPhysicalAttack):
+            self.__skill_profile.use_stamina(skill.cost)
 
     def __available_skills(self, skill_type: Type[T_skill_contra]) -> Generator[ISkill, None, None]:
         try:
@@ -123,8 +262,12 @@ class _StatsProfileBuilder(IStatsProfileBuilder):
     ) -> None:
         self.__character_obj = character_obj
 
-    def specify_skill_properties(self, life_points: int, stamina_points: int, mana_points: int) -> ISkillBuilder:
-        skill_profile = SkillProfile(life_points=life_points, stamina_points=stamina_points, mana_points=mana_points)
+    def specify_skill_properties(
+        self, life_points: int, stamina_points: int, mana_points: int, element: ElementEnum = ElementEnum.NEUTRAL
+    ) -> ISkillBuilder:
+        skill_profile = SkillProfile(
+            life_points=life_points, stamina_points=stamina_points, mana_points=mana_points, element=element
+        )
         self.__character_obj._build_skill_profile(skill_profile)
         return _SkillBuilder(self.__character_obj)
 
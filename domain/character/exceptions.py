@@ -10,6 +10,10 @@ class CantUseThisSkillToAttackException(RuntimeError):
     """Error that indicates that the character can't use this skill to attack"""
 
 
+class TooManyTargetsException(RuntimeError):
+    """Error that indicates that the character tried to hit more targets than the skill reaches"""
+
+
 class NoCombatTechniqueAvailableException(RuntimeError):
     """Error indicates that someone tried to use a combat technique that was not available"""
 
@@ -1,11 +1,14 @@
 from abc import ABCMeta, abstractmethod
-from typing import Generator
+from typing import Callable, Generator
 
 from domain import IEntityID
-from domain.skill import ISkill
+from domain.damage_modifiers import DamageTable
+from domain.skill import ElementEnum, IAttackable, ISkill, PassiveTriggerEnum
 from domain.skill.combat_technique import ICombatTechnique
 from domain.skill.spell import ISpell
 
+from .value_objects import ShieldLayer
+
 
 class ICharacter(metaclass=ABCMeta):
     """Interface that defines the public methods in Character"""
@@ -22,6 +25,11 @@ class ICharacter(metaclass=ABCMeta):
     def is_alive(self) -> bool:
         ...
 
+    @property
+    @abstractmethod
+    def element(self) -> ElementEnum:
+        ...
+
     @property
     @abstractmethod
     def current_stamina_points(self) -> int:
@@ -37,6 +45,11 @@ class ICharacter(metaclass=ABCMeta):
     def current_life_points(self) -> int:
         ...
 
+    @property
+    @abstractmethod
+    def current_shield_points(self) -> int:
+        ...
+
     @property
     @abstractmethod
     def available_combat_techniques(self) -> Generator[ICombatTechnique, None, None]:
@@ -47,8 +60,29 @@ class ICharacter(metaclass=ABCMeta):
     def available_spells(self) -> Generator[ISpell, None, None]:
         ...
 
+    @property
+    @abstractmethod
+    def attack_skills(self) -> tuple[IAttackable, ...]:
+        ...
+
+    @property
+    @abstractmethod
+    def affordable_attack_skills(self) -> tuple[IAttackable, ...]:
+        ...
+
+    @abstractmethod
+    def attack(
+        self, skill_id: IEntityID, target_character: "ICharacter", damage_table: DamageTable | None = None
+    ) -> int:
+        ...
+
     @abstractmethod
-    def attack(self, skill_id: IEntityID, target_character: "ICharacter") -> None:
+    def attack_many(
+        self,
+        skill_id: IEntityID,
+        target_characters: tuple["ICharacter", ...],
+        damage_table: DamageTable | None = None,
+    ) -> tuple[int, ...]:
         ...
 
     @abstractmethod
@@ -56,7 +90,43 @@ class ICharacter(metaclass=ABCMeta):
         ...
 
     @abstractmethod
-    def _receive_attack(self, damage: int) -> None:
+    def _receive_attack(self, damage: int) -> int:
+        ...
+
+    @abstractmethod
+    def _heal(self, life_points: int) -> None:
+        ...
+
+    @abstractmethod
+    def _add_damage_listener(self, listener: Callable[["ICharacter"], None]) -> None:
+        ...
+
+    @abstractmethod
+    def _remove_damage_listener(self, listener: Callable[["ICharacter"], None]) -> None:
+        ...
+
+    @abstractmethod
+    def _subscribes(self, trigger: PassiveTriggerEnum) -> bool:
+        ...
+
+    @abstractmethod
+    def _set_ally_death_listeners(self, allies: tuple["ICharacter", ...]) -> None:
+        ...
+
+    @abstractmethod
+    def _fire_passives(self, trigger: PassiveTriggerEnum) -> None:
+        ...
+
+    @abstractmethod
+    def _grant_shield(self, shield_points: int) -> None:
+        ...
+
+    @abstractmethod
+    def _grant_temporary_shield(self, shield_points: int) -> ShieldLayer:
+        ...
+
+    @abstractmethod
+    def _revoke_shield(self, shield_layer: ShieldLayer) -> None:
         ...
 
 
@@ -80,7 +150,9 @@ class IStatsProfileBuilder(metaclass=ABCMeta):
     """Interface that defines an easy way to create a Character with its SkillProfile"""
 
     @abstractmethod
-    def specify_skill_properties(self, life_points: int, stamina_points: int, mana_points: int) -> ISkillBuilder:
+    def specify_skill_properties(
+        self, life_points: int, stamina_points: int, mana_points: int, element: ElementEnum = ElementEnum.NEUTRAL
+    ) -> ISkillBuilder:
         ...
 
 
@@ -1,18 +1,44 @@
+from collections import deque
+
 from domain.interfaces import ValueObject
+from domain.skill import ElementEnum
+
+
+class ShieldLayer:
+    """Shield points granted for a limited time, with the points not spent yet"""
+
+    __slots__ = ("points",)
+
+    def __init__(self, points: int) -> None:
+        self.points = points
 
 
 class SkillProfile(ValueObject):
     """Class that represents a value object of skill profile to the Character"""
 
-    def __init__(self, life_points: int, stamina_points: int, mana_points: int) -> None:
+    def __init__(
+        self, life_points: int, stamina_points: int, mana_points: int, element: ElementEnum = ElementEnum.NEUTRAL
+    ) -> None:
         self.__life_points = life_points
+        self.__max_life_points = life_points
+        self.__shield_points = 0
+        self.__shield_layers: deque[ShieldLayer] = deque()
         self.__stamina_points = stamina_points
         self.__mana_points = mana_points
+        self.__element = element
+
+    @property
+    def element(self) -> ElementEnum:
+        return self.__element
 
     @property
     def current_life_points(self) -> int:
         return self.__life_points
 
+    @property
+    def current_shield_points(self) -> int:
+        return self.__shield_points
+
     @property
     def current_stamina_points(self) -> int:
         return self.__stamina_points
@@ -26,6 +52,45 @@ class SkillProfile(ValueObject):
             damage = self.__life_points
         self.__life_points -= damage
 
+    def absorb_damage(self, damage: int) -> int:
+        """Spend the shield on the damage, returning the damage the shield did not absorb
+
+        The temporary shield layers are spent first, the oldest one first, and then the permanent points.
+        """
+        absorbed_damage = min(self.__shield_points, damage)
+        self.__shield_points -= absorbed_damage
+        points_to_spend = absorbed_damage
+        while points_to_spend and self.__shield_layers:
+            oldest_layer = self.__shield_layers[0]
+            spent_points = min(oldest_layer.points, points_to_spend)
+            oldest_layer.points -= spent_points
+            points_to_spend -= spent_points
+            if oldest_layer.points == 0:
+                self.__shield_layers.popleft()
+        return damage - absorbed_damage
+
+    def heal(self, life_points: int) -> None:
+        if self.__life_points == 0:
+            return
+        self.__life_points = min(self.__life_points + life_points, self.__max_life_points)
+
+    def grant_shield(self, shield_points: int) -> None:
+        self.__shield_points += shield_points
+
+    def grant_temporary_shield(self, shield_points: int) -> ShieldLayer:
+        shield_layer = ShieldLayer(shield_points)
+        self.__shield_points += shield_points
+        if shield_points:
+            self.__shield_layers.append(shield_layer)
+        return shield_layer
+
+    def revoke_shield(self, shield_layer: ShieldLayer) -> None:
+        """Revoke the points left of a temporary shield"""
+        self.__shield_points -= shield_layer.points
+        if shield_layer.points:
+            self.__shield_layers.remove(shield_layer)
+            shield_layer.points = 0
+
     def use_stamina(self, stamina_spent: int) -> None:
         if self.__stamina_points < stamina_spent:
             stamina_spent = self.__stamina_points
@@ -0,0 +1,141 @@
+"""Module describes the clock the battle domain waits on
+
+Production code waits on the wall clock, while simulations and tests can bind a ``VirtualClock``, which
+never really waits: once every task is blocked, it jumps the virtual time to the earliest deadline and
+wakes that sleeper, so sleepers wake in the order of their deadlines. The current Clock lives in a
+context variable, so the tasks started inside a task group wait on the clock of the code that started them.
+"""
+import asyncio
+from abc import ABCMeta, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from heapq import heapify, heappop, heappush
+from itertools import count
+from time import monotonic
+from typing import Iterator
+
+from anyio import Event, lowlevel, sleep, wait_all_tasks_blocked
+
+
+class Clock(metaclass=ABCMeta):
+    """Interface that defines how the battle domain reads the time and waits"""
+
+    @abstractmethod
+    def now(self) -> float:
+        """Seconds elapsed since an arbitrary, fixed point"""
+
+    @abstractmethod
+    async def sleep(self, seconds: float) -> None:
+        """Wait the given seconds"""
+
+
+class WallClock(Clock):
+    """Clock that reads the monotonic clock and really waits"""
+
+    def now(self) -> float:
+        return monotonic()
+
+    async def sleep(self, seconds: float) -> None:
+        await sleep(seconds)
+
+
+class _Sleeper:
+    """Task sleeping on a VirtualClock, ordered by its deadline and then by the order it fell asleep"""
+
+    __slots__ = ("deadline", "sequence", "woken", "event")
+
+    def __init__(self, deadline: float, sequence: int) -> None:
+        self.deadline = deadline
+        self.sequence = sequence
+        self.woken = False
+        self.event = Event()
+
+    def __lt__(self, other: "_Sleeper") -> bool:
+        return (self.deadline, self.sequence) < (other.deadline, other.sequence)
+
+
+class VirtualClock(Clock):
+    """Autojumping clock, like the autojump of trio's ``MockClock``
+
+    Sleepers wait in a heap ordered by deadline. One of them drives the clock: whenever every task is
+    blocked, it moves the virtual time to the earliest deadline and wakes that sleeper. When the driver
+    itself wakes up, it hands the role over to the earliest sleeper left.
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.__now = start
+        self.__sleepers: list[_Sleeper] = []
+        self.__sequence = count()
+        self.__driver: _Sleeper | None = None
+
+    def now(self) -> float:
+        return self.__now
+
+    async def sleep(self, seconds: float) -> None:
+        if seconds <= 0:
+            await lowlevel.checkpoint()
+            return
+        sleeper = _Sleeper(self.__now + seconds, next(self.__sequence))
+        heappush(self.__sleepers, sleeper)
+        try:
+            while not sleeper.woken:
+                if self.__driver is None:
+                    await self.__drive(sleeper)
+                else:
+                    sleeper.event = Event()
+                    await sleeper.event.wait()
+        finally:
+            if not sleeper.woken:
+                self.__sleepers.remove(sleeper)
+                heapify(self.__sleepers)
+
+    async def __drive(self, driver: _Sleeper) -> None:
+        self.__driver = driver
+        try:
+            while not driver.woken:
+                await _wait_all_tasks_idle()
+                earliest = heappop(self.__sleepers)
+                self.__now = max(self.__now, earliest.deadline)
+                earliest.woken = True
+                earliest.event.set()
+        finally:
+            self.__driver = None
+            if self.__sleepers:
+                self.__sleepers[0].event.set()
+
+
+async def _wait_all_tasks_idle() -> None:
+    """Wait until no other task can run
+
+    On asyncio the ready queue of the event loop is read directly, since ``wait_all_tasks_blocked`` of
+    anyio polls every 0.1 seconds there, which would make each virtual sleep cost that much real time.
+    """
+    try:
+        ready_callbacks = getattr(asyncio.get_running_loop(), "_ready", None)
+    except RuntimeError:
+        ready_callbacks = None
+    if ready_callbacks is None:
+        await wait_all_tasks_blocked()
+        return
+    await asyncio.sleep(0)
+    while ready_callbacks:
+        await asyncio.sleep(0)
+
+
+WALL_CLOCK: Clock = WallClock()
+
+_current_clock: ContextVar[Clock] = ContextVar("current_clock", default=WALL_CLOCK)
+
+
+def current_clock() -> Clock:
+    return _current_clock.get()
+
+
+@contextmanager
+def use_clock(clock: Clock) -> Iterator[Clock]:
+    """Make the given Clock the current one for the code and the tasks started inside the block"""
+    token = _current_clock.set(clock)
+    try:
+        yield clock
+    finally:
+        _current_clock.reset(token)
@@ -0,0 +1,105 @@
+"""Module describes the damage modifiers, compiled once into lookup tables used by every attack
+
+The multiplier of an attack is read from a table indexed by the elemental affinity of the attacker, the
+element of the skill and the elemental affinity of the defender, so no modifier rule is evaluated while
+the Battle is played.
+"""
+from random import Random
+
+from domain.skill import ElementEnum
+
+_ELEMENTS = tuple(ElementEnum)
+
+MultiplierTable = tuple[tuple[tuple[float, ...], ...], ...]
+
+
+class DamageTable:
+    """Precomputed multipliers of every attacker, skill element and defender combination"""
+
+    def __init__(self, multipliers: MultiplierTable) -> None:
+        self.__multipliers = multipliers
+
+    def multiplier(self, attacker: ElementEnum, element: ElementEnum, defender: ElementEnum) -> float:
+        return self.__multipliers[attacker][element][defender]
+
+    def resolve(self, damage: int, attacker: ElementEnum, element: ElementEnum, defender: ElementEnum) -> int:
+        """Returns the damage of the attack after its modifiers"""
+        return int(damage * self.__multipliers[attacker][element][defender])
+
+
+class _CriticalDamageTable(DamageTable):
+    """Damage table that rolls, for every attack, whether it is a critical hit"""
+
+    def __init__(
+        self,
+        multipliers: MultiplierTable,
+        critical_multipliers: MultiplierTable,
+        critical_chance: float,
+        seed: int | None,
+    ) -> None:
+        super().__init__(multipliers)
+        self.__multipliers = multipliers
+        self.__critical_multipliers = critical_multipliers
+        self.__critical_chance = critical_chance
+        self.__random = Random(seed)
+
+    def resolve(self, damage: int, attacker: ElementEnum, element: ElementEnum, defender: ElementEnum) -> int:
+        """Returns the damage of the attack after its modifiers, rolling whether it is a critical hit"""
+        multipliers = (
+            self.__critical_multipliers if self.__random.random() < self.__critical_chance else self.__multipliers
+        )
+        return int(damage * multipliers[attacker][element][defender])
+
+
+class DamageModifiers:
+    """Declares, once before the Battle is built, the modifiers applied to the damage of every attack"""
+
+    def __init__(self) -> None:
+        self.__affinity_bonus = 1.0
+        self.__resistances: dict[tuple[ElementEnum, ElementEnum], float] = {}
+        self.__critical_chance = 0.0
+        self.__critical_multiplier = 1.0
+
+    def affinity_bonus(self, multiplier: float) -> "DamageModifiers":
+        """Multiplier of the attacks whose skill element matches the affinity of the attacker, except neutral"""
+        self.__affinity_bonus = self.__validate_multiplier(multiplier)
+        return self
+
+    def resistance(self, element: ElementEnum, defender: ElementEnum, multiplier: float) -> "DamageModifiers":
+        """Multiplier of the attacks of an element against defenders of an affinity, below one resists it"""
+        self.__resistances[(element, defender)] = self.__validate_multiplier(multiplier)
+        return self
+
+    def critical(self, chance: float, multiplier: float) -> "DamageModifiers":
+        if not 0 <= chance <= 1:
+            raise ValueError("Critical chance should be between zero and one.")
+        self.__critical_chance = chance
+        self.__critical_multiplier = self.__validate_multiplier(multiplier)
+        return self
+
+    def compile(self, seed: int | None = None) -> DamageTable:
+        """Build the table of the modifiers, which only rolls critical hits when their chance is not zero"""
+        multipliers = tuple(
+            tuple(
+                tuple(
+                    (self.__affinity_bonus if attacker is element and element is not ElementEnum.NEUTRAL else 1.0)
+                    * self.__resistances.get((element, defender), 1.0)
+                    for defender in _ELEMENTS
+                )
+                for element in _ELEMENTS
+            )
+            for attacker in _ELEMENTS
+        )
+        if not self.__critical_chance:
+            return DamageTable(multipliers)
+        critical_multipliers = tuple(
+            tuple(tuple(multiplier * self.__critical_multiplier for multiplier in row) for row in plane)
+            for plane in multipliers
+        )
+        return _CriticalDamageTable(multipliers, critical_multipliers, self.__critical_chance, seed)
+
+    @staticmethod
+    def __validate_multiplier(multiplier: float) -> float:
+        if multiplier < 0:
+            raise ValueError("Damage multiplier should not be negative.")
+        return multiplier
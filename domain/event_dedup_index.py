@@ -0,0 +1,52 @@
+"""Module describes the bounded index used to drop Domain Events that were already delivered"""
+from collections import OrderedDict
+from time import monotonic
+from typing import Callable, Hashable
+
+
+class EventDedupIndex:
+    """Time-windowed set of the idempotency keys seen by an Event Dispatcher
+
+    A key is remembered for ``window`` seconds, and at most ``capacity`` keys are kept, the oldest ones
+    being forgotten first; checking and recording a key are both O(1).
+    """
+
+    def __init__(self, capacity: int = 65_536, window: float = 3600.0, clock: Callable[[], float] = monotonic) -> None:
+        if capacity < 1:
+            raise ValueError("Dedup index capacity should be at least one key.")
+        self.__capacity = capacity
+        self.__window = window
+        self.__clock = clock
+        self.__seen_at: OrderedDict[Hashable, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__seen_at)
+
+    def __contains__(self, key: Hashable) -> bool:
+        seen_at = self.__seen_at.get(key)
+        return seen_at is not None and self.__clock() - seen_at < self.__window
+
+    def seen_before(self, key: Hashable) -> bool:
+        """Record the key, returning whether it was already recorded inside the window"""
+        if key in self:
+            return True
+        self.record(key)
+        return False
+
+    def record(self, key: Hashable) -> None:
+        now = self.__clock()
+        self.__expire(now)
+        self.__seen_at[key] = now
+        self.__seen_at.move_to_end(key)
+        if len(self.__seen_at) > self.__capacity:
+            self.__seen_at.popitem(last=False)
+
+    def clear(self) -> None:
+        self.__seen_at.clear()
+
+    def __expire(self, now: float) -> None:
+        while self.__seen_at:
+            oldest_key, seen_at = next(iter(self.__seen_at.items()))
+            if now - seen_at < self.__window:
+                return
+            del self.__seen_at[oldest_key]
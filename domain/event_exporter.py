@@ -0,0 +1,286 @@
+"""Module describes the exporter that streams Domain Events out of the process
+
+Two framings are supported:
+
+    JSON lines : one compact JSON object per line
+    binary     : length | timestamp | battle id kind | battle id length | event name length | battle id |
+                 event name | payload as compact JSON
+
+The battle id of a binary frame is stored as the 16 bytes of a UUID when it is one, and as UTF-8 text
+otherwise.
+
+Inside the event loop the buffer is written from a worker thread while the events keep being serialized
+into a second buffer, and ``run_flush_timer`` writes what is left once the events stop coming.
+"""
+import json
+import socket
+import struct
+import uuid
+from abc import ABCMeta, abstractmethod
+from dataclasses import fields
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from time import monotonic
+from typing import Any, Callable, Iterable, Iterator
+
+from anyio import Lock, sleep, to_thread
+
+from domain import DomainEvent
+
+_FRAME_LENGTH = struct.Struct("<I")
+_FRAME_HEADER = struct.Struct("<dBHH")
+_MAX_FIELD_BYTES = (1 << 16) - 1
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
+
+class EventFramingEnum(str, Enum):
+    """Enum that defines how the exported events are framed"""
+
+    JSON_LINES = "json_lines"
+    BINARY = "binary"
+
+
+class EventSink(metaclass=ABCMeta):
+    """Interface that defines where the exported events are written"""
+
+    @abstractmethod
+    def write(self, data: memoryview) -> None:
+        """Write a chunk of serialized events"""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release the resources of the sink"""
+
+
+class FileEventSink(EventSink):
+    """Sink that appends the exported events to a local file"""
+
+    def __init__(self, path: str | Path) -> None:
+        self.__file = Path(path).open("ab")
+
+    def write(self, data: memoryview) -> None:
+        self.__file.write(data)
+        self.__file.flush()
+
+    def close(self) -> None:
+        self.__file.close()
+
+
+class SocketEventSink(EventSink):
+    """Sink that streams the exported events through a connected socket"""
+
+    def __init__(self, connected_socket: socket.socket) -> None:
+        self.__socket = connected_socket
+
+    def write(self, data: memoryview) -> None:
+        self.__socket.sendall(data)
+
+    def close(self) -> None:
+        self.__socket.close()
+
+
+_payload_field_names: dict[type, tuple[str, ...]] = {}
+
+
+def payload_as_dict(payload: DomainEvent.Payload) -> dict[str, Any]:
+    """Returns the fields of a typed payload, or every attribute of an open one"""
+    if hasattr(payload, "__dict__"):
+        return dict(vars(payload))
+    try:
+        field_names = _payload_field_names[payload.__class__]
+    except KeyError:
+        field_names = _payload_field_names[payload.__class__] = tuple(field.name for field in fields(payload))
+    return {field_name: getattr(payload, field_name) for field_name in field_names}
+
+
+class _BattleIdKindEnum(int, Enum):
+    """Enum that defines how the battle id of a binary frame is encoded"""
+
+    EMPTY = 0
+    UUID = 1
+    TEXT = 2
+
+
+@lru_cache(maxsize=4096)
+def _encode_battle_id(battle_id: str) -> tuple[_BattleIdKindEnum, bytes]:
+    if not battle_id:
+        return _BattleIdKindEnum.EMPTY, b""
+    try:
+        battle_uuid = uuid.UUID(battle_id)
+    except ValueError:
+        return _BattleIdKindEnum.TEXT, _encoded_field(battle_id, "Battle id")
+    if str(battle_uuid) != battle_id:
+        return _BattleIdKindEnum.TEXT, _encoded_field(battle_id, "Battle id")
+    return _BattleIdKindEnum.UUID, battle_uuid.bytes
+
+
+def _decode_battle_id(kind: int, raw_battle_id: bytes) -> str:
+    if kind == _BattleIdKindEnum.UUID:
+        return str(uuid.UUID(bytes=raw_battle_id))
+    return raw_battle_id.decode()
+
+
+def _encoded_field(text: str, field_name: str) -> bytes:
+    encoded_text = text.encode()
+    if len(encoded_text) > _MAX_FIELD_BYTES:
+        raise ValueError(f"{field_name} is longer than {_MAX_FIELD_BYTES} bytes: {text[:32]}...")
+    return encoded_text
+
+
+class EventExporter:
+    """Serializes Domain Events into a reusable buffer and writes them in bulk to a sink
+
+    The buffer is written when it reaches ``max_buffer_bytes`` or when ``max_interval`` seconds have
+    passed since the last write, whichever happens first. Two buffers of ``max_buffer_bytes`` are
+    allocated once and take turns: ``flush_async`` writes one from a worker thread while the events are
+    serialized into the other. The synchronous ``flush`` and ``close`` refuse to run during such a write,
+    use ``aclose`` inside the event loop instead.
+    """
+
+    def __init__(
+        self,
+        sink: EventSink,
+        framing: EventFramingEnum = EventFramingEnum.JSON_LINES,
+        max_buffer_bytes: int = 64 * 1024,
+        max_interval: float = 1.0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.__sink = sink
+        self.__max_buffer_bytes = max_buffer_bytes
+        self.__max_interval = max_interval
+        self.__clock = clock
+        self.__buffer = bytearray(max_buffer_bytes)
+        self.__spare_buffer = bytearray(max_buffer_bytes)
+        self.__buffer_length = 0
+        self.__last_flush = clock()
+        self.__serialize = (
+            self.__serialize_json_line if framing is EventFramingEnum.JSON_LINES else self.__serialize_binary
+        )
+        self.__exported_events = 0
+        self.__write_lock = Lock()
+
+    @property
+    def exported_events(self) -> int:
+        return self.__exported_events
+
+    def __enter__(self) -> "EventExporter":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def export(self, event: DomainEvent) -> None:
+        self.__serialize(event)
+        self.__exported_events += 1
+        if self.__is_flush_due():
+            self.flush()
+
+    async def export_async(self, event: DomainEvent) -> None:
+        """Export an event from the event loop, writing the buffer from a worker thread when it is due"""
+        self.__serialize(event)
+        self.__exported_events += 1
+        if self.__is_flush_due():
+            await self.flush_async()
+
+    def export_many(self, events: Iterable[DomainEvent]) -> None:
+        for event in events:
+            self.export(event)
+
+    def flush(self) -> None:
+        if self.__write_lock.locked():
+            raise RuntimeError("Cannot flush synchronously while the buffer is being written from a thread.")
+        if self.__buffer_length:
+            with memoryview(self.__buffer) as buffer_view, buffer_view[: self.__buffer_length] as data:
+                self.__sink.write(data)
+            self.__buffer_length = 0
+        self.__last_flush = self.__clock()
+
+    async def flush_async(self) -> None:
+        """Write the buffer from a worker thread, one write at a time so the events keep their order"""
+        async with self.__write_lock:
+            full_buffer, full_length = self.__buffer, self.__buffer_length
+            self.__buffer, self.__spare_buffer = self.__spare_buffer, full_buffer
+            self.__buffer_length = 0
+            self.__last_flush = self.__clock()
+            if full_length:
+                with memoryview(full_buffer) as buffer_view, buffer_view[:full_length] as data:
+                    await to_thread.run_sync(self.__sink.write, data)
+
+    async def run_flush_timer(self) -> None:
+        """Flush the buffer once ``max_interval`` seconds passed since the last write, until cancelled"""
+        while True:
+            await sleep(max(self.__last_flush + self.__max_interval - self.__clock(), 0.0))
+            if self.__clock() - self.__last_flush >= self.__max_interval:
+                await self.flush_async()
+
+    def close(self) -> None:
+        self.flush()
+        self.__sink.close()
+
+    async def aclose(self) -> None:
+        """Write what is left once the write in flight is done, then close the sink"""
+        await self.flush_async()
+        self.__sink.close()
+
+    def __is_flush_due(self) -> bool:
+        return (
+            self.__buffer_length >= self.__max_buffer_bytes or self.__clock() - self.__last_flush >= self.__max_interval
+        )
+
+    def __reserve(self, size: int) -> int:
+        """Reserve the given bytes after the content of the buffer, growing it only when they do not fit"""
+        offset = self.__buffer_length
+        self.__buffer_length += size
+        if self.__buffer_length > len(self.__buffer):
+            self.__buffer.extend(bytes(self.__buffer_length - len(self.__buffer)))
+        return offset
+
+    def __serialize_json_line(self, event: DomainEvent) -> None:
+        payload = payload_as_dict(event.payload)
+        line = {
+            "event_name": event.event_name,
+            "timestamp": event.timestamp,
+            "battle_id": payload.get("battle_id", ""),
+            "payload": payload,
+        }
+        encoded_line = _encode_json(line).encode()
+        offset = self.__reserve(len(encoded_line) + 1)
+        self.__buffer[offset : offset + len(encoded_line)] = encoded_line
+        self.__buffer[offset + len(encoded_line)] = 0x0A
+
+    def __serialize_binary(self, event: DomainEvent) -> None:
+        payload = payload_as_dict(event.payload)
+        battle_id_kind, battle_id = _encode_battle_id(str(payload.get("battle_id", "")))
+        event_name = _encoded_field(event.event_name, "Event name")
+        encoded_payload = _encode_json(payload).encode()
+        frame_length = _FRAME_HEADER.size + len(battle_id) + len(event_name) + len(encoded_payload)
+        offset = self.__reserve(_FRAME_LENGTH.size + frame_length)
+        _FRAME_LENGTH.pack_into(self.__buffer, offset, frame_length)
+        offset += _FRAME_LENGTH.size
+        _FRAME_HEADER.pack_into(self.__buffer, offset, event.timestamp, battle_id_kind, len(battle_id), len(event_name))
+        offset += _FRAME_HEADER.size
+        for encoded_field in (battle_id, event_name, encoded_payload):
+            self.__buffer[offset : offset + len(encoded_field)] = encoded_field
+            offset += len(encoded_field)
+
+
+def decode_binary_frames(data: bytes | memoryview) -> Iterator[dict[str, Any]]:
+    """Decode the events of a stream written with the binary framing"""
+    data_view = memoryview(data)
+    offset = 0
+    while offset < len(data_view):
+        (frame_length,) = _FRAME_LENGTH.unpack_from(data_view, offset)
+        offset += _FRAME_LENGTH.size
+        timestamp, battle_id_kind, battle_id_length, event_name_length = _FRAME_HEADER.unpack_from(data_view, offset)
+        event_name_start = offset + _FRAME_HEADER.size + battle_id_length
+        payload_start = event_name_start + event_name_length
+        yield {
+            "event_name": bytes(data_view[event_name_start:payload_start]).decode(),
+            "timestamp": timestamp,
+            "battle_id": _decode_battle_id(
+                battle_id_kind, bytes(data_view[offset + _FRAME_HEADER.size : event_name_start])
+            ),
+            "payload": json.loads(bytes(data_view[payload_start : offset + frame_length])),
+        }
+        offset += frame_length
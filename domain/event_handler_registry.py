@@ -0,0 +1,41 @@
+"""Module describes the registry that maps Domain Events to the Event Handlers that consume them"""
+from types import MappingProxyType
+from typing import Iterator, Mapping, Type
+
+from domain import DomainEvent, EventHandler
+
+HandlerClasses = tuple[Type[EventHandler], ...]
+
+
+class DispatchTable(Mapping[Type[DomainEvent], HandlerClasses]):
+    """Immutable table with the Event Handler classes of each Domain Event type"""
+
+    def __init__(self, entries: Mapping[Type[DomainEvent], HandlerClasses]) -> None:
+        self.__entries = MappingProxyType(dict(entries))
+
+    def handlers_for(self, event_type: Type[DomainEvent]) -> HandlerClasses:
+        return self.__entries.get(event_type, ())
+
+    def __getitem__(self, event_type: Type[DomainEvent]) -> HandlerClasses:
+        return self.__entries[event_type]
+
+    def __iter__(self) -> Iterator[Type[DomainEvent]]:
+        return iter(self.__entries)
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+
+class EventHandlerRegistry:
+    """Declares, once at startup, which Event Handlers consume each Domain Event type"""
+
+    def __init__(self) -> None:
+        self.__handlers: dict[Type[DomainEvent], list[Type[EventHandler]]] = {}
+
+    def register(self, event_type: Type[DomainEvent], *handler_classes: Type[EventHandler]) -> "EventHandlerRegistry":
+        event_handlers = self.__handlers.setdefault(event_type, [])
+        event_handlers.extend(handler for handler in handler_classes if handler not in event_handlers)
+        return self
+
+    def compile(self) -> DispatchTable:
+        return DispatchTable({event_type: tuple(handlers) for event_type, handlers in self.__handlers.items()})
@@ -0,0 +1,131 @@
+"""Module describes the local transport that fans the Domain Events of many worker processes into one
+
+Workers publish through a ``ForwardingEventDispatcher``, which sends the events in batches through a
+bounded multiprocessing queue, and a single ``EventAggregator`` process runs the Event Handlers.
+A full queue blocks the workers until the aggregator catches up, so no broker is needed.
+"""
+import multiprocessing
+from multiprocessing.context import BaseContext
+from typing import Sequence
+
+from anyio import Lock, to_thread
+
+from domain import DomainEvent, EventDispatcher
+from domain.battle_event_dispatcher import BattleEventDispatcher
+from domain.event_dedup_index import EventDedupIndex
+from domain.instrumentation import DISABLED_INSTRUMENTATION, Instrumentation
+
+
+class EventTransport:
+    """Bounded queue of event batches shared by the worker processes and the aggregator"""
+
+    def __init__(self, max_batches: int = 64, context: BaseContext | None = None) -> None:
+        if max_batches < 1:
+            raise ValueError("The transport should hold at least one batch.")
+        self.__queue = (context or multiprocessing.get_context()).Queue(max_batches)
+
+    def send(self, events: Sequence[DomainEvent], timeout: float | None = None) -> None:
+        """Send a batch of events, blocking while the queue is full; raises ``queue.Full`` on timeout"""
+        self.__queue.put(list(events), timeout=timeout)
+
+    def close_worker(self, timeout: float | None = None) -> None:
+        """Tell the aggregator that a worker will send no more events"""
+        self.__queue.put(None, timeout=timeout)
+
+    def receive(self, timeout: float | None = None) -> list[DomainEvent] | None:
+        """Receive the next batch of events, or None when a worker closed"""
+        batch: list[DomainEvent] | None = self.__queue.get(timeout=timeout)
+        return batch
+
+
+class ForwardingEventDispatcher(BattleEventDispatcher):
+    """Event Dispatcher of a worker process, which forwards the events to the aggregator instead of handling them"""
+
+    def __init__(
+        self,
+        transport: EventTransport,
+        batch_size: int = 64,
+        send_timeout: float | None = None,
+        instrumentation: Instrumentation = DISABLED_INSTRUMENTATION,
+        dedup_index: EventDedupIndex | None = None,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("Batches should hold at least one event.")
+        super().__init__(instrumentation=instrumentation, dedup_index=dedup_index)
+        self.__transport = transport
+        self.__batch_size = batch_size
+        self.__send_timeout = send_timeout
+        self.__outgoing_events: list[DomainEvent] = []
+        self.__forwarded_events = 0
+        self.__flush_lock = Lock()
+
+    @property
+    def forwarded_events(self) -> int:
+        return self.__forwarded_events
+
+    @property
+    def outgoing_events(self) -> int:
+        """Number of events waiting to be sent"""
+        return len(self.__outgoing_events)
+
+    async def _dispatch(self, event: DomainEvent) -> None:
+        self.__outgoing_events.append(event)
+
+    async def _notify_first(self, event: DomainEvent) -> None:
+        await super()._notify_first(event)
+        await self.flush()
+
+    async def _drain(self) -> None:
+        await super()._drain()
+        await self.flush()
+
+    async def _drain_battle(self, battle_id: str) -> None:
+        await super()._drain_battle(battle_id)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Send the outgoing events in batches of ``batch_size``, waiting in a thread while the transport is full
+
+        A batch leaves the outgoing events only once it was sent, so the events a timeout left behind are
+        sent by the next flush.
+        """
+        async with self.__flush_lock:
+            while self.__outgoing_events:
+                batch = self.__outgoing_events[: self.__batch_size]
+                await to_thread.run_sync(self.__transport.send, batch, self.__send_timeout)
+                del self.__outgoing_events[: len(batch)]
+                self.__forwarded_events += len(batch)
+                for event in batch:
+                    self._delivered(event)
+
+    async def close(self) -> None:
+        """Send the pending events and tell the aggregator this worker is done"""
+        await self.flush()
+        await to_thread.run_sync(self.__transport.close_worker, self.__send_timeout)
+
+
+class EventAggregator:
+    """Receives the event batches of every worker and delivers them through a local Event Dispatcher"""
+
+    def __init__(self, transport: EventTransport, event_dispatcher: EventDispatcher, workers: int) -> None:
+        self.__transport = transport
+        self.__event_dispatcher = event_dispatcher
+        self.__workers = workers
+        self.__received_events = 0
+
+    @property
+    def received_events(self) -> int:
+        return self.__received_events
+
+    async def run(self, receive_timeout: float | None = None) -> None:
+        """Deliver the received batches until every worker closed; raises ``queue.Empty`` on timeout"""
+        open_workers = self.__workers
+        while open_workers:
+            batch = await to_thread.run_sync(self.__transport.receive, receive_timeout)
+            if batch is None:
+                open_workers -= 1
+                continue
+            self.__received_events += len(batch)
+            for event in batch:
+                self.__event_dispatcher.publish(event)
+            await self.__event_dispatcher.notify_all()
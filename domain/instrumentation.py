@@ -0,0 +1,193 @@
+"""Module describes the opt-in latency instrumentation of the Battle and of the Event Dispatcher"""
+from contextlib import AbstractContextManager, nullcontext
+from time import perf_counter_ns
+from types import TracebackType
+
+_NANOSECONDS_PER_SECOND = 1_000_000_000
+DEFAULT_EXPORT_BUCKETS = (0.000001, 0.00001, 0.0001, 0.001, 0.01, 0.1, 1.0, 10.0)
+
+
+class LatencyHistogram:
+    """HDR-style histogram of latencies in nanoseconds
+
+    Values below ``2 ** precision_bits`` get one bucket each; above that every power of two is split
+    in ``2 ** (precision_bits - 1)`` buckets, so the relative error stays bounded at any magnitude.
+    """
+
+    def __init__(self, precision_bits: int = 5) -> None:
+        if precision_bits < 1:
+            raise ValueError("Histogram precision should be at least one bit.")
+        self.__precision_bits = precision_bits
+        self.__linear_buckets = 1 << precision_bits
+        self.__sub_buckets = 1 << (precision_bits - 1)
+        self.__counts: dict[int, int] = {}
+        self.__count = 0
+        self.__total = 0
+        self.__min = 0
+        self.__max = 0
+
+    @property
+    def count(self) -> int:
+        return self.__count
+
+    @property
+    def total(self) -> int:
+        return self.__total
+
+    def record(self, value: int) -> None:
+        value = max(value, 0)
+        bucket = self.__bucket_index(value)
+        self.__counts[bucket] = self.__counts.get(bucket, 0) + 1
+        if self.__count == 0 or value < self.__min:
+            self.__min = value
+        self.__max = max(self.__max, value)
+        self.__count += 1
+        self.__total += value
+
+    def percentile(self, percentile: float) -> int:
+        """Returns the upper bound of the bucket that holds the given percentile"""
+        if self.__count == 0:
+            return 0
+        rank = max(1, round(self.__count * percentile / 100))
+        seen = 0
+        for bucket in sorted(self.__counts):
+            seen += self.__counts[bucket]
+            if seen >= rank:
+                return min(self.__bucket_upper_bound(bucket), self.__max)
+        return self.__max
+
+    def cumulative_buckets(self) -> list[tuple[int, int]]:
+        """Returns the upper bound and the cumulative count of every non empty bucket"""
+        cumulative = 0
+        buckets = []
+        for bucket in sorted(self.__counts):
+            cumulative += self.__counts[bucket]
+            buckets.append((self.__bucket_upper_bound(bucket), cumulative))
+        return buckets
+
+    def count_at_most(self, upper_bound: int) -> int:
+        """Returns the count of the buckets whose upper bound does not exceed the given one
+
+        The values inside a bucket are not kept, so the bucket that straddles the given bound is left out
+        and the result is a lower bound of the count of values at most that bound. It misses at most the
+        values of that bucket, which spans less than ``1 / 2 ** (precision_bits - 1)`` of the bound.
+        """
+        return sum(
+            bucket_count
+            for bucket, bucket_count in self.__counts.items()
+            if self.__bucket_upper_bound(bucket) <= upper_bound
+        )
+
+    def as_dict(self) -> dict[str, int | float]:
+        return {
+            "count": self.__count,
+            "sum_ns": self.__total,
+            "min_ns": self.__min,
+            "max_ns": self.__max,
+            "mean_ns": self.__total / self.__count if self.__count else 0.0,
+            "p50_ns": self.percentile(50),
+            "p90_ns": self.percentile(90),
+            "p99_ns": self.percentile(99),
+        }
+
+    def __bucket_index(self, value: int) -> int:
+        if value < self.__linear_buckets:
+            return value
+        exponent = value.bit_length() - self.__precision_bits
+        mantissa = value >> exponent
+        return self.__linear_buckets + (exponent - 1) * self.__sub_buckets + mantissa - self.__sub_buckets
+
+    def __bucket_upper_bound(self, bucket: int) -> int:
+        if bucket < self.__linear_buckets:
+            return bucket
+        exponent, sub_bucket = divmod(bucket - self.__linear_buckets, self.__sub_buckets)
+        return ((self.__sub_buckets + sub_bucket + 1) << (exponent + 1)) - 1
+
+
+class _PhaseTimer:
+    """Context manager that records the time spent inside it in a histogram"""
+
+    __slots__ = ("__histogram", "__start")
+
+    def __init__(self, histogram: LatencyHistogram) -> None:
+        self.__histogram = histogram
+        self.__start = 0
+
+    def __enter__(self) -> None:
+        self.__start = perf_counter_ns()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.__histogram.record(perf_counter_ns() - self.__start)
+
+
+class Instrumentation:
+    """Aggregates the latency of each instrumented phase in its own histogram
+
+    The Prometheus export always lists the same ``export_buckets``, upper bounds in seconds, so the set of
+    ``le`` labels does not change between scrapes.
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        namespace: str = "battle",
+        precision_bits: int = 5,
+        export_buckets: tuple[float, ...] = DEFAULT_EXPORT_BUCKETS,
+    ) -> None:
+        self.__namespace = namespace
+        self.__precision_bits = precision_bits
+        self.__export_buckets = tuple(sorted(export_buckets))
+        self.__histograms: dict[str, LatencyHistogram] = {}
+
+    def measure(self, phase: str) -> AbstractContextManager[None]:
+        """Time the block of code under the given phase"""
+        return _PhaseTimer(self.histogram(phase))
+
+    def histogram(self, phase: str) -> LatencyHistogram:
+        try:
+            return self.__histograms[phase]
+        except KeyError:
+            histogram = self.__histograms[phase] = LatencyHistogram(self.__precision_bits)
+            return histogram
+
+    def as_dict(self) -> dict[str, dict[str, int | float]]:
+        return {phase: histogram.as_dict() for phase, histogram in self.__histograms.items()}
+
+    def to_prometheus(self) -> str:
+        """Export every histogram in the Prometheus text exposition format
+
+        The cumulative count of every exported bucket comes from ``LatencyHistogram.count_at_most``, so it
+        is a lower bound of the number of measurements within that bucket.
+        """
+        metric = f"{self.__namespace}_phase_duration_seconds"
+        lines = [
+            f"# HELP {metric} Time spent in each instrumented phase.",
+            f"# TYPE {metric} histogram",
+        ]
+        for phase, histogram in self.__histograms.items():
+            for upper_bound_seconds in self.__export_buckets:
+                cumulative_count = histogram.count_at_most(round(upper_bound_seconds * _NANOSECONDS_PER_SECOND))
+                lines.append(f'{metric}_bucket{{phase="{phase}",le="{upper_bound_seconds:.9g}"}} {cumulative_count}')
+            lines.append(f'{metric}_bucket{{phase="{phase}",le="+Inf"}} {histogram.count}')
+            lines.append(f'{metric}_sum{{phase="{phase}"}} {histogram.total / _NANOSECONDS_PER_SECOND:.9g}')
+            lines.append(f'{metric}_count{{phase="{phase}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+
+class _DisabledInstrumentation(Instrumentation):
+    """Instrumentation used by default, which measures nothing"""
+
+    enabled = False
+    __no_measurement: AbstractContextManager[None] = nullcontext()
+
+    def measure(self, phase: str) -> AbstractContextManager[None]:
+        return self.__no_measurement
+
+
+DISABLED_INSTRUMENTATION: Instrumentation = _DisabledInstrumentation()
@@ -1,37 +1,75 @@
 from abc import ABCMeta, abstractmethod
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Type
+from dataclasses import dataclass, fields
+from time import monotonic, time
+from typing import Callable, Type
+
+from domain.tracing import current_tracer
 
 BASIC_TYPES = int | str | bool | float
 
+_EPOCH_OFFSET = time() - monotonic()
+
+
+def epoch_timestamp() -> float:
+    """Seconds since the epoch, read from the monotonic clock anchored to the wall clock at import time"""
+    return monotonic() + _EPOCH_OFFSET
+
 
 class DomainEvent(metaclass=ABCMeta):
-    """Interface used as a marker for domain events"""
+    """Interface used as a marker for domain events
 
-    @dataclass
+    Subclasses declare the fields of their payload as a slotted ``Payload`` dataclass, which is built
+    straight from the keyword arguments; events that declare no fields keep an open payload. Including
+    a field a typed payload does not declare turns it into an open payload with the same fields.
+    """
+
+    __slots__ = ("payload", "timestamp", "__weakref__")
+
+    @dataclass(slots=True)
     class Payload:
         """Payload of the event"""
 
+    @dataclass
+    class _OpenPayload(Payload):
+        """Payload that accepts any attribute, used by events that do not declare their fields"""
+
     event_name: str
     payload: Payload
+    timestamp: float
+    _typed_payload: Callable[..., Payload] | None = None
 
     def __init_subclass__(cls) -> None:
         cls.event_name = cls.__name__
+        cls._typed_payload = None if cls.Payload is DomainEvent.Payload else cls.Payload
 
     def __init__(self, **payload: BASIC_TYPES | dict[str, BASIC_TYPES]) -> None:
-        self.payload = self.Payload()
-        self.include_payload(**payload)
-        self.set_timestamp()
+        if self._typed_payload is not None:
+            self.payload = self._typed_payload(**payload)
+        else:
+            self.payload = self._OpenPayload()
+            self.include_payload(**payload)
+        self.timestamp = epoch_timestamp()
+
+    @property
+    def idempotency_key(self) -> str | None:
+        """Deterministic key shared by every delivery of the same fact, None when the event has no identity"""
+        return None
 
     def include_payload(self, **payload: BASIC_TYPES | dict[str, BASIC_TYPES]) -> None:
         """Set the payload of the event"""
+        if not hasattr(self.payload, "__dict__") and not payload.keys() <= {
+            field.name for field in fields(self.payload)
+        }:
+            open_payload = self._OpenPayload()
+            for field in fields(self.payload):
+                setattr(open_payload, field.name, getattr(self.payload, field.name))
+            self.payload = open_payload
         for key, value in payload.items():
             setattr(self.payload, key, value)
 
     def set_timestamp(self) -> None:
         """Set the timestamp of the event"""
-        self.timestamp = datetime.now().timestamp()
+        self.timestamp = epoch_timestamp()
 
 
 class EventHandler(metaclass=ABCMeta):
@@ -48,6 +86,16 @@ class EventHandler(metaclass=ABCMeta):
     async def handle(self) -> None:
         """Handle the event"""
 
+    async def _handle_traced(self) -> None:
+        """Handle the event inside a tracing span of the current Tracer"""
+        with current_tracer().span(
+            "event.handle",
+            event_name=self.event.event_name,
+            handler=self.__class__.__name__,
+            battle_id=str(getattr(self.event.payload, "battle_id", "")),
+        ):
+            await self.handle()
+
 
 class EventMediator(EventHandler, metaclass=ABCMeta):
     """Interface used as a marker for event mediators"""
@@ -84,6 +132,10 @@ class EventDispatcher(metaclass=ABCMeta):
     def register(self, event_mediator: EventMediator) -> None:
         """Register an Event Handler to an Event"""
 
+    @abstractmethod
+    def publish(self, event: DomainEvent) -> None:
+        """Queue an Event to be delivered to the Event Handlers of its dispatch table"""
+
     @abstractmethod
     def unregister(self, event: DomainEvent, event_handler: Type[EventHandler]) -> None:
         """Unregister an Event Handler to an Event"""
@@ -92,6 +144,10 @@ class EventDispatcher(metaclass=ABCMeta):
     def unregister_all(self) -> None:
         """Unregister all Events"""
 
+    @abstractmethod
+    def teardown(self, battle_id: "IEntityID | str") -> None:
+        """Forget every pending and dispatched Event of a finished Battle"""
+
     @abstractmethod
     async def notify(self, event: DomainEvent) -> None:
         """Notify Event Handlers bounded to the Event"""
@@ -100,6 +156,10 @@ class EventDispatcher(metaclass=ABCMeta):
     async def notify_all(self) -> None:
         """Notify all Event Handlers not matter the triggered Event"""
 
+    @abstractmethod
+    async def notify_battle(self, battle_id: "IEntityID | str") -> None:
+        """Notify the Event Handlers of the queued Events of one Battle only"""
+
     @abstractmethod
     def _pop_event(self, event_index: int) -> EventMediator:
         """Unregister an entire Event"""
@@ -151,6 +211,16 @@ class AggregateRoot(Entity, metaclass=ABCMeta):
         super().__init__(entity_id)
         self._event_dispatcher = event_dispatcher
 
+    def __getstate__(self) -> dict[str, object]:
+        """The Event Dispatcher belongs to the running process, so it is left out of snapshots"""
+        state = self.__dict__.copy()
+        state.pop("_event_dispatcher", None)
+        return state
+
+    def _bind_event_dispatcher(self, event_dispatcher: EventDispatcher) -> None:
+        """Bind the Event Dispatcher of the running process to an Aggregate restored from a snapshot"""
+        self._event_dispatcher = event_dispatcher
+
 
 class DomainService(metaclass=ABCMeta):
     """Interface used as a marker for domain services"""
@@ -0,0 +1,212 @@
+"""Module describes the Event Bus shared by many Battles, with a queue of events per Battle"""
+from collections import Counter, deque
+from typing import Type
+
+from anyio import create_task_group
+from anyio.abc import TaskGroup
+
+from domain import DomainEvent, IEntityID
+from domain.battle.events import BATTLE_EVENT_HANDLERS
+from domain.battle_event_dispatcher import BattleEventDispatcher, EventRetentionEnum
+from domain.clock import Clock
+from domain.event_dedup_index import EventDedupIndex
+from domain.event_exporter import EventExporter
+from domain.event_handler_registry import DispatchTable
+from domain.instrumentation import DISABLED_INSTRUMENTATION, Instrumentation
+from domain.tracing import Tracer
+
+
+def partition_key(event: DomainEvent) -> str:
+    """Events are partitioned by the id of their Battle; events outside a Battle share one partition"""
+    return str(getattr(event.payload, "battle_id", ""))
+
+
+class PartitionedEventBus(BattleEventDispatcher):
+    """Event Dispatcher shared by many Battles
+
+    Every Battle gets its own queue, and the Battles with queued events wait their turn in a round-robin.
+    A bounded pool of ``workers`` tasks takes the next Battle, delivers up to ``quantum`` of its events in
+    order and puts it back at the end of the round-robin, so a burst of events or a slow Event Handler in
+    one Battle only holds one worker. A Battle is served by one worker at a time, which keeps its events
+    in order. When an Event Handler fails, the undelivered events go back to the front of their queue and
+    only that Battle leaves the round-robin until the next drain, which then raises the failures.
+    """
+
+    def __init__(
+        self,
+        instrumentation: Instrumentation = DISABLED_INSTRUMENTATION,
+        tracer: Tracer | None = None,
+        exporter: EventExporter | None = None,
+        dispatch_table: DispatchTable = BATTLE_EVENT_HANDLERS,
+        dedup_index: EventDedupIndex | None = None,
+        clock: Clock | None = None,
+        retention: EventRetentionEnum = EventRetentionEnum.STRONG,
+        quantum: int = 1,
+        workers: int = 8,
+    ) -> None:
+        if quantum < 1:
+            raise ValueError("Every round should deliver at least one event of each partition.")
+        if workers < 1:
+            raise ValueError("The partitions should be drained by at least one worker.")
+        super().__init__(instrumentation, tracer, exporter, dispatch_table, dedup_index, clock, retention)
+        self.__quantum = quantum
+        self.__workers = workers
+        self.__partitions: dict[str, deque[DomainEvent]] = {}
+        self.__ready_partitions: deque[str] = deque()
+        self.__scheduled_partitions: set[str] = set()
+        self.__failed_partitions: set[str] = set()
+        self.__delivery_errors: dict[str, Exception] = {}
+        self.__running_workers = 0
+        self.__pending_event_names: Counter[str] = Counter()
+        self.__task_group: TaskGroup | None = None
+
+    @property
+    def partitions(self) -> int:
+        """Number of Battles with queued events"""
+        return len(self.__partitions)
+
+    def pending(self, battle_id: IEntityID | str) -> int:
+        """Number of queued events of a Battle"""
+        return len(self.__partitions.get(str(battle_id), ()))
+
+    def has(self, event: Type[DomainEvent]) -> bool:
+        return self.__pending_event_names[event.event_name] > 0 or super().has(event)
+
+    def publish(self, event: DomainEvent) -> None:
+        if self._is_duplicated(event):
+            return
+        key = partition_key(event)
+        partition = self.__partitions.get(key)
+        if partition is None:
+            partition = self.__partitions[key] = deque()
+            self.__schedule(key)
+        partition.append(event)
+        self.__pending_event_names[event.event_name] += 1
+        if self.__task_group is not None and self.__running_workers < self.__workers:
+            self.__start_worker(self.__task_group)
+
+    def unregister_all(self) -> None:
+        super().unregister_all()
+        self.__partitions.clear()
+        self.__pending_event_names.clear()
+
+    def teardown(self, battle_id: IEntityID | str) -> None:
+        super().teardown(battle_id)
+        key = str(battle_id)
+        if partition := self.__partitions.get(key):
+            self.__pending_event_names.subtract(event.event_name for event in partition)
+            del self.__partitions[key]
+
+    async def _notify_first(self, event: DomainEvent) -> None:
+        key = partition_key(event)
+        partition = self.__partitions.get(key, deque())
+        queued_event = next((queued for queued in partition if queued.event_name == event.event_name), None)
+        if queued_event is None:
+            await super()._notify_first(event)
+            return
+        partition.remove(queued_event)
+        if not partition:
+            del self.__partitions[key]
+        self.__pending_event_names[queued_event.event_name] -= 1
+        self._mark_dispatched(queued_event)
+        await self._dispatch(queued_event)
+
+    async def _drain(self) -> None:
+        """Deliver the queued events round-robin with the pool of workers, until every partition is empty"""
+        await super()._drain()
+        outer_task_group = self.__task_group
+        try:
+            async with create_task_group() as task_group:
+                self.__task_group = task_group
+                for _ in range(min(self.__workers - self.__running_workers, len(self.__ready_partitions))):
+                    self.__start_worker(task_group)
+        finally:
+            self.__task_group = outer_task_group
+        if outer_task_group is not None or not self.__failed_partitions:
+            return
+        delivery_errors = [self.__release_failed(key) for key in list(self.__failed_partitions)]
+        raise ExceptionGroup("Some partitions failed to deliver their events", delivery_errors)
+
+    async def _drain_battle(self, battle_id: str) -> None:
+        """Deliver the queued events of one partition in order, unless a worker of a drain is serving it"""
+        await super()._drain_battle(battle_id)
+        while battle_id in self.__ready_partitions:
+            self.__ready_partitions.remove(battle_id)
+            if not self.__partitions.get(battle_id):
+                self.__scheduled_partitions.discard(battle_id)
+                self.__partitions.pop(battle_id, None)
+                break
+            await self.__serve_quantum(battle_id)
+        if self.__task_group is None and battle_id in self.__failed_partitions:
+            raise ExceptionGroup("The partition failed to deliver its events", [self.__release_failed(battle_id)])
+
+    def __release_failed(self, key: str) -> Exception:
+        """Put a failed partition back in the round-robin for the next drain, returning its failure"""
+        self.__failed_partitions.discard(key)
+        self.__scheduled_partitions.discard(key)
+        if self.__partitions.get(key):
+            self.__schedule(key)
+        else:
+            self.__partitions.pop(key, None)
+        return self.__delivery_errors.pop(key)
+
+    def __schedule(self, key: str) -> None:
+        """Put the partition at the end of the round-robin, unless it is already waiting or being served"""
+        if key not in self.__scheduled_partitions:
+            self.__scheduled_partitions.add(key)
+            self.__ready_partitions.append(key)
+
+    def __start_worker(self, task_group: TaskGroup) -> None:
+        self.__running_workers += 1
+        task_group.start_soon(self.__serve_partitions)
+
+    async def __serve_partitions(self) -> None:
+        """Serve the partitions of the round-robin, ``quantum`` events at a time, until none is ready"""
+        try:
+            while self.__ready_partitions:
+                key = self.__ready_partitions.popleft()
+                if not self.__partitions.get(key):
+                    self.__scheduled_partitions.discard(key)
+                    self.__partitions.pop(key, None)
+                    continue
+                await self.__serve_quantum(key)
+        finally:
+            self.__running_workers -= 1
+
+    async def __serve_quantum(self, key: str) -> None:
+        """Deliver up to ``quantum`` events of the partition in order, putting back those left undelivered"""
+        partition = self.__partitions[key]
+        events = [partition.popleft() for _ in range(min(self.__quantum, len(partition)))]
+        self.__pending_event_names.subtract(event.event_name for event in events)
+        delivered = 0
+        try:
+            for event in events:
+                await self._dispatch(event)
+                self._mark_dispatched(event)
+                delivered += 1
+        except BaseException as error:
+            self.__requeue(key, events[delivered:])
+            if not isinstance(error, Exception):
+                raise
+            self.__failed_partitions.add(key)
+            self.__delivery_errors[key] = error
+            return
+        finally:
+            if key not in self.__failed_partitions:
+                self.__scheduled_partitions.discard(key)
+                if self.__partitions.get(key):
+                    self.__schedule(key)
+                else:
+                    self.__partitions.pop(key, None)
+
+    def __requeue(self, key: str, events: list[DomainEvent]) -> None:
+        """Put the undelivered events back at the front of their partition, the failed one included"""
+        partition = self.__partitions.get(key)
+        if partition is None:
+            return
+        failed_event, *next_events = events
+        self._delivery_failed(failed_event)
+        if not self._is_duplicated(failed_event):
+            next_events.insert(0, failed_event)
+        partition.extendleft(reversed(next_events))
+        self.__pending_event_names.update(event.event_name for event in next_events)
@@ -1,4 +1,5 @@
 from .interfaces import (
+    ElementEnum,
     IActive,
     IAttackable,
     ICooldownSkill,
@@ -7,9 +8,12 @@ from .interfaces import (
     IPassiveCooldown,
     IPhysicalAttack,
     ISkill,
+    PassiveEffectEnum,
+    PassiveTriggerEnum,
 )
 
 __all__ = [
+    "ElementEnum",
     "ISkill",
     "ICooldownSkill",
     "IActive",
@@ -18,4 +22,6 @@ __all__ = [
     "IPhysicalAttack",
     "IPassive",
     "IPassiveCooldown",
+    "PassiveEffectEnum",
+    "PassiveTriggerEnum",
 ]
@@ -2,6 +2,7 @@
 from typing import Callable
 
 from domain import Entity, IEntityID
+from domain.skill import ElementEnum
 
 from .interfaces import ICombatTechnique, ICombatTechniqueFactory, ICombatTechniqueProfileBuilder
 from .value_objects import CombatTechniqueProfile
@@ -30,6 +31,14 @@ class CombatTechnique(Entity, ICombatTechniqueFactory, ICombatTechnique):
     def name(self) -> str:
         return self.__name
 
+    @property
+    def cooldown(self) -> int:
+        return self.__combat_technique_profile.cooldown
+
+    @property
+    def loading_time(self) -> int:
+        return self.__combat_technique_profile.loading_time
+
     @property
     def is_ready(self) -> bool:
         return self.__combat_technique_profile.is_ready
@@ -38,6 +47,14 @@ class CombatTechnique(Entity, ICombatTechniqueFactory, ICombatTechnique):
     def damage(self) -> int:
         return self.__combat_technique_profile.damage
 
+    @property
+    def max_targets(self) -> int | None:
+        return self.__combat_technique_profile.max_targets
+
+    @property
+    def element(self) -> ElementEnum:
+        return self.__combat_technique_profile.element
+
     @property
     def cost(self) -> int:
         return self.__combat_technique_profile.stamina_cost
@@ -64,12 +81,16 @@ class _SpellProfileBuilder(ICombatTechniqueProfileBuilder):
         damage: int,
         cooldown: int,
         loading_time: int = 0,
+        max_targets: int | None = 1,
+        element: ElementEnum = ElementEnum.NEUTRAL,
     ) -> ICombatTechnique:
         spell_profile = CombatTechniqueProfile(
             stamina_cost=stamina_cost,
             damage=damage,
             cooldown=cooldown,
             loading_time=loading_time,
+            max_targets=max_targets,
+            element=element,
         )
         self.__func_set_spell_profile(spell_profile)
         return self.__spell_obj
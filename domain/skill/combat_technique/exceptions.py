@@ -20,3 +20,7 @@ class InvalidManaCostRange(RuntimeError):
 
 class InvalidDamageRange(RuntimeError):
     """Error indicates that the damage range is invalid (less than zero or greater than 100)"""
+
+
+class InvalidMaxTargetsRange(RuntimeError):
+    """Error indicates that the maximum number of targets is less than one"""
@@ -1,6 +1,7 @@
 from copy import copy
 
 from domain.interfaces import ValueObject
+from domain.skill import ElementEnum
 
 from .exceptions import (
     CombatTechniqueIsAlreadyReady,
@@ -9,13 +10,22 @@ from .exceptions import (
     InvalidDamageRange,
     InvalidLoadingTimeRange,
     InvalidManaCostRange,
+    InvalidMaxTargetsRange,
 )
 
 
 class CombatTechniqueProfile(ValueObject):
     """Class that represents a value object of spell profile to the Spell"""
 
-    def __init__(self, stamina_cost: int, damage: int, cooldown: int, loading_time: int = 0) -> None:
+    def __init__(
+        self,
+        stamina_cost: int,
+        damage: int,
+        cooldown: int,
+        loading_time: int = 0,
+        max_targets: int | None = 1,
+        element: ElementEnum = ElementEnum.NEUTRAL,
+    ) -> None:
         if stamina_cost < 0 or stamina_cost > 100:
             raise InvalidManaCostRange()
         if damage < 0 or damage > 100:
@@ -24,10 +34,14 @@ class CombatTechniqueProfile(ValueObject):
             raise InvalidCooldownRange()
         if loading_time > cooldown:
             raise InvalidLoadingTimeRange()
+        if max_targets is not None and max_targets < 1:
+            raise InvalidMaxTargetsRange()
         self.__stamina_cost = stamina_cost
         self.__damage = damage
         self.__cooldown = cooldown
         self.__loading_time = loading_time
+        self.__max_targets = max_targets
+        self.__element = element
         self.__just_used = False
 
     def start_loading_time(self) -> None:
@@ -56,6 +70,18 @@ class CombatTechniqueProfile(ValueObject):
     def cooldown(self) -> int:
         return self.__cooldown
 
+    @property
+    def max_targets(self) -> int | None:
+        return self.__max_targets
+
+    @property
+    def element(self) -> ElementEnum:
+        return self.__element
+
+    @property
+    def loading_time(self) -> int:
+        return self.__loading_time
+
     @property
     def is_ready(self) -> bool:
         return self.__loading_time == 0
@@ -1,8 +1,33 @@
 from abc import ABCMeta, abstractmethod
+from enum import IntEnum
 
 from domain import IEntityID
 
 
+class ElementEnum(IntEnum):
+    """Enum that defines the elements of the attack skills and the elemental affinity of the Characters"""
+
+    NEUTRAL = 0
+    FIRE = 1
+    WATER = 2
+    EARTH = 3
+    AIR = 4
+
+
+class PassiveTriggerEnum(IntEnum):
+    """Enum that defines the events a Passive skill can be triggered by"""
+
+    ON_DAMAGE_TAKEN = 1
+    ON_ALLY_DEATH = 2
+
+
+class PassiveEffectEnum(IntEnum):
+    """Enum that defines what a Passive skill does to its Character when triggered"""
+
+    HEAL = 1
+    SHIELD = 2
+
+
 class ISkill(metaclass=ABCMeta):
     """Interface that defines the public methods for skills"""
 
@@ -22,6 +47,16 @@ class ISkill(metaclass=ABCMeta):
 class ICooldownSkill(ISkill, metaclass=ABCMeta):
     """Interface that defines the public methods for Cooldown skills"""
 
+    @property
+    @abstractmethod
+    def cooldown(self) -> int:
+        ...
+
+    @property
+    @abstractmethod
+    def loading_time(self) -> int:
+        """Turns the skill still has to rest before it is ready again"""
+
     @abstractmethod
     def rest(self) -> None:
         ...
@@ -48,6 +83,25 @@ class IPassive(ISkill, metaclass=ABCMeta):
     def deactivate(self) -> None:
         ...
 
+    @property
+    @abstractmethod
+    def trigger(self) -> PassiveTriggerEnum:
+        ...
+
+    @property
+    @abstractmethod
+    def effect(self) -> PassiveEffectEnum:
+        ...
+
+    @property
+    @abstractmethod
+    def magnitude(self) -> int:
+        ...
+
+    @abstractmethod
+    def fire(self) -> bool:
+        """Consume the trigger, returning whether the Passive was active and ready to apply its effect"""
+
 
 class IPassiveCooldown(IPassive, ICooldownSkill, metaclass=ABCMeta):
     """Interface that defines the public methods for PassiveCooldown skills"""
@@ -74,6 +128,16 @@ class IAttackable(IActive, metaclass=ABCMeta):
     def damage(self) -> int:
         ...
 
+    @property
+    @abstractmethod
+    def max_targets(self) -> int | None:
+        """Enemies hit by a single use of the skill, None when it hits every enemy (area of effect)"""
+
+    @property
+    @abstractmethod
+    def element(self) -> ElementEnum:
+        ...
+
 
 class IPhysicalAttack(IAttackable, metaclass=ABCMeta):
     """Interface that defines the public methods for PhysicalAttack skills"""
@@ -0,0 +1,9 @@
+from .entity import Passive
+from .interfaces import IPassiveFactory, IPassiveProfileBuilder, IPassiveSkill
+
+__all__ = [
+    "IPassiveSkill",
+    "IPassiveFactory",
+    "IPassiveProfileBuilder",
+    "Passive",
+]
@@ -0,0 +1,87 @@
+import pytest
+
+from domain._tests.fakes import MAXIMUS_POINTS, fake_character, fake_team
+from domain.character import Character, ICharacter
+from domain.skill import PassiveEffectEnum, PassiveTriggerEnum
+from domain.skill.passive import IPassiveSkill, Passive
+from domain.skill.passive.exceptions import InvalidMagnitudeRange, PassiveIsAlreadyReady
+from domain.value_objects import EntityID
+
+
+def fake_passive(
+    trigger: PassiveTriggerEnum, effect: PassiveEffectEnum, magnitude: int, cooldown: int = 0
+) -> IPassiveSkill:
+    return Passive.create_new(entity_id=EntityID(), name=trigger.name).specify_passive_properties(
+        trigger=trigger, effect=effect, magnitude=magnitude, cooldown=cooldown
+    )
+
+
+def fake_passive_character(name: str, *passives: IPassiveSkill) -> ICharacter:
+    return (
+        Character.create_new(entity_id=EntityID(), name=name)
+        .specify_skill_properties(life_points=MAXIMUS_POINTS, stamina_points=MAXIMUS_POINTS, mana_points=MAXIMUS_POINTS)
+        .add_skills(*passives)
+    )
+
+
+def test_passive_on_cooldown_does_not_fire_until_rested() -> None:
+    passive = fake_passive(PassiveTriggerEnum.ON_DAMAGE_TAKEN, PassiveEffectEnum.HEAL, 10, cooldown=1)
+
+    assert passive.fire()
+    assert not passive.fire()
+    passive.rest()
+    assert not passive.is_ready
+    passive.rest()
+    assert passive.is_ready
+    with pytest.raises(PassiveIsAlreadyReady):
+        passive.rest()
+
+
+def test_inactive_passive_does_not_fire() -> None:
+    passive = Passive.create_new(entity_id=EntityID(), name="Dormant").specify_passive_properties(
+        trigger=PassiveTriggerEnum.ON_DAMAGE_TAKEN, effect=PassiveEffectEnum.HEAL, magnitude=10, always_active=False
+    )
+
+    assert not passive.fire()
+    passive.activate()
+    assert passive.fire()
+
+
+def test_invalid_magnitude() -> None:
+    with pytest.raises(InvalidMagnitudeRange):
+        fake_passive(PassiveTriggerEnum.ON_DAMAGE_TAKEN, PassiveEffectEnum.HEAL, 101)
+
+
+def test_passive_fires_on_damage_taken() -> None:
+    character = fake_passive_character(
+        "Thick skin", fake_passive(PassiveTriggerEnum.ON_DAMAGE_TAKEN, PassiveEffectEnum.SHIELD, 5)
+    )
+
+    character._receive_attack(20)
+
+    assert character.current_life_points == MAXIMUS_POINTS - 20
+    assert character.current_shield_points == 5
+
+    character._receive_attack(5)
+    character._receive_attack(0)
+
+    assert character.current_life_points == MAXIMUS_POINTS - 20
+    assert character.current_shield_points == 0
+
+
+def test_only_allies_subscribed_fire_on_ally_death() -> None:
+    avenger = fake_passive_character(
+        "Avenger", fake_passive(PassiveTriggerEnum.ON_ALLY_DEATH, PassiveEffectEnum.SHIELD, 30)
+    )
+    bystander = fake_character("Bystander", 10, 1, 0)
+    fallen = fake_character("Fallen", 10, 1, 0)
+    fake_team(avenger, bystander, fallen)
+
+    assert avenger._subscribes(PassiveTriggerEnum.ON_ALLY_DEATH)
+    assert not bystander._subscribes(PassiveTriggerEnum.ON_ALLY_DEATH)
+
+    fallen._receive_attack(MAXIMUS_POINTS)
+    fallen._receive_attack(MAXIMUS_POINTS)
+
+    assert avenger.current_shield_points == 30
+    assert bystander.current_shield_points == 0
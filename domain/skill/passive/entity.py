@@ -0,0 +1,104 @@
+"""Module describes the Passive entity and its direct dependencies"""
+from typing import Callable
+
+from domain import Entity, IEntityID
+from domain.skill import PassiveEffectEnum, PassiveTriggerEnum
+
+from .interfaces import IPassiveFactory, IPassiveProfileBuilder, IPassiveSkill
+from .value_objects import PassiveProfile
+
+
+class Passive(Entity, IPassiveFactory, IPassiveSkill):
+    """Class that represents a Passive entity, a skill applied by a trigger instead of used by the Character"""
+
+    def __init__(self) -> None:
+        raise RuntimeError("Cannot instantiate directly")
+
+    def _init(self, entity_id: IEntityID, name: str) -> None:
+        super().__init__(entity_id)
+        self.__name = name
+
+    def _set_passive_profile(self, passive_profile: PassiveProfile, always_active: bool) -> None:
+        self.__passive_profile = passive_profile
+        self.__is_always_active = always_active
+        self.__is_active = always_active
+
+    @classmethod
+    def create_new(cls, *, entity_id: IEntityID, name: str) -> IPassiveProfileBuilder:
+        new_passive = cls.__new__(cls)
+        new_passive._init(entity_id, name)
+        return _PassiveProfileBuilder(new_passive, new_passive._set_passive_profile)
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def cooldown(self) -> int:
+        return self.__passive_profile.cooldown
+
+    @property
+    def loading_time(self) -> int:
+        return self.__passive_profile.loading_time
+
+    @property
+    def is_ready(self) -> bool:
+        return self.__passive_profile.is_ready
+
+    @property
+    def is_active(self) -> bool:
+        return self.__is_active
+
+    @property
+    def is_always_active(self) -> bool:
+        return self.__is_always_active
+
+    @property
+    def trigger(self) -> PassiveTriggerEnum:
+        return self.__passive_profile.trigger
+
+    @property
+    def effect(self) -> PassiveEffectEnum:
+        return self.__passive_profile.effect
+
+    @property
+    def magnitude(self) -> int:
+        return self.__passive_profile.magnitude
+
+    def activate(self) -> None:
+        self.__is_active = True
+
+    def deactivate(self) -> None:
+        if not self.__is_always_active:
+            self.__is_active = False
+
+    def fire(self) -> bool:
+        if not self.__is_active or not self.__passive_profile.is_ready:
+            return False
+        self.__passive_profile.start_loading_time()
+        return True
+
+    def rest(self) -> None:
+        self.__passive_profile.rest()
+
+
+class _PassiveProfileBuilder(IPassiveProfileBuilder):
+    def __init__(
+        self,
+        passive_obj: Passive,
+        func_set_passive_profile: Callable[[PassiveProfile, bool], None],
+    ) -> None:
+        self.__func_set_passive_profile = func_set_passive_profile
+        self.__passive_obj = passive_obj
+
+    def specify_passive_properties(
+        self,
+        trigger: PassiveTriggerEnum,
+        effect: PassiveEffectEnum,
+        magnitude: int,
+        cooldown: int = 0,
+        always_active: bool = True,
+    ) -> IPassiveSkill:
+        passive_profile = PassiveProfile(trigger=trigger, effect=effect, magnitude=magnitude, cooldown=cooldown)
+        self.__func_set_passive_profile(passive_profile, always_active)
+        return self.__passive_obj
@@ -0,0 +1,10 @@
+class PassiveIsAlreadyReady(RuntimeError):
+    """Error indicates that someone tried to load a ready-made passive"""
+
+
+class InvalidCooldownRange(RuntimeError):
+    """Error indicates past cooldown is too high, none or negative"""
+
+
+class InvalidMagnitudeRange(RuntimeError):
+    """Error indicates that the magnitude range is invalid (less than zero or greater than 100)"""
@@ -0,0 +1,31 @@
+from abc import ABCMeta, abstractmethod
+
+from domain import IEntityID
+from domain.skill import IPassiveCooldown, PassiveEffectEnum, PassiveTriggerEnum
+
+
+class IPassiveSkill(IPassiveCooldown, metaclass=ABCMeta):
+    """Interface that defines the public methods in Passive"""
+
+
+class IPassiveProfileBuilder(metaclass=ABCMeta):
+    """Interface that defines an easy way to create a Passive with its PassiveProfile"""
+
+    @abstractmethod
+    def specify_passive_properties(
+        self,
+        trigger: PassiveTriggerEnum,
+        effect: PassiveEffectEnum,
+        magnitude: int,
+        cooldown: int = 0,
+        always_active: bool = True,
+    ) -> IPassiveSkill:
+        ...
+
+
+class IPassiveFactory(metaclass=ABCMeta):
+    """Interface that define the factory methods of Passive"""
+
+    @abstractmethod
+    def create_new(self, *, entity_id: IEntityID, name: str) -> IPassiveProfileBuilder:
+        ...
@@ -0,0 +1,58 @@
+from domain.interfaces import ValueObject
+from domain.skill import PassiveEffectEnum, PassiveTriggerEnum
+
+from .exceptions import InvalidCooldownRange, InvalidMagnitudeRange, PassiveIsAlreadyReady
+
+
+class PassiveProfile(ValueObject):
+    """Class that represents a value object of passive profile to the Passive"""
+
+    def __init__(
+        self, trigger: PassiveTriggerEnum, effect: PassiveEffectEnum, magnitude: int, cooldown: int = 0
+    ) -> None:
+        if magnitude < 0 or magnitude > 100:
+            raise InvalidMagnitudeRange()
+        if cooldown < 0 or cooldown > 10:
+            raise InvalidCooldownRange()
+        self.__trigger = trigger
+        self.__effect = effect
+        self.__magnitude = magnitude
+        self.__cooldown = cooldown
+        self.__loading_time = 0
+        self.__just_used = False
+
+    def start_loading_time(self) -> None:
+        self.__loading_time = self.__cooldown
+        self.__just_used = self.__cooldown != 0
+
+    def rest(self) -> None:
+        if self.__loading_time == 0:
+            raise PassiveIsAlreadyReady()
+        if not self.__just_used:
+            self.__loading_time -= 1
+        else:
+            self.__just_used = False
+
+    @property
+    def trigger(self) -> PassiveTriggerEnum:
+        return self.__trigger
+
+    @property
+    def effect(self) -> PassiveEffectEnum:
+        return self.__effect
+
+    @property
+    def magnitude(self) -> int:
+        return self.__magnitude
+
+    @property
+    def cooldown(self) -> int:
+        return self.__cooldown
+
+    @property
+    def loading_time(self) -> int:
+        return self.__loading_time
+
+    @property
+    def is_ready(self) -> bool:
+        return self.__loading_time == 0
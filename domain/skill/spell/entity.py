@@ -2,6 +2,7 @@
 from typing import Callable
 
 from domain import Entity, IEntityID
+from domain.skill import ElementEnum
 
 from .interfaces import ISpell, ISpellFactory, ISpellProfileBuilder
 from .value_objects import SpellProfile
@@ -30,6 +31,14 @@ class Spell(Entity, ISpellFactory, ISpell):
     def name(self) -> str:
         return self.__name
 
+    @property
+    def cooldown(self) -> int:
+        return self.__spell_profile.get_cooldown
+
+    @property
+    def loading_time(self) -> int:
+        return self.__spell_profile.get_loading_time
+
     @property
     def is_ready(self) -> bool:
         return self.__spell_profile.is_ready
@@ -38,6 +47,14 @@ class Spell(Entity, ISpellFactory, ISpell):
     def damage(self) -> int:
         return self.__spell_profile.get_damage
 
+    @property
+    def max_targets(self) -> int | None:
+        return self.__spell_profile.get_max_targets
+
+    @property
+    def element(self) -> ElementEnum:
+        return self.__spell_profile.get_element
+
     @property
     def cost(self) -> int:
         return self.__spell_profile.get_mana_cost
@@ -64,12 +81,16 @@ class _SpellProfileBuilder(ISpellProfileBuilder):
         damage: int,
         cooldown: int,
         loading_time: int = 0,
+        max_targets: int | None = 1,
+        element: ElementEnum = ElementEnum.NEUTRAL,
     ) -> Spell:
         spell_profile = SpellProfile(
             mana_cost=mana_cost,
             damage=damage,
             cooldown=cooldown,
             loading_time=loading_time,
+            max_targets=max_targets,
+            element=element,
         )
         self.__func_set_spell_profile(spell_profile)
         return self.__spell_obj
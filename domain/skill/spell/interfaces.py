@@ -1,7 +1,7 @@
 from abc import ABCMeta, abstractmethod
 
 from domain import IEntityID
-from domain.skill import IMagicalAttack
+from domain.skill import ElementEnum, IMagicalAttack
 
 
 class ISpell(IMagicalAttack, metaclass=ABCMeta):
@@ -18,6 +18,8 @@ class ISpellProfileBuilder(metaclass=ABCMeta):
         damage: int,
         cooldown: int,
         loading_time: int = 0,
+        max_targets: int | None = 1,
+        element: ElementEnum = ElementEnum.NEUTRAL,
     ) -> ISpell:
         ...
 
@@ -0,0 +1,151 @@
+"""Module describes the pluggable tracing spans of the event pipeline
+
+The current Tracer and the current Span live in context variables, so spans opened by tasks started
+inside a task group are linked to the span of the code that started them, on any anyio backend.
+"""
+from abc import ABCMeta, abstractmethod
+from collections import deque
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from itertools import count
+from time import perf_counter_ns
+from typing import Iterator, NamedTuple
+
+
+class Span:
+    """A timed operation of the event pipeline"""
+
+    __slots__ = ("name", "attributes", "span_id", "parent_id", "start_ns", "end_ns")
+
+    def __init__(self, name: str, attributes: dict[str, str], span_id: int, parent_id: int | None) -> None:
+        self.name = name
+        self.attributes = attributes
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.start_ns = perf_counter_ns()
+        self.end_ns = 0
+
+    @property
+    def duration_ns(self) -> int:
+        return self.end_ns - self.start_ns
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}(name={self.name}, duration_ns={self.duration_ns}, {self.attributes})>"
+
+
+class SpanExporter(metaclass=ABCMeta):
+    """Interface that receives every finished Span"""
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """Export a finished Span"""
+
+
+class HandlerLatency(NamedTuple):
+    """Aggregated latency of an Event Handler class"""
+
+    handler: str
+    calls: int
+    mean_ns: float
+    max_ns: int
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keeps the latest finished Spans in memory and the latency of every Event Handler class
+
+    Only the last ``max_spans`` Spans are kept, while the slowest handlers report is built from running
+    aggregates of every Span exported, so the memory used stays bounded however long it runs.
+    """
+
+    def __init__(self, max_spans: int = 10_000) -> None:
+        self.__spans: deque[Span] = deque(maxlen=max_spans)
+        self.__handler_latencies: dict[str, list[int]] = {}
+
+    @property
+    def spans(self) -> tuple[Span, ...]:
+        return tuple(self.__spans)
+
+    def export(self, span: Span) -> None:
+        self.__spans.append(span)
+        if handler := span.attributes.get("handler"):
+            duration_ns = span.duration_ns
+            try:
+                handler_latency = self.__handler_latencies[handler]
+            except KeyError:
+                self.__handler_latencies[handler] = [1, duration_ns, duration_ns]
+                return
+            handler_latency[0] += 1
+            handler_latency[1] += duration_ns
+            handler_latency[2] = max(handler_latency[2], duration_ns)
+
+    def clear(self) -> None:
+        self.__spans.clear()
+        self.__handler_latencies.clear()
+
+    def slowest_handlers(self, limit: int = 10) -> list[HandlerLatency]:
+        """Returns the Event Handlers with the highest mean latency, slowest first"""
+        report = [
+            HandlerLatency(handler, calls, total_ns / calls, max_ns)
+            for handler, (calls, total_ns, max_ns) in self.__handler_latencies.items()
+        ]
+        report.sort(key=lambda handler_latency: handler_latency.mean_ns, reverse=True)
+        return report[:limit]
+
+
+_current_span_id: ContextVar[int | None] = ContextVar("current_span_id", default=None)
+
+
+class Tracer:
+    """Opens Spans linked to the current Span and hands them to the exporter once they finish"""
+
+    enabled = True
+    __span_ids = count(1)
+
+    def __init__(self, exporter: SpanExporter) -> None:
+        self.__exporter = exporter
+
+    def span(self, name: str, **attributes: str) -> AbstractContextManager[None]:
+        return self.__span(name, attributes)
+
+    @contextmanager
+    def __span(self, name: str, attributes: dict[str, str]) -> Iterator[None]:
+        span = Span(name, attributes, next(self.__span_ids), _current_span_id.get())
+        token = _current_span_id.set(span.span_id)
+        try:
+            yield
+        finally:
+            span.end_ns = perf_counter_ns()
+            _current_span_id.reset(token)
+            self.__exporter.export(span)
+
+
+class _DisabledTracer(Tracer):
+    """Tracer used by default, which opens no Span at all"""
+
+    enabled = False
+    __no_span: AbstractContextManager[None] = nullcontext()
+
+    def __init__(self) -> None:
+        ...
+
+    def span(self, name: str, **attributes: str) -> AbstractContextManager[None]:
+        return self.__no_span
+
+
+DISABLED_TRACER: Tracer = _DisabledTracer()
+
+_current_tracer: ContextVar[Tracer] = ContextVar("current_tracer", default=DISABLED_TRACER)
+
+
+def current_tracer() -> Tracer:
+    return _current_tracer.get()
+
+
+@contextmanager
+def use_tracer(tracer: Tracer) -> Iterator[Tracer]:
+    """Make the given Tracer the current one for the code and the tasks started inside the block"""
+    token = _current_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _current_tracer.reset(token)
@@ -27,10 +27,17 @@ class EntityID(IEntityID, uuid.UUID):
         else:
             super().__init__(str(uuid.uuid4()), version=4)
 
+    @classmethod
+    def from_bytes(cls, raw_bytes: bytes) -> "EntityID":
+        """Rebuilds an EntityID from the 16 bytes of its UUID representation"""
+        entity_id = cls.__new__(cls)
+        uuid.UUID.__init__(entity_id, bytes=raw_bytes)
+        return entity_id
+
     def __eq__(self, entity_id: object) -> bool:
         if not isinstance(entity_id, EntityID):
             return False
-        return self.hex == entity_id.hex
+        return self.int == entity_id.int
 
     def __mul__(self, quantidade_de_instancias: int) -> Tuple["EntityID", ...]:
         return tuple(EntityID() for _ in range(quantidade_de_instancias))
@@ -39,4 +46,4 @@ class EntityID(IEntityID, uuid.UUID):
         return tuple(EntityID() for _ in range(quantidade_de_instancias))
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        return hash(self.int)